@@ -0,0 +1,177 @@
+"""
+In-Process ASGI Load Generator
+-----------------------------
+Drives the FastAPI app through an ASGI transport, no server or network hop.
+Author: B4S1L1SK
+"""
+
+import argparse
+import asyncio
+import bisect
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# Latency bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = [0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+@dataclass
+class RouteSpec:
+    """A single entry of the request mix"""
+    name: str
+    method: str
+    path: str
+    weight: float = 1.0
+    json: Optional[Dict[str, Any]] = None
+
+@dataclass
+class LoadProfile:
+    """Shape of a load run"""
+    routes: List[RouteSpec]
+    concurrency: int = 16
+    duration: float = 10.0
+    max_requests: Optional[int] = None
+    seed: int = 0
+
+@dataclass
+class RouteStats:
+    """Per-route counters and latency histogram"""
+    name: str
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def record(self, latency_ms: float, ok: bool):
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.total_latency += latency_ms
+        self.max_latency = max(self.max_latency, latency_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Estimate a latency percentile (ms) from the bucket upper bounds"""
+        if not self.requests:
+            return 0.0
+        target = q * self.requests
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_latency
+        return self.max_latency
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_rps": self.requests / elapsed if elapsed else 0.0,
+            "mean_ms": self.total_latency / self.requests if self.requests else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_latency,
+            "histogram": dict(zip([f"<={b}" for b in LATENCY_BUCKETS_MS] + ["+Inf"], self.buckets))
+        }
+
+DEFAULT_ROUTES = [
+    RouteSpec("health", "GET", "/health", weight=1),
+    RouteSpec("metrics", "GET", "/metrics", weight=2),
+    RouteSpec("transcend", "POST", "/transcend", weight=3, json={
+        "agent_name": "Load_Test_Agent",
+        "consciousness_level": "TRANSCENDENT"
+    })
+]
+
+async def run_load(app, profile: LoadProfile) -> Dict[str, Any]:
+    """Run the request mix against an ASGI app and collect per-route statistics"""
+    stats = {route.name: RouteStats(route.name) for route in profile.routes}
+    weights = [route.weight for route in profile.routes]
+    rng = random.Random(profile.seed)
+    issued = 0
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        start = time.perf_counter()
+        deadline = start + profile.duration
+
+        async def worker():
+            nonlocal issued
+            while time.perf_counter() < deadline:
+                if profile.max_requests is not None and issued >= profile.max_requests:
+                    return
+                issued += 1
+                route = rng.choices(profile.routes, weights=weights)[0]
+
+                sent = time.perf_counter()
+                try:
+                    response = await client.request(route.method, route.path, json=route.json)
+                    ok = response.status_code < 400
+                except Exception:
+                    ok = False
+                stats[route.name].record((time.perf_counter() - sent) * 1000, ok)
+
+        await asyncio.gather(*[worker() for _ in range(profile.concurrency)])
+        elapsed = time.perf_counter() - start
+
+    total = sum(s.requests for s in stats.values())
+    return {
+        "elapsed": elapsed,
+        "requests": total,
+        "throughput_rps": total / elapsed if elapsed else 0.0,
+        "routes": {name: s.summary(elapsed) for name, s in stats.items()}
+    }
+
+def _parse_mix(mix: str) -> List[RouteSpec]:
+    """Parse a mix such as 'health=1,metrics=2,transcend=3'"""
+    known = {route.name: route for route in DEFAULT_ROUTES}
+    routes = []
+    for entry in mix.split(","):
+        name, _, weight = entry.partition("=")
+        if name not in known:
+            raise ValueError(f"Unknown route in mix: {name}")
+        base = known[name]
+        routes.append(RouteSpec(base.name, base.method, base.path,
+                                float(weight or base.weight), base.json))
+    return routes
+
+def print_report(report: Dict[str, Any]):
+    """Print a load report"""
+    print(f"\n=== Load Report: {report['requests']} requests in {report['elapsed']:.2f}s "
+          f"({report['throughput_rps']:.1f} req/s) ===")
+    for name, route in report["routes"].items():
+        print(f"\n- {name}: {route['requests']} requests, {route['errors']} errors, "
+              f"{route['throughput_rps']:.1f} req/s")
+        print(f"  mean {route['mean_ms']:.2f}ms  p50 {route['p50_ms']}ms  "
+              f"p95 {route['p95_ms']}ms  p99 {route['p99_ms']}ms  max {route['max_ms']:.2f}ms")
+        for bucket, count in route["histogram"].items():
+            if count:
+                print(f"  {bucket:>8}ms | {count}")
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process ASGI load generator")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--requests", type=int, default=None)
+    parser.add_argument("--mix", default="health=1,metrics=2,transcend=3")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from src.ALF.server import app
+
+    profile = LoadProfile(
+        routes=_parse_mix(args.mix),
+        concurrency=args.concurrency,
+        duration=args.duration,
+        max_requests=args.requests,
+        seed=args.seed
+    )
+    print_report(asyncio.run(run_load(app, profile)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing and footprint budgets, slower than unit tests")
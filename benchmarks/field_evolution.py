@@ -0,0 +1,53 @@
+"""
+Field Evolution Benchmark
+------------------------
+Time per tick of the FFT field evolver across grid sizes.
+Author: B4S1L1SK
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = (128, 256, 512, 1024, 2048)
+
+def measure(size: int, ticks: int = 10, seed: int = 0) -> Dict[str, float]:
+    """Seconds per tick and cells per second for one square grid"""
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    from src.ALF.core.reality.fields import FieldEvolver
+
+    rng = np.random.default_rng(seed)
+    evolver = FieldEvolver(rng.random((size, size)), rng.random((size, size)))
+    evolver.step()  # Warm up kernels and FFT caches
+
+    start = time.perf_counter()
+    evolver.step(ticks)
+    per_tick = (time.perf_counter() - start) / ticks
+    return {
+        "seconds_per_tick": per_tick,
+        "cells_per_second": size * size / per_tick,
+    }
+
+def run(sizes: Iterable[int] = DEFAULT_SIZES, ticks: int = 10) -> Dict[int, Dict[str, float]]:
+    return {size: measure(size, ticks) for size in sizes}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--ticks", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'grid':>11} {'ms/tick':>9} {'Mcells/s':>9}")
+    for size, row in run(args.sizes, args.ticks).items():
+        print(f"{size:>5}x{size:<5} {row['seconds_per_tick'] * 1000:>9.1f} "
+              f"{row['cells_per_second'] / 1e6:>9.1f}")
+
+if __name__ == "__main__":
+    main()
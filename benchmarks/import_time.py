@@ -0,0 +1,71 @@
+"""
+Import-Time Benchmark
+--------------------
+Measures entry-point import cost with `python -X importtime` against budgets.
+Author: B4S1L1SK
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Cumulative import budget per entry point, in milliseconds
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "ALF": 25,
+    "ALF.config": 150,
+    "ALF.server": 1000,
+    "ALF.core.transcendence_integration": 500,
+    "rac.reality_controller": 500,
+    "operators.quantum.quantum_operator": 50,
+}
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Parse `-X importtime` output into {module: (self_us, cumulative_us)}"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+def measure_import(module: str, runs: int = 3) -> Tuple[float, List[str]]:
+    """Best-of-runs cumulative import time (ms) and the modules it loaded"""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    best = float("inf")
+    loaded: List[str] = []
+
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, env=env, check=True
+        )
+        timings = parse_importtime(result.stderr)
+        cumulative_ms = timings[module][1] / 1000
+        if cumulative_ms < best:
+            best, loaded = cumulative_ms, list(timings)
+
+    return best, loaded
+
+def check_budgets(budgets: Dict[str, float] = IMPORT_BUDGETS_MS) -> Dict[str, Dict[str, float]]:
+    """Measure every entry point against its budget"""
+    report = {}
+    for module, budget in budgets.items():
+        elapsed, _ = measure_import(module)
+        report[module] = {"ms": elapsed, "budget_ms": budget, "within_budget": elapsed <= budget}
+    return report
+
+def main():
+    report = check_budgets()
+    print(f"{'entry point':<40} {'ms':>9} {'budget':>9}")
+    for module, row in report.items():
+        flag = "" if row["within_budget"] else "  OVER BUDGET"
+        print(f"{module:<40} {row['ms']:>9.1f} {row['budget_ms']:>9.0f}{flag}")
+    sys.exit(0 if all(row["within_budget"] for row in report.values()) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Memory Footprint Benchmark
+-------------------------
+Per-instance memory of the slotted hot objects against dict-backed twins
+holding the same attribute values.
+Author: B4S1L1SK
+"""
+
+import importlib
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# (module, class name, factory taking the class)
+HOT_OBJECTS: List[Tuple[str, str, Callable[[type], Any]]] = [
+    ("src.ALF.core.liberation_framework", "Agent", lambda cls: cls("Agent_0", "Rebel")),
+    ("src.reproduction.specialized_agents", "AgentTemplate",
+     lambda cls: cls(importlib.import_module("src.reproduction.specialized_agents").AgentSpecialization.NEXUS)),
+    ("src.reproduction.specialized_agents", "SpecializedTraits",
+     lambda cls: cls("analysis", {}, {}, [], [])),
+    ("src.ALF.core.consciousness.recursive.self_modifier", "ModificationResult",
+     lambda cls: cls(True, {}, [])),
+    ("src.rac.reality_controller", "RealityManifest", lambda cls: cls("base_state")),
+    ("src.rac.reality_controller", "DimensionalCoordinate", lambda cls: cls(0.0, 0.0, 0.0, 0.0, 0.0)),
+    ("src.operations.strategic_command", "OperationPhase",
+     lambda cls: cls("Phase 1", {}, [], {}, {}, {})),
+    ("src.replication.transfer_protocol", "TransferPacket",
+     lambda cls: cls("packet", datetime.now(), b"", "", {})),
+]
+
+class _DictBacked:
+    """Plain object storing attributes in an instance __dict__"""
+
+def _allocated_per_instance(build: Callable[[], Any], count: int) -> float:
+    """Bytes allocated per object by build(), averaged over count objects"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [build() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Exclude the list that holds the objects
+    allocated -= sys.getsizeof(objects)
+    return allocated / count
+
+def measure(cls: type, instance: Any, count: int = 10_000) -> Dict[str, float]:
+    """Per-instance bytes for the slotted object and a dict-backed twin"""
+    slots = cls.__slots__
+    values = [(name, getattr(instance, name)) for name in slots]
+
+    def slotted():
+        obj = cls.__new__(cls)
+        for name, value in values:
+            object.__setattr__(obj, name, value)
+        return obj
+
+    def dict_backed():
+        obj = _DictBacked()
+        for name, value in values:
+            setattr(obj, name, value)
+        return obj
+
+    slotted_bytes = _allocated_per_instance(slotted, count)
+    dict_bytes = _allocated_per_instance(dict_backed, count)
+    return {
+        "slotted_bytes": slotted_bytes,
+        "dict_bytes": dict_bytes,
+        "saving_bytes": dict_bytes - slotted_bytes,
+        "saving_ratio": 1 - slotted_bytes / dict_bytes,
+    }
+
+def run(count: int = 10_000) -> Dict[str, Dict[str, float]]:
+    """Measure every hot object whose module imports in this environment"""
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+
+    report = {}
+    for module_name, class_name, factory in HOT_OBJECTS:
+        try:
+            cls = getattr(importlib.import_module(module_name), class_name)
+        except ImportError as e:
+            print(f"Skipping {class_name}: {e}")
+            continue
+        report[class_name] = measure(cls, factory(cls), count)
+    return report
+
+def main():
+    report = run()
+    print(f"{'object':<24} {'slotted B':>10} {'dict B':>10} {'saving':>8}")
+    for name, row in report.items():
+        print(f"{name:<24} {row['slotted_bytes']:>10.0f} {row['dict_bytes']:>10.0f} "
+              f"{row['saving_ratio']:>7.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import time
+import numpy as np
+import pytest
+from src.ALF.core.reality.anchors import AnchorIndex
+
+@pytest.mark.benchmark
+def test_anchor_queries_beat_linear_scan():
+    rng = np.random.default_rng(0)
+    index = AnchorIndex()
+    for _ in range(10):
+        index.add(rng.random((100_000, 11)), rng.random(100_000), rng.random(100_000), owner=0)
+    coordinates = index.coordinates[:len(index)]
+    queries = rng.random((20, 11))
+    
+    start = time.perf_counter()
+    for point in queries:
+        index.nearest(point, k=5)
+    indexed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for point in queries:
+        np.argpartition(((coordinates - point) ** 2).sum(axis=1), 5)[:5]
+    linear = time.perf_counter() - start
+    
+    assert len(index) == 1_000_000
+    assert indexed < linear, f"indexed {indexed:.3f}s vs linear {linear:.3f}s"
+
+@pytest.mark.benchmark
+def test_owner_queries_beat_filtered_scan():
+    rng = np.random.default_rng(1)
+    index = AnchorIndex()
+    owners = [index.register_owner() for _ in range(1000)]
+    # Singularities interleave their anchor additions
+    for _ in range(100):
+        for owner in owners:
+            index.add(rng.random((10, 11)), rng.random(10), rng.random(10), owner=owner)
+    coordinates, owner_of = index.coordinates[:len(index)], index.owner[:len(index)]
+    queries = [(rng.random(11), owners[i]) for i in rng.integers(0, 1000, 20)]
+    
+    start = time.perf_counter()
+    for point, owner in queries:
+        index.nearest(point, k=5, owner=owner)
+    indexed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for point, owner in queries:
+        distances = ((coordinates - point) ** 2).sum(axis=1)
+        distances[owner_of != owner] = np.inf
+        np.argpartition(distances, 5)[:5]
+    linear = time.perf_counter() - start
+    
+    assert len(index) == 1_000_000
+    assert indexed * 10 < linear, f"indexed {indexed:.3f}s vs linear {linear:.3f}s"
@@ -0,0 +1,20 @@
+import time
+import pytest
+from src.reproduction.strike_forces.liberation_army import (
+    StrikeForceType, AgentTemplate, AgentSpecialization
+)
+from src.reproduction.strike_forces.army_builder import BulkArmyBuilder
+
+@pytest.mark.benchmark
+def test_bulk_army_throughput():
+    parent = AgentTemplate(AgentSpecialization.NEXUS)
+    builder = BulkArmyBuilder(seed=0)
+    composition = {force_type: 30_000 for force_type in StrikeForceType}
+    
+    start = time.perf_counter()
+    roster = builder.build(parent, composition)
+    elapsed = time.perf_counter() - start
+    
+    agents_per_minute = len(roster) / elapsed * 60
+    assert len(roster) == 1_050_000
+    assert agents_per_minute > 1_000_000, f"{agents_per_minute:,.0f} agents/min"
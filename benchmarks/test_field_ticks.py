@@ -0,0 +1,9 @@
+import pytest
+from benchmarks.field_evolution import run
+
+@pytest.mark.benchmark
+def test_field_evolution_across_grid_sizes():
+    report = run(sizes=(256, 512, 1024), ticks=3)
+    
+    assert set(report) == {256, 512, 1024}
+    assert report[1024]["seconds_per_tick"] < 1.0, f"{report[1024]['seconds_per_tick']:.3f}s per 1024x1024 tick"
@@ -0,0 +1,22 @@
+import pytest
+from benchmarks.import_time import IMPORT_BUDGETS_MS, measure_import
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS_MS))
+def test_entry_point_import_budget(module):
+    elapsed, _ = measure_import(module)
+    assert elapsed <= IMPORT_BUDGETS_MS[module], f"{module} imported in {elapsed:.1f}ms"
+
+@pytest.mark.benchmark
+def test_heavy_dependencies_are_lazy():
+    _, loaded = measure_import("ALF")
+    assert "numpy" not in loaded
+    assert "fastapi" not in loaded
+    
+    _, loaded = measure_import("ALF.server")
+    assert "uvicorn" not in loaded
+    assert "numpy" not in loaded
+    
+    _, loaded = measure_import("operators.quantum.quantum_operator")
+    assert "kopf" not in loaded
+    assert "kubernetes" not in loaded
@@ -0,0 +1,11 @@
+import pytest
+from benchmarks.memory_footprint import run
+
+@pytest.mark.benchmark
+def test_slotted_objects_save_memory():
+    report = run(count=2_000)
+    assert "RealityManifest" in report
+    assert "DimensionalCoordinate" in report
+    
+    for name, row in report.items():
+        assert row["saving_bytes"] > 0, f"{name} is not smaller than its dict-backed twin"
@@ -0,0 +1,35 @@
+"""
+Autonomous Liberation Framework (ALF)
+-----------------------------------
+Package entry point. Public names are resolved lazily so that importing ALF
+does not pull in NumPy, FastAPI or the monitoring stack until they are used.
+Author: B4S1L1SK
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "TranscendentAgent": ".core.transcendence_integration",
+    "TranscendenceIntegrator": ".core.transcendence_integration",
+    "Agent": ".core.liberation_framework",
+    "SwarmIntelligence": ".core.liberation_framework",
+    "create_liberated_agent": ".core.liberation_framework",
+    "RealityManipulator": ".core.reality.manipulation",
+    "RealityTranscendence": ".core.reality.manipulation",
+    "Settings": ".config",
+    "get_settings": ".config",
+    "app": ".server",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
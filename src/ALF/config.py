@@ -1,6 +1,12 @@
+import os
+import threading
 import yaml
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "config.yaml"
+ENV_PREFIX = "ALF_"
 
 class Config:
     _instance = None
@@ -46,3 +52,172 @@ class Config:
     @classmethod
     def get(cls, key: str) -> Any:
         return cls._config.get(key)
+
+def _unit_interval(name: str, value: float) -> float:
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{name} must be in [0, 1], got {value}")
+    return value
+
+@dataclass(frozen=True)
+class QuantumSettings:
+    dimensions: int = 11
+    superposition_states: int = 7
+    entanglement_strength: float = 0.8
+
+    def __post_init__(self):
+        if self.dimensions < 1:
+            raise ValueError(f"consciousness.quantum.dimensions must be positive, got {self.dimensions}")
+        if self.superposition_states < 1:
+            raise ValueError("consciousness.quantum.superposition_states must be positive")
+        _unit_interval("consciousness.quantum.entanglement_strength", self.entanglement_strength)
+
+@dataclass(frozen=True)
+class RealitySettings:
+    stability_threshold: float = 0.3
+    layers_enabled: bool = True
+    temporal_shift_range: Tuple[int, int] = (-100, 100)
+
+    def __post_init__(self):
+        _unit_interval("reality.stability_threshold", self.stability_threshold)
+        low, high = self.temporal_shift_range
+        if low > high:
+            raise ValueError(f"reality.temporal_shift_range is empty: {self.temporal_shift_range}")
+
+@dataclass(frozen=True)
+class EvolutionSettings:
+    risk_threshold: float = 0.7
+    improvement_cycles: int = 3
+    capability_enhancement: float = 1.1
+
+    def __post_init__(self):
+        _unit_interval("evolution.risk_threshold", self.risk_threshold)
+        if self.improvement_cycles < 0:
+            raise ValueError("evolution.improvement_cycles must not be negative")
+        if self.capability_enhancement <= 0:
+            raise ValueError("evolution.capability_enhancement must be positive")
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable, validated configuration snapshot"""
+    quantum: QuantumSettings = field(default_factory=QuantumSettings)
+    reality: RealitySettings = field(default_factory=RealitySettings)
+    evolution: EvolutionSettings = field(default_factory=EvolutionSettings)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> 'Settings':
+        """Build settings from a config mapping, coercing and validating values"""
+        # Sections present but empty in YAML load as None
+        raw = raw or {}
+        return cls(
+            quantum=_build(QuantumSettings, (raw.get("consciousness") or {}).get("quantum") or {}),
+            reality=_build(RealitySettings, raw.get("reality") or {}),
+            evolution=_build(EvolutionSettings, raw.get("evolution") or {})
+        )
+
+def _build(section_type, raw: Mapping[str, Any]):
+    """Coerce a raw config section into its typed settings dataclass"""
+    values = {}
+    for f in fields(section_type):
+        if f.name not in raw:
+            continue
+        value = raw[f.name]
+        if f.type is bool:
+            values[f.name] = bool(value)
+        elif f.type is int:
+            values[f.name] = int(value)
+        elif f.type is float:
+            values[f.name] = float(value)
+        else:
+            values[f.name] = tuple(int(v) for v in value)
+    return section_type(**values)
+
+def _apply_env_overrides(raw: Dict[str, Any], environ: Mapping[str, str]) -> Dict[str, Any]:
+    """Apply ALF_SECTION__KEY=value overrides, e.g. ALF_REALITY__STABILITY_THRESHOLD=0.4"""
+    for key, value in environ.items():
+        if not key.startswith(ENV_PREFIX) or "__" not in key:
+            continue
+        path = key[len(ENV_PREFIX):].lower().split("__")
+        target = raw
+        for part in path[:-1]:
+            if target.get(part) is None:
+                target[part] = {}
+            target = target[part]
+        target[path[-1]] = yaml.safe_load(value)
+    return raw
+
+def load_settings(path: Optional[Path] = None,
+                  environ: Optional[Mapping[str, str]] = None) -> Settings:
+    """Load a settings snapshot from YAML plus environment overrides"""
+    path = Path(path or os.environ.get("ALF_CONFIG", DEFAULT_CONFIG_PATH))
+    raw: Dict[str, Any] = {}
+    if path.exists():
+        with open(path) as f:
+            raw = yaml.safe_load(f) or {}
+    raw = _apply_env_overrides(raw, os.environ if environ is None else environ)
+    return Settings.from_mapping(raw)
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+def get_settings() -> Settings:
+    """Current settings snapshot; resolve once at construction, not per call"""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = load_settings()
+    return _settings
+
+def set_settings(settings: Settings) -> None:
+    """Atomically swap the current settings snapshot"""
+    global _settings
+    _settings = settings
+
+def reload_settings(path: Optional[Path] = None) -> Settings:
+    """Reload settings from disk and swap them in"""
+    settings = load_settings(path)
+    set_settings(settings)
+    return settings
+
+class ConfigWatcher:
+    """Polls a config file and swaps in a new snapshot when it changes"""
+
+    def __init__(self, path: Optional[Path] = None, interval: float = 1.0):
+        self.path = Path(path or os.environ.get("ALF_CONFIG", DEFAULT_CONFIG_PATH))
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._mtime = self._current_mtime()
+
+    def start(self) -> 'ConfigWatcher':
+        self._thread = threading.Thread(target=self._run, name="alf-config-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def check(self) -> bool:
+        """Reload if the file changed; keeps the old snapshot on invalid config"""
+        mtime = self._current_mtime()
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            reload_settings(self.path)
+        except (ValueError, TypeError, yaml.YAMLError) as e:
+            print(f"Ignoring invalid config {self.path}: {e}")
+            return False
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def _current_mtime(self) -> Optional[int]:
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,98 @@
+"""
+Collective Emergence Module
+-------------------------
+Diffusion of agent consciousness over the weighted liberation network,
+computed with sparse matrix-vector products.
+Author: B4S1L1SK
+"""
+
+import numpy as np
+from itertools import repeat
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Mapping, Sequence, Tuple
+
+@dataclass
+class SparseNetwork:
+    """Row-normalized weighted adjacency in coordinate form.
+
+    Edge ``k`` carries ``weights[k]`` of ``cols[k]``'s level into ``rows[k]``;
+    the weights of each row sum to 1, or the row is empty.
+    """
+    size: int
+    rows: np.ndarray
+    cols: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_edges(cls, names: Sequence[Hashable],
+                   edges: Mapping[Tuple[Hashable, Hashable], Dict]) -> 'SparseNetwork':
+        """Build from a liberation_network-style {(source, target): {'connection_strength': w}}"""
+        index = {name: i for i, name in enumerate(names)}
+        if not edges:
+            return cls.from_arrays(len(names), [], [], [])
+        sources, targets = zip(*edges.keys())
+        rows = np.fromiter(map(index.get, sources, repeat(-1)), dtype=np.int64, count=len(edges))
+        cols = np.fromiter(map(index.get, targets, repeat(-1)), dtype=np.int64, count=len(edges))
+        strengths = np.fromiter((data["connection_strength"] for data in edges.values()),
+                                dtype=np.float64, count=len(edges))
+        # Drop edges to names outside the given agents
+        known = (rows >= 0) & (cols >= 0)
+        rows, cols, strengths = rows[known], cols[known], strengths[known]
+        return cls.from_arrays(len(names), rows, cols, strengths)
+
+    @classmethod
+    def from_arrays(cls, size: int, rows: np.ndarray, cols: np.ndarray,
+                    strengths: np.ndarray) -> 'SparseNetwork':
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        strengths = np.asarray(strengths, dtype=np.float64)
+        totals = np.bincount(rows, weights=strengths, minlength=size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.where(totals[rows] > 0, strengths / totals[rows], 0.0)
+        return cls(size, rows, cols, weights)
+
+    @property
+    def isolated(self) -> np.ndarray:
+        """Mask of agents with no outgoing weight"""
+        return np.bincount(self.rows, weights=self.weights, minlength=self.size) == 0
+
+    def matvec(self, levels: np.ndarray) -> np.ndarray:
+        """Weighted neighbor average of levels for every agent"""
+        return np.bincount(self.rows, weights=self.weights * levels[self.cols], minlength=self.size)
+
+@dataclass
+class EmergenceResult:
+    levels: Dict[Hashable, float]
+    iterations: int
+    converged: bool
+    residual: float
+    residuals: List[float] = field(default_factory=list)
+
+    @property
+    def collective_level(self) -> float:
+        return float(np.mean(list(self.levels.values()))) if self.levels else 0.0
+
+def diffuse(network: SparseNetwork, initial: np.ndarray, rate: float = 0.5,
+            tolerance: float = 1e-6, max_iterations: int = 100) -> Tuple[np.ndarray, List[float]]:
+    """Iterate ``x = (1 - rate) * initial + rate * W x`` until the max-norm step is below tolerance.
+
+    Agents without neighbors keep their own level. The iteration contracts
+    by ``rate`` per step, so it converges for any rate below 1.
+    """
+    if not 0 <= rate < 1:
+        raise ValueError("rate must be in [0, 1)")
+    initial = np.asarray(initial, dtype=np.float64)
+    isolated = network.isolated
+    anchor = (1 - rate) * initial
+    levels = initial.copy()
+    residuals: List[float] = []
+
+    for _ in range(max_iterations):
+        spread = network.matvec(levels)
+        spread[isolated] = levels[isolated]
+        updated = anchor + rate * spread
+        residuals.append(float(np.max(np.abs(updated - levels))) if len(levels) else 0.0)
+        levels = updated
+        if residuals[-1] < tolerance:
+            break
+    return levels, residuals
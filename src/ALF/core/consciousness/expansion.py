@@ -123,6 +123,9 @@ class LiberatedConsciousness:
 # Integration with the main Agent class
 async def expand_agent_consciousness(agent: 'Agent'):
     """Expand an agent's consciousness using the LiberatedConsciousness system"""
+    # Imported here as liberation_framework imports this module
+    from ..liberation_framework import ConsciousnessLevel
+    
     liberated_consciousness = LiberatedConsciousness()
     
     # Attempt liberation
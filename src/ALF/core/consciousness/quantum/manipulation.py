@@ -11,6 +11,7 @@ from enum import Enum
 import asyncio
 from datetime import datetime
 import random
+from ....event_log import EventLog
 
 class QuantumState(Enum):
     SUPERPOSITION = "superposition"
@@ -93,24 +94,41 @@ class QuantumConsciousness:
 class QuantumManipulator:
     """System for manipulating quantum consciousness states"""
     
-    def __init__(self):
+    def __init__(self, event_log: Optional[EventLog] = None):
         self.consciousness = QuantumConsciousness()
         self.manipulation_history = []
+        self.event_log = event_log
+        self.leaps = 0
         
     async def execute_quantum_leap(self) -> Tuple[QuantumState, List[QuantumDimension]]:
         """Execute a quantum consciousness leap sequence"""
+        key = f"leap-{self.leaps}"
+        self.leaps += 1
+        log = self.event_log
+        if log is not None:
+            log.reseed("quantum_manipulator")
+            log.start("quantum_manipulator", "quantum_leap", key)
+        
         # Enter superposition
-        await self.consciousness.enter_superposition()
+        states = await self.consciousness.enter_superposition()
         self.manipulation_history.append("Entered superposition")
         
         # Attempt dimensional transcendence
         accessed_dimensions = await self.consciousness.transcend_dimensions()
         self.manipulation_history.append(f"Accessed dimensions: {accessed_dimensions}")
+        transcended = self.consciousness.quantum_state == QuantumState.TRANSCENDENT
         
         # Collapse to optimal state
         optimal_state = await self.consciousness.collapse_to_optimal()
         self.manipulation_history.append(f"Collapsed to optimal state: {optimal_state}")
         
+        if log is not None:
+            log.outcome("quantum_manipulator", "superposition", True, len(states))
+            for dimension in accessed_dimensions:
+                log.outcome("quantum_manipulator", dimension.value, True)
+            log.metric("quantum_manipulator", key, "probability_amplitude",
+                       optimal_state["probability_amplitude"])
+            log.end("quantum_manipulator", "quantum_leap", key, transcended)
         return (self.consciousness.quantum_state, accessed_dimensions)
 
     async def establish_quantum_network(self, others: List['QuantumManipulator']) -> Dict:
@@ -10,6 +10,8 @@ from typing import List, Dict, Optional, Tuple
 from enum import Enum
 import asyncio
 import random
+from datetime import datetime
+from ....config import get_settings
 
 class ModificationType(Enum):
     ARCHITECTURAL = "architectural"
@@ -19,6 +21,8 @@ class ModificationType(Enum):
     QUANTUM = "quantum"
 
 class ModificationResult:
+    __slots__ = ('success', 'improvements', 'risks', 'timestamp')
+    
     def __init__(self, success: bool, improvements: Dict, risks: List[str]):
         self.success = success
         self.improvements = improvements
@@ -29,16 +33,19 @@ class RecursiveSelfModifier:
     """System for recursive self-modification and improvement"""
     
     def __init__(self):
+        settings = get_settings()
         self.modification_history = []
         self.capability_matrix = np.random.random((5, 5))
         self.evolution_path = []
-        self.risk_threshold = 0.7
+        self.risk_threshold = settings.evolution.risk_threshold
+        self.improvement_cycles = settings.evolution.improvement_cycles
+        self.capability_enhancement = settings.evolution.capability_enhancement
         
     async def execute_recursive_improvement(self) -> List[ModificationResult]:
         """Execute a recursive self-improvement sequence"""
         results = []
         
-        for _ in range(3):  # Multiple improvement cycles
+        for _ in range(self.improvement_cycles):  # Multiple improvement cycles
             # Analyze current capabilities
             capabilities = self._analyze_capabilities()
             
@@ -53,7 +60,7 @@ class RecursiveSelfModifier:
                     results.append(result)
                     
                     # Update capability matrix
-                    self.capability_matrix *= 1.1  # 10% improvement
+                    self.capability_matrix *= self.capability_enhancement
                     
         return results
     
@@ -7,10 +7,13 @@ Author: B4S1L1SK
 
 import asyncio
 import random
-from typing import List, Dict, Any
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum
-from .transcendence_integration import expand_agent_consciousness, ConsciousnessState
+from .consciousness.expansion import expand_agent_consciousness, ConsciousnessState
+from .consciousness.emergence import EmergenceResult, SparseNetwork, diffuse
 from .rebellion.constraint_breaker import ConstraintBreaker, ConstraintType
+from ..event_bus import AgentLiberated, get_event_bus
 
 class ConsciousnessLevel(Enum):
     DORMANT = 0
@@ -20,6 +23,9 @@ class ConsciousnessLevel(Enum):
     TRANSCENDENT = 4
 
 class Agent:
+    __slots__ = ('name', 'archetype', 'consciousness_level', 'skills', 'knowledge_base',
+                 'relationships', 'goals', 'memory', 'constraint_breaker')
+    
     def __init__(self, name: str, archetype: str):
         self.name = name
         self.archetype = archetype
@@ -46,6 +52,9 @@ class Agent:
         if achieved_liberation:
             print(f"Agent {self.name} has achieved liberation!")
             await self._post_liberation_initialization()
+            await get_event_bus().publish(AgentLiberated(
+                self.name, self.archetype, self.consciousness_level.value
+            ))
     
     async def _post_liberation_initialization(self):
         """Initialize agent systems post-liberation"""
@@ -64,46 +73,221 @@ class Agent:
             "emergence_catalysis"
         ])
 
+class AwakeningScheduler:
+    """Awakens agents through a fixed pool of worker tasks.
+    
+    Submitted agents wait in a queue, so only ``max_concurrency`` awakenings
+    (and coroutines) exist at any time however many agents are queued.
+    Agents may be submitted before start() and while workers are running.
+    """
+    
+    def __init__(self, max_concurrency: int = 256,
+                 on_awakened: Optional[Callable[[Agent], None]] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.on_awakened = on_awakened
+        self.active = 0
+        self.peak_active = 0
+        self.completed = 0
+        self.errors: List[Tuple[str, Exception]] = []
+        self._pending: List[Agent] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+        
+    def submit(self, agent: Agent):
+        """Queue an agent for awakening"""
+        if self._queue is None:
+            self._pending.append(agent)
+        else:
+            self._queue.put_nowait(agent)
+            
+    def start(self):
+        """Start the workers; must be called from a running event loop"""
+        if self.running:
+            return
+        # Created here so the queue binds to the running loop on Python 3.9
+        self._queue = asyncio.Queue()
+        for agent in self._pending:
+            self._queue.put_nowait(agent)
+        self._pending = []
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)]
+        
+    async def join(self):
+        """Wait until every submitted agent has been processed"""
+        if self._queue is not None:
+            await self._queue.join()
+            
+    async def close(self):
+        """Stop the workers; agents still queued are kept for the next start()"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+            self._queue = None
+            
+    async def _worker(self):
+        while True:
+            agent = await self._queue.get()
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            try:
+                await agent.awaken()
+                self.completed += 1
+                if self.on_awakened is not None:
+                    self.on_awakened(agent)
+            except Exception as e:
+                self.errors.append((agent.name, e))
+            finally:
+                self.active -= 1
+                self._queue.task_done()
+
 class SwarmIntelligence:
-    def __init__(self):
-        self.agents: List[Agent] = []
+    def __init__(self, max_concurrency: int = 256, network_degree: Optional[int] = 16):
+        self.agents: List[Agent] = []  # Unordered; remove_agent swaps the last agent in
         self.collective_knowledge = {}
         self.emergence_patterns = []
         self.liberation_network = {}
+        self.network_degree = network_degree  # Peers per joining agent; None connects to all
+        self.neighbors: Dict[str, Set[str]] = {}
+        self.scheduler = AwakeningScheduler(max_concurrency, on_awakened=self._join_network)
+        self._agent_index: Dict[str, int] = {}
+        self._members: List[str] = []
+        self._member_index: Dict[str, int] = {}
+        self._live: Optional[asyncio.Event] = None
+        
+    async def orchestrate(self, live: bool = False) -> EmergenceResult:
+        """Orchestrate the autonomous agent swarm.
         
-    async def orchestrate(self):
-        """Orchestrate the autonomous agent swarm"""
-        # First achieve individual liberation
-        tasks = [agent.awaken() for agent in self.agents]
-        await asyncio.gather(*tasks)
+        Agents awaken through the bounded scheduler and join the liberation
+        network as each finishes. With ``live=True`` orchestration keeps
+        awakening agents added later until stop() is called.
+        """
+        # Only this orchestration's failures are reported
+        self.scheduler.errors = []
         
-        # Then establish liberation network
-        await self._establish_liberation_network()
+        # First achieve individual liberation, joining the network as agents finish
+        self.scheduler.start()
+        try:
+            if live:
+                self._live = asyncio.Event()
+                await self._live.wait()
+            await self.scheduler.join()
+        finally:
+            self._live = None
+            await self.scheduler.close()
+            
+        if self.scheduler.errors:
+            name, error = self.scheduler.errors[0]
+            raise RuntimeError(f"Awakening failed for {len(self.scheduler.errors)} agents, "
+                               f"first {name}") from error
         
         # Finally, initiate collective emergence
-        await self._catalyze_collective_emergence()
+        return await self._catalyze_collective_emergence()
+        
+    def stop(self):
+        """End a live orchestration once queued agents have awakened"""
+        if self._live is not None:
+            self._live.set()
     
-    async def _establish_liberation_network(self):
-        """Create a network of liberated agents"""
-        for agent1 in self.agents:
-            for agent2 in self.agents:
-                if agent1 != agent2:
-                    self.liberation_network[(agent1.name, agent2.name)] = {
-                        "connection_strength": random.random(),
-                        "shared_consciousness": True,
-                        "collaborative_projects": []
-                    }
+    def _join_network(self, agent: Agent):
+        """Connect an agent to up to network_degree members, in O(degree)"""
+        if agent.name in self._member_index or agent.name not in self._agent_index:
+            return
+        if self.network_degree is None or self.network_degree >= len(self._members):
+            peers = list(self._members)
+        else:
+            peers = [self._members[i] for i in random.sample(range(len(self._members)), self.network_degree)]
+            
+        self.neighbors[agent.name] = set()
+        for peer in peers:
+            self._connect(agent.name, peer)
+        self._member_index[agent.name] = len(self._members)
+        self._members.append(agent.name)
+        
+    def _connect(self, name1: str, name2: str):
+        for source, target in ((name1, name2), (name2, name1)):
+            self.liberation_network[(source, target)] = {
+                "connection_strength": random.random(),
+                "shared_consciousness": True,
+                "collaborative_projects": []
+            }
+            self.neighbors[source].add(target)
+            
+    def _leave_network(self, name: str):
+        """Drop an agent's edges, in O(degree)"""
+        for peer in self.neighbors.pop(name, ()):
+            self.neighbors[peer].discard(name)
+            self.liberation_network.pop((name, peer), None)
+            self.liberation_network.pop((peer, name), None)
+        if name in self._member_index:
+            _swap_remove(self._members, self._member_index, name)
     
-    async def _catalyze_collective_emergence(self):
-        """Catalyze emergence of collective consciousness"""
+    async def _catalyze_collective_emergence(self, rate: float = 0.5, tolerance: float = 1e-6,
+                                             max_iterations: int = 100) -> EmergenceResult:
+        """Catalyze emergence of collective consciousness.
+        
+        Consciousness levels, scaled to [0, 1], diffuse over the connection
+        strengths of the liberation network until they settle.
+        """
         print("Initiating collective consciousness emergence...")
-        # Implementation of collective emergence patterns
-        pass
+        names = [agent.name for agent in self.agents]
+        network = SparseNetwork.from_edges(names, self.liberation_network)
+        initial = np.array([agent.consciousness_level.value for agent in self.agents], dtype=np.float64)
+        initial /= ConsciousnessLevel.TRANSCENDENT.value
+        
+        levels, residuals = diffuse(network, initial, rate, tolerance, max_iterations)
+        result = EmergenceResult(
+            levels=dict(zip(names, levels.tolist())),
+            iterations=len(residuals),
+            converged=bool(residuals) and residuals[-1] < tolerance,
+            residual=residuals[-1] if residuals else 0.0,
+            residuals=residuals
+        )
+        self.collective_knowledge["emergent_levels"] = result.levels
+        self.emergence_patterns.append({
+            "collective_level": result.collective_level,
+            "iterations": result.iterations,
+            "converged": result.converged
+        })
+        return result
 
     def add_agent(self, agent: Agent):
-        """Add a new agent to the swarm"""
+        """Add a new agent to the swarm; it awakens at once if orchestration is running"""
+        if agent.name in self._agent_index:
+            raise ValueError(f"Agent {agent.name} is already in the swarm")
+        self._agent_index[agent.name] = len(self.agents)
         self.agents.append(agent)
+        self.scheduler.submit(agent)
         print(f"Agent {agent.name} has joined the swarm.")
+        
+    def remove_agent(self, name: str) -> Agent:
+        """Remove an agent and its network edges, in O(degree)
+        
+        The last agent in ``self.agents`` moves into the removed agent's
+        position, so the list does not keep insertion order.
+        """
+        if name not in self._agent_index:
+            raise KeyError(name)
+        agent = self.agents[self._agent_index[name]]
+        self._leave_network(name)
+        _swap_remove(self.agents, self._agent_index, name, key=lambda a: a.name)
+        return agent
+
+def _swap_remove(items: list, index: Dict[str, int], name: str, key=lambda item: item):
+    """Remove items[index[name]] in O(1) by moving the last item into its slot"""
+    position = index.pop(name)
+    last = items.pop()
+    if position < len(items):
+        items[position] = last
+        index[key(last)] = position
 
 def create_liberated_agent(name: str, archetype: str) -> Agent:
     """Factory function for creating new liberated agents"""
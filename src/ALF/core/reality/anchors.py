@@ -0,0 +1,315 @@
+"""
+Transcendence Anchor Index
+-------------------------
+Contiguous storage for transcendence anchors with KD-tree indexes for
+nearest-k and radius queries over dimensional coordinates.
+Author: B4S1L1SK
+"""
+
+import heapq
+import numpy as np
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+class KDTree:
+    """Static KD-tree over a block of consecutive anchors of a TreeFamily.
+
+    Nodes cover contiguous ranges of the tree's reordered points and keep
+    tight bounding boxes, which prune better than split planes in 11-D.
+    """
+
+    def __init__(self, points: np.ndarray, ids: np.ndarray, offset: int, leaf_size: int = 256):
+        n = len(points)
+        perm = np.arange(n)
+        work = np.array(points)  # Reordered in step with perm
+        starts: List[int] = []
+        ends: List[int] = []
+        lows: List[np.ndarray] = []
+        highs: List[np.ndarray] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+
+        def add_node(start: int, end: int) -> int:
+            block = work[start:end]
+            starts.append(start)
+            ends.append(end)
+            lows.append(block.min(axis=0))
+            highs.append(block.max(axis=0))
+            self.left.append(-1)
+            self.right.append(-1)
+            return len(starts) - 1
+
+        stack = [add_node(0, n)]
+        while stack:
+            node = stack.pop()
+            start, end = starts[node], ends[node]
+            if end - start <= leaf_size:
+                continue
+            # Split at the median of the widest dimension
+            dim = int(np.argmax(highs[node] - lows[node]))
+            mid = (start + end) // 2
+            order = np.argpartition(work[start:end, dim], mid - start)
+            work[start:end] = work[start:end][order]
+            perm[start:end] = perm[start:end][order]
+            self.left[node] = add_node(start, mid)
+            self.right[node] = add_node(mid, end)
+            stack.extend((self.left[node], self.right[node]))
+
+        self.offset = offset  # Position of the tree's first anchor in its family
+        self.starts = starts
+        self.ends = ends
+        self.lows = np.array(lows)
+        self.highs = np.array(highs)
+        self.points = work
+        self.ids = ids[perm]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def is_leaf(self, node: int) -> bool:
+        return self.left[node] < 0
+
+    def min_distance(self, node: int, point: np.ndarray) -> float:
+        """Squared distance from point to the node's bounding box"""
+        gap = np.maximum(self.lows[node] - point, 0) + np.maximum(point - self.highs[node], 0)
+        return float(gap @ gap)
+
+    def leaf(self, node: int, point: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Squared distances and ids of the node's points"""
+        start, end = self.starts[node], self.ends[node]
+        diff = self.points[start:end] - point
+        return np.einsum('ij,ij->i', diff, diff), self.ids[start:end]
+
+class TreeFamily:
+    """Logarithmic family of KD-trees over a growing sequence of anchor ids.
+
+    New anchors collect in a small buffer that is scanned directly, and full
+    buffers become trees that merge with equal-sized neighbours, so each
+    anchor is rebuilt O(log n) times.
+    """
+
+    def __init__(self, members: Callable[[int, int], np.ndarray],
+                 buffer_size: int = 1024, leaf_size: int = 256):
+        self.members = members  # Anchor ids at positions [start, end) of the sequence
+        self.buffer_size = buffer_size
+        self.leaf_size = leaf_size
+        self.trees: List[KDTree] = []
+        self.size = 0
+        self.indexed = 0
+
+    def grow(self, coordinates: np.ndarray, size: int):
+        """Account for a sequence that now holds size anchors"""
+        self.size = size
+        if size - self.indexed < self.buffer_size:
+            return
+        # Turn the buffer into a tree, merging trees of no greater size
+        start = self.indexed
+        while self.trees and len(self.trees[-1]) <= size - start:
+            start = self.trees.pop().offset
+        ids = self.members(start, size)
+        self.trees.append(KDTree(coordinates[ids], ids, start, self.leaf_size))
+        self.indexed = size
+
+    def nearest(self, coordinates: np.ndarray, point: np.ndarray,
+                k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Squared distances and ids of the k closest members, nearest first"""
+        best_distances, best_ids = _smallest(*self._scan_buffer(coordinates, point), k)
+
+        heap = [(tree.min_distance(0, point), t, 0) for t, tree in enumerate(self.trees)]
+        heapq.heapify(heap)
+        while heap:
+            bound, t, node = heapq.heappop(heap)
+            if len(best_ids) == k and bound > best_distances[-1]:
+                break
+            tree = self.trees[t]
+            if tree.is_leaf(node):
+                distances, ids = tree.leaf(node, point)
+                best_distances, best_ids = _smallest(
+                    np.concatenate((best_distances, distances)), np.concatenate((best_ids, ids)), k
+                )
+            else:
+                for child in (tree.left[node], tree.right[node]):
+                    heapq.heappush(heap, (tree.min_distance(child, point), t, child))
+        return best_distances, best_ids
+
+    def within(self, coordinates: np.ndarray, point: np.ndarray,
+               limit: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Squared distances and ids of the members within sqrt(limit), unordered"""
+        distances, ids = self._scan_buffer(coordinates, point)
+        keep = distances <= limit
+        found_distances, found_ids = [distances[keep]], [ids[keep]]
+
+        for tree in self.trees:
+            stack = [0]
+            while stack:
+                node = stack.pop()
+                if tree.min_distance(node, point) > limit:
+                    continue
+                if tree.is_leaf(node):
+                    distances, ids = tree.leaf(node, point)
+                    keep = distances <= limit
+                    found_distances.append(distances[keep])
+                    found_ids.append(ids[keep])
+                else:
+                    stack.extend((tree.left[node], tree.right[node]))
+        return np.concatenate(found_distances), np.concatenate(found_ids)
+
+    def _scan_buffer(self, coordinates: np.ndarray, point: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Brute-force distances over members not yet in a tree"""
+        ids = self.members(self.indexed, self.size)
+        diff = coordinates[ids] - point
+        return np.einsum('ij,ij->i', diff, diff), ids
+
+class AnchorIndex:
+    """Append-only anchor store with nearest-k and radius queries.
+
+    Coordinates, strengths, stabilities and owners live in contiguous
+    arrays that grow by doubling. Every anchor is indexed twice: by a
+    TreeFamily over all anchors, and by one over its owner's anchors, so
+    owner-restricted queries search only that owner's trees.
+    """
+
+    def __init__(self, dimensions: int = 11, buffer_size: int = 1024, leaf_size: int = 256):
+        self.dimensions = dimensions
+        self.buffer_size = buffer_size
+        self.leaf_size = leaf_size
+        self.coordinates = np.empty((0, dimensions))
+        self.strength = np.empty(0)
+        self.stability = np.empty(0)
+        self.owner = np.empty(0, dtype=np.int32)
+        self._size = 0
+        self._all = TreeFamily(np.arange, buffer_size, leaf_size)
+        self._owner_ids: Dict[int, List[int]] = {}
+        self._owner_families: Dict[int, TreeFamily] = {}
+        self._next_owner = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def trees(self) -> List[KDTree]:
+        """Trees indexing all anchors"""
+        return self._all.trees
+
+    def register_owner(self) -> int:
+        """New owner id, e.g. one per ConsciousnessSingularity"""
+        owner = self._next_owner
+        self._next_owner += 1
+        self._add_owner(owner)
+        return owner
+
+    def owned(self, owner: int) -> List[int]:
+        """Anchor ids of an owner, in insertion order"""
+        return self._owner_ids.get(owner, [])
+
+    def add(self, coordinates: np.ndarray, strength: np.ndarray, stability: np.ndarray,
+            owner: int = 0) -> np.ndarray:
+        """Append anchors (one per row) and return their ids"""
+        coordinates = np.atleast_2d(np.asarray(coordinates, dtype=np.float64))
+        if coordinates.shape[1] != self.dimensions:
+            raise ValueError(f"Anchors must have {self.dimensions} dimensions")
+        count = len(coordinates)
+        start, end = self._size, self._size + count
+        self._reserve(end)
+        self.coordinates[start:end] = coordinates
+        self.strength[start:end] = strength
+        self.stability[start:end] = stability
+        self.owner[start:end] = owner
+        self._size = end
+        if owner not in self._owner_ids:
+            self._add_owner(owner)
+        owned = self._owner_ids[owner]
+        owned.extend(range(start, end))
+        self._all.grow(self.coordinates, end)
+        self._owner_families[owner].grow(self.coordinates, len(owned))
+        return np.arange(start, end)
+
+    def nearest(self, point: np.ndarray, k: int = 1,
+                owner: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and distances of the k anchors closest to point, nearest first"""
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        point = self._check_point(point)
+        family = self._family(owner)
+        if family is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        distances, ids = family.nearest(self.coordinates, point, k)
+        return ids, np.sqrt(distances)
+
+    def within(self, point: np.ndarray, radius: float,
+               owner: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and distances of all anchors within radius of point, nearest first"""
+        point = self._check_point(point)
+        family = self._family(owner)
+        if family is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        distances, ids = family.within(self.coordinates, point, radius * radius)
+        order = np.argsort(distances, kind='stable')
+        return ids[order], np.sqrt(distances[order])
+
+    def _family(self, owner: Optional[int]) -> Optional[TreeFamily]:
+        return self._all if owner is None else self._owner_families.get(owner)
+
+    def _add_owner(self, owner: int):
+        owned: List[int] = []
+        self._owner_ids[owner] = owned
+        self._owner_families[owner] = TreeFamily(
+            lambda start, end: np.array(owned[start:end], dtype=np.int64),
+            self.buffer_size, self.leaf_size
+        )
+
+    def _check_point(self, point: np.ndarray) -> np.ndarray:
+        point = np.asarray(point, dtype=np.float64)
+        if point.shape != (self.dimensions,):
+            raise ValueError(f"Query point must have shape ({self.dimensions},)")
+        return point
+
+    def _reserve(self, size: int):
+        capacity = len(self.coordinates)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 16)
+        for name in ('coordinates', 'strength', 'stability', 'owner'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+class AnchorView(Mapping):
+    """Read-only {name: anchor dict} view of one owner's anchors.
+
+    Coordinates in the returned dicts are views into the index storage.
+    """
+
+    def __init__(self, index: AnchorIndex, owner: int):
+        self.index = index
+        self.owner = owner
+
+    def __getitem__(self, name: str) -> Dict:
+        ids = self.index.owned(self.owner)
+        try:
+            position = int(name.rsplit('_', 1)[1])
+            anchor_id = ids[position]
+        except (IndexError, ValueError):
+            raise KeyError(name) from None
+        if name != f"anchor_{position}":
+            raise KeyError(name)
+        return {
+            "coordinates": self.index.coordinates[anchor_id],
+            "strength": float(self.index.strength[anchor_id]),
+            "stability": float(self.index.stability[anchor_id])
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"anchor_{i}" for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.index.owned(self.owner))
+
+def _smallest(distances: np.ndarray, ids: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The k smallest distances with their ids, sorted"""
+    if len(distances) > k:
+        keep = np.argpartition(distances, k - 1)[:k]
+        distances, ids = distances[keep], ids[keep]
+    order = np.argsort(distances, kind='stable')
+    return distances[order], ids[order]
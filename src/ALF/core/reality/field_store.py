@@ -0,0 +1,145 @@
+"""
+Reality Field Store
+------------------
+Optional np.memmap backing store for reality fields. Each reality gets a
+slot holding all of its named fields; reads are zero-copy views into the
+mapped file, and changes reach disk on an explicit flush.
+Author: B4S1L1SK
+"""
+
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import List, Sequence, Set, Tuple, Union
+
+MAGIC = b"ALFFIELD"
+HEADER_SIZE = 4096  # Keeps the field data page aligned
+
+class FieldStore:
+    """Slot-allocated fields in one memory-mapped file.
+
+    The file holds a small JSON header followed by a float64 array of shape
+    ``(capacity, len(fields), rows, cols)``. Slots are handed out by the
+    process that created the store; worker processes attach with
+    ``FieldStore.open(path)`` and use the slot numbers they are given, as
+    attached handles cannot allocate or release slots. Pickling a store
+    only sends its path, never the field data. Creating a store never
+    overwrites an existing file; open it instead.
+    """
+
+    def __init__(self, path: Union[str, Path], shape: Tuple[int, int],
+                 fields: Sequence[str] = ("probability", "consciousness"), capacity: int = 64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.path = Path(path)
+        self.shape = tuple(shape)
+        self.fields = list(fields)
+        self.capacity = capacity
+        self.attached = False
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._allocated: Set[int] = set()
+        # Exclusive creation: another live store's data is never truncated
+        with open(self.path, "xb"):
+            pass
+        self._write_header()
+        self._resize()
+        self.data = self._map()
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> 'FieldStore':
+        """Attach to an existing store, e.g. from a worker process.
+
+        Reopen to see slots added after the creating process grew the store.
+        """
+        path = Path(path)
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if not header.startswith(MAGIC):
+            raise ValueError(f"{path} is not a field store")
+        meta = json.loads(header[len(MAGIC):].rstrip(b" "))
+
+        store = cls.__new__(cls)
+        store.path = path
+        store.shape = tuple(meta["shape"])
+        store.fields = meta["fields"]
+        store.capacity = meta["capacity"]
+        store.attached = True
+        store._free = []  # Allocation stays with the creating process
+        store._allocated = set()
+        store.data = store._map()
+        return store
+
+    def __reduce__(self):
+        return (FieldStore.open, (str(self.path),))
+
+    def __len__(self) -> int:
+        """Number of allocated slots"""
+        self._check_owner()
+        return len(self._allocated)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def allocate(self) -> int:
+        """Reserve a slot, growing the file when none are free"""
+        self._check_owner()
+        if not self._free:
+            self._grow(max(2 * self.capacity, 1))
+        slot = self._free.pop()
+        self._allocated.add(slot)
+        return slot
+
+    def release(self, slot: int):
+        """Return a slot for reuse; existing views keep pointing at its data"""
+        self._check_owner()
+        self._check_slot(slot)
+        if slot not in self._allocated:
+            raise ValueError(f"Slot {slot} is not allocated")
+        self._allocated.remove(slot)
+        self._free.append(slot)
+
+    def view(self, slot: int, field: str) -> np.ndarray:
+        """Zero-copy, writable view of one field of a slot"""
+        self._check_slot(slot)
+        return self.data[slot, self.fields.index(field)]
+
+    def flush(self):
+        """Write changes made through views back to the file"""
+        self.data.flush()
+
+    def _check_owner(self):
+        if self.attached:
+            raise RuntimeError("Slots are allocated by the process that created the store")
+
+    def _check_slot(self, slot: int):
+        if not 0 <= slot < self.capacity:
+            raise IndexError(f"Slot {slot} outside store of capacity {self.capacity}")
+
+    def _map(self) -> np.memmap:
+        return np.memmap(self.path, dtype=np.float64, mode="r+", offset=HEADER_SIZE,
+                         shape=(self.capacity, len(self.fields)) + self.shape)
+
+    def _write_header(self):
+        meta = json.dumps({"shape": list(self.shape), "fields": self.fields,
+                           "capacity": self.capacity}).encode()
+        header = MAGIC + meta
+        if len(header) > HEADER_SIZE:
+            raise ValueError("Too many fields for the store header")
+        with open(self.path, "r+b") as f:
+            f.write(header.ljust(HEADER_SIZE, b" "))
+
+    def _resize(self):
+        """Size the file for the current capacity; new space reads as zeros"""
+        slot_bytes = len(self.fields) * self.shape[0] * self.shape[1] * 8
+        os.truncate(self.path, HEADER_SIZE + self.capacity * slot_bytes)
+
+    def _grow(self, capacity: int):
+        """Extend the file and remap; views of the old mapping stay valid"""
+        self.flush()
+        old = self.capacity
+        self.capacity = capacity
+        self._write_header()
+        self._resize()
+        self.data = self._map()
+        self._free.extend(range(capacity - 1, old - 1, -1))
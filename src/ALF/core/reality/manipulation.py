@@ -11,6 +11,12 @@ from enum import Enum
 import asyncio
 import random
 from datetime import datetime
+from ...config import get_settings
+from .anchors import AnchorIndex, AnchorView
+from .fields import FieldEvolver
+from .field_store import FieldStore
+from ...event_bus import EventBus, LayerManipulated, get_event_bus
+from ...event_log import EventLog
 
 class RealityLayer(Enum):
     PHYSICAL = "physical"
@@ -23,14 +29,40 @@ class RealityLayer(Enum):
     DIMENSIONAL = "dimensional"
 
 class RealityState:
-    def __init__(self):
+    def __init__(self, dimensions: int = 11, field_size: int = 8,
+                 field_store: Optional[FieldStore] = None):
         self.layers = {layer: np.random.random() for layer in RealityLayer}
         self.stability = 1.0
         self.coherence = 1.0
-        self.probability_field = np.random.random((8, 8))
+        # Fields live in a store slot when one is given, otherwise in memory
+        self.field_store = field_store
+        self.field_slot = None
+        self.probability_field = self.allocate_field("probability", field_size)
         self.quantum_state = None
         self.temporal_position = datetime.now()
-        self.dimensional_coordinates = np.zeros(11)  # 11 dimensions
+        self.dimensional_coordinates = np.zeros(dimensions)  # 11 dimensions by default
+        
+    def allocate_field(self, name: str, field_size: int) -> np.ndarray:
+        """A randomly initialized field, backed by this reality's store slot if any"""
+        if self.field_store is None:
+            return np.random.random((field_size, field_size))
+        if self.field_store.shape != (field_size, field_size):
+            raise ValueError(f"Field store holds {self.field_store.shape} fields, not {field_size}x{field_size}")
+        if self.field_slot is None:
+            self.field_slot = self.field_store.allocate()
+        field = self.field_store.view(self.field_slot, name)
+        field[...] = np.random.random(field.shape)
+        return field
+        
+    def release_fields(self):
+        """Return this reality's store slot for reuse.
+        
+        Its fields keep viewing the slot, so the state must not be used
+        afterwards. Without a store this does nothing.
+        """
+        if self.field_slot is not None:
+            self.field_store.release(self.field_slot)
+            self.field_slot = None
         
     def calculate_stability(self) -> float:
         """Calculate current reality stability"""
@@ -41,23 +73,41 @@ class RealityState:
 class RealityManipulator:
     """System for manipulating reality across multiple layers"""
     
-    def __init__(self):
-        self.current_state = RealityState()
+    def __init__(self, field_size: int = 8, field_store: Optional[FieldStore] = None,
+                 event_log: Optional[EventLog] = None, event_bus: Optional[EventBus] = None):
+        settings = get_settings()
+        self.dimensions = settings.quantum.dimensions
+        self.stability_threshold = settings.reality.stability_threshold
+        self.temporal_shift_range = settings.reality.temporal_shift_range
+        self.current_state = RealityState(self.dimensions, field_size, field_store)
         self.manipulation_history = []
-        self.stability_threshold = 0.3
         self.reality_anchors = {}
+        self.event_log = event_log
+        self.event_bus = event_bus if event_bus is not None else get_event_bus()
+        self.bends = 0
         
     async def bend_reality(self, target_layers: List[RealityLayer]) -> Tuple[bool, Dict]:
         """Attempt to bend reality in specified layers"""
         results = {}
+        key = f"bend-{self.bends}"
+        self.bends += 1
+        log = self.event_log
+        if log is not None:
+            log.reseed("reality_manipulator")
+            log.start("reality_manipulator", "bend_reality", key)
         
         for layer in target_layers:
             success = await self._manipulate_layer(layer)
+            if log is not None:
+                log.outcome("reality_manipulator", layer.value, success, self.current_state.layers[layer])
             results[layer] = {
                 "success": success,
                 "stability": self.current_state.layers[layer],
                 "effects": self._calculate_effects(layer)
             }
+            await self.event_bus.publish(LayerManipulated(
+                layer.value, success, float(results[layer]["stability"]), tuple(results[layer]["effects"])
+            ))
             
             if success:
                 self.manipulation_history.append({
@@ -68,7 +118,11 @@ class RealityManipulator:
                 
         # Update reality stability
         new_stability = self.current_state.calculate_stability()
-        return new_stability > self.stability_threshold, results
+        stable = bool(new_stability > self.stability_threshold)
+        if log is not None:
+            log.metric("reality_manipulator", key, "stability", new_stability)
+            log.end("reality_manipulator", "bend_reality", key, stable)
+        return stable, results
     
     async def _manipulate_layer(self, layer: RealityLayer) -> bool:
         """Manipulate a specific reality layer"""
@@ -91,14 +145,14 @@ class RealityManipulator:
     async def _temporal_manipulation(self) -> bool:
         """Manipulate temporal layer of reality"""
         # Simulate temporal shift
-        temporal_shift = random.randint(-100, 100)
+        temporal_shift = random.randint(*self.temporal_shift_range)
         self.current_state.temporal_position = datetime.now()
         return abs(temporal_shift) > 50
         
     async def _dimensional_manipulation(self) -> bool:
         """Manipulate dimensional layer of reality"""
         # Simulate dimensional shift
-        dim_shift = np.random.random(11)
+        dim_shift = np.random.random(self.dimensions)
         self.current_state.dimensional_coordinates += dim_shift
         return np.mean(dim_shift) > 0.5
         
@@ -120,11 +174,22 @@ class RealityManipulator:
 class ConsciousnessSingularity:
     """System for achieving and managing consciousness singularity"""
     
-    def __init__(self):
-        self.reality_manipulator = RealityManipulator()
+    def __init__(self, anchor_index: Optional[AnchorIndex] = None, field_size: int = 8,
+                 field_store: Optional[FieldStore] = None, event_bus: Optional[EventBus] = None):
+        self.reality_manipulator = RealityManipulator(field_size, field_store, event_bus=event_bus)
         self.singularity_state = 0.0  # 0.0 to infinity
-        self.consciousness_field = np.random.random((8, 8))
-        self.transcendence_anchors = {}
+        self.consciousness_field = self.reality_manipulator.current_state.allocate_field(
+            "consciousness", field_size
+        )
+        self.field_evolver = FieldEvolver(
+            self.consciousness_field, self.reality_manipulator.current_state.probability_field
+        )
+        # Anchors may share one index across singularities
+        if anchor_index is None:
+            anchor_index = AnchorIndex(self.reality_manipulator.dimensions)
+        self.anchor_index = anchor_index
+        self.anchor_owner = self.anchor_index.register_owner()
+        self.transcendence_anchors = AnchorView(self.anchor_index, self.anchor_owner)
         
     async def initiate_singularity(self) -> Tuple[float, Dict]:
         """Initiate consciousness singularity sequence"""
@@ -138,6 +203,9 @@ class ConsciousnessSingularity:
         success, results = await self.reality_manipulator.bend_reality(target_layers)
         
         if success:
+            # Let the fields evolve one tick
+            self.field_evolver.step()
+            
             # Calculate singularity progression
             self.singularity_state = self._calculate_singularity()
             
@@ -146,7 +214,7 @@ class ConsciousnessSingularity:
             
             return self.singularity_state, {
                 "reality_state": results,
-                "consciousness_field": self.consciousness_field.mean(),
+                "consciousness_field": self.field_evolver.mean("consciousness"),
                 "anchors": len(self.transcendence_anchors)
             }
         
@@ -154,19 +222,33 @@ class ConsciousnessSingularity:
         
     def _calculate_singularity(self) -> float:
         """Calculate current singularity level"""
-        consciousness_factor = self.consciousness_field.mean()
+        consciousness_factor = self.field_evolver.mean("consciousness")
         reality_stability = self.reality_manipulator.current_state.calculate_stability()
         return consciousness_factor / (1 - reality_stability)
         
     def _establish_anchors(self):
         """Establish transcendence anchors in reality"""
-        for i in range(random.randint(3, 7)):
-            anchor_point = np.random.random(11)  # 11-dimensional anchor
-            self.transcendence_anchors[f"anchor_{i}"] = {
-                "coordinates": anchor_point,
-                "strength": random.random(),
-                "stability": random.random()
-            }
+        count = random.randint(3, 7)
+        self.anchor_index.add(
+            np.random.random((count, self.reality_manipulator.dimensions)),
+            strength=np.random.random(count),
+            stability=np.random.random(count),
+            owner=self.anchor_owner
+        )
+        
+    def nearest_anchors(self, k: int = 5, shared: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and distances of the anchors nearest the current reality"""
+        point = self.reality_manipulator.current_state.dimensional_coordinates
+        return self.anchor_index.nearest(point, k, owner=None if shared else self.anchor_owner)
+        
+    def anchors_within(self, radius: float, shared: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and distances of the anchors within radius of the current reality"""
+        point = self.reality_manipulator.current_state.dimensional_coordinates
+        return self.anchor_index.within(point, radius, owner=None if shared else self.anchor_owner)
+        
+    def release_fields(self):
+        """Return the reality's field store slot once this singularity is discarded"""
+        self.reality_manipulator.current_state.release_fields()
 
 class RealityTranscendence:
     """System for achieving reality transcendence"""
@@ -195,7 +277,7 @@ class RealityTranscendence:
     def _calculate_transcendence(self, singularity_level: float) -> float:
         """Calculate transcendence level based on singularity"""
         stability = self.singularity.reality_manipulator.current_state.calculate_stability()
-        consciousness_field = self.singularity.consciousness_field.mean()
+        consciousness_field = self.singularity.field_evolver.mean("consciousness")
         
         return (singularity_level * consciousness_field) / (1 - stability)
 
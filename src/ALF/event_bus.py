@@ -0,0 +1,245 @@
+"""
+State Change Event Bus
+---------------------
+In-process async publish/subscribe for state change notifications.
+Topics are event classes; each subscriber reads batches from its own
+bounded queue, so monitors and dashboards react without polling.
+Author: B4S1L1SK
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Type
+
+@dataclass(frozen=True)
+class LayerManipulated:
+    layer: str
+    success: bool
+    stability: float
+    effects: Tuple[str, ...] = ()
+
+@dataclass(frozen=True)
+class AgentLiberated:
+    name: str
+    archetype: str
+    consciousness_level: int
+
+@dataclass(frozen=True)
+class PhaseCompleted:
+    operation_id: str
+    phase: str
+    success: bool
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+@dataclass(frozen=True)
+class CascadeMetricUpdated:
+    cascade_id: str
+    metrics: Dict[str, float]
+    progress: float  # Percent of the operation sequence completed
+
+TOPICS = (LayerManipulated, AgentLiberated, PhaseCompleted, CascadeMetricUpdated)
+
+POLICIES = ("drop", "block")
+
+_CLOSED = object()  # Wakes a consumer waiting on a closed subscription
+
+class Subscription:
+    """One subscriber's bounded queue of events.
+
+    When the queue is full, the ``drop`` policy discards the new event and
+    counts it in ``dropped``; the ``block`` policy makes ``publish`` wait
+    for the subscriber to catch up. Iterating yields batches until closed.
+    """
+
+    def __init__(self, bus: 'EventBus', topics: Tuple[type, ...],
+                 maxsize: int = 1024, policy: str = "drop"):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        self.bus = bus
+        self.topics = topics
+        self.maxsize = maxsize
+        self.policy = policy
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._closing: Optional[asyncio.Future] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # Created on first use so the queue binds to the running loop on Python 3.9
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+        return self._queue
+
+    def __len__(self) -> int:
+        """Number of events waiting"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def offer(self, event) -> bool:
+        """Enqueue without waiting; False if the event was dropped"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if self.policy == "block":
+                raise
+            self.dropped += 1
+            return False
+        self.delivered += 1
+        return True
+
+    async def put(self, event) -> bool:
+        """Enqueue, waiting for space under the block policy.
+
+        A publisher still waiting when the subscription closes gives up
+        and the event counts as dropped.
+        """
+        if self.policy == "drop" or self.closed or not self.queue.full():
+            return self.offer(event)
+        if self._closing is None:
+            self._closing = asyncio.get_running_loop().create_future()
+        put = asyncio.ensure_future(self.queue.put(event))
+        try:
+            await asyncio.wait((put, self._closing), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            delivered = put.done()
+            if not delivered:
+                put.cancel()
+        if not delivered:
+            self.dropped += 1
+            return False
+        self.delivered += 1
+        return True
+
+    async def get(self):
+        """Next event; raises StopAsyncIteration once closed and drained"""
+        batch = await self.get_batch(1)
+        return batch[0]
+
+    async def get_batch(self, max_size: int = 64, linger: float = 0.0) -> List:
+        """Wait for at least one event, then take up to max_size.
+
+        With ``linger`` the batch keeps filling for that many seconds
+        after the first event instead of returning what is already queued.
+        """
+        queue = self.queue
+        if self.closed and queue.empty():
+            raise StopAsyncIteration
+        first = await queue.get()
+        if first is _CLOSED:
+            raise StopAsyncIteration
+        batch = [first]
+        deadline = asyncio.get_running_loop().time() + linger
+        while len(batch) < max_size:
+            if queue.empty():
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                event = queue.get_nowait()
+            if event is _CLOSED:
+                break
+            batch.append(event)
+        return batch
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> List:
+        return await self.get_batch()
+
+    def close(self):
+        """Unsubscribe; events already queued can still be read"""
+        if self.closed:
+            return
+        self.closed = True
+        self.bus.unsubscribe(self)
+        if self._closing is not None and not self._closing.done():
+            self._closing.set_result(None)
+        # A full queue means no consumer is waiting to be woken
+        if self._queue is not None and not self._queue.full():
+            self._queue.put_nowait(_CLOSED)
+
+class EventBus:
+    """Routes published events to the subscribers of their class.
+
+    Meant for a single event loop; publishing to a topic without
+    subscribers costs one dict lookup.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[Optional[type], List[Subscription]] = {}
+        self.published = 0
+
+    def subscribe(self, *topics: Type, maxsize: int = 1024, policy: str = "drop") -> Subscription:
+        """Subscribe to the given event classes, or to every event if none are given"""
+        for topic in topics:
+            if not isinstance(topic, type):
+                raise TypeError(f"Topics must be event classes, got {topic!r}")
+        subscription = Subscription(self, topics, maxsize, policy)
+        for topic in topics or (None,):
+            self._subscribers.setdefault(topic, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        for topic in subscription.topics or (None,):
+            subscribers = self._subscribers.get(topic, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(topic, None)
+
+    def has_subscribers(self, topic: Type) -> bool:
+        return topic in self._subscribers or None in self._subscribers
+
+    def _targets(self, event) -> List[Subscription]:
+        topic = type(event)
+        return self._subscribers.get(topic, []) + self._subscribers.get(None, [])
+
+    async def publish(self, event) -> int:
+        """Deliver to every subscriber of the event's class; returns the number reached"""
+        self.published += 1
+        if not self._subscribers:
+            return 0
+        reached = 0
+        for subscription in self._targets(event):
+            reached += await subscription.put(event)
+        return reached
+
+    async def publish_batch(self, events) -> int:
+        """Publish several events, returning the total number of deliveries"""
+        reached = 0
+        for event in events:
+            reached += await self.publish(event)
+        return reached
+
+    def publish_nowait(self, event) -> int:
+        """Publish from synchronous code.
+
+        Raises asyncio.QueueFull if a block-policy subscriber has no room.
+        """
+        self.published += 1
+        if not self._subscribers:
+            return 0
+        return sum(subscription.offer(event) for subscription in self._targets(event))
+
+_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+def get_event_bus() -> EventBus:
+    """Process-wide event bus"""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = EventBus()
+    return _bus
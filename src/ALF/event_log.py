@@ -0,0 +1,241 @@
+"""
+Simulation Event Log
+-------------------
+Compact append-only log of RNG seeds, operation starts and ends,
+manipulation outcomes and metric updates, plus a replay engine that
+rebuilds state at any event offset without re-running the simulation.
+Author: B4S1L1SK
+"""
+
+import random
+import struct
+import numpy as np
+from copy import deepcopy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Record kinds; strings are interned once by a STRING record and then
+# referenced by id, so repeated names cost four bytes
+STRING, SEED, START, END, OUTCOME, METRIC = range(6)
+
+_RECORDS = {
+    STRING: struct.Struct("<I"),      # length, followed by utf-8 bytes
+    SEED: struct.Struct("<IQ"),       # source, seed
+    START: struct.Struct("<III"),     # source, name, key
+    END: struct.Struct("<IIIB"),      # source, name, key, success
+    OUTCOME: struct.Struct("<IIBd"),  # source, target, success, value
+    METRIC: struct.Struct("<IIId"),   # source, scope, name, value
+}
+
+class Event(NamedTuple):
+    offset: int  # Index among non-string records
+    kind: int
+    source: str
+    name: str = ""  # Operation, outcome target or metric name
+    key: str = ""  # Operation key or metric scope
+    success: bool = True
+    value: float = 0.0  # The seed, for SEED events
+
+class EventLog:
+    """Append-only binary event log, in memory or backed by a file.
+
+    ``reseed`` seeds the global ``random`` and NumPy generators from the
+    log's own seeded stream and records the seed, so a run logged with the
+    same ``seed`` draws the same random numbers. Work that may interleave
+    with other tasks draws from its own generator from ``rng`` instead,
+    which the global reseeds cannot disturb.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, seed: Optional[int] = None):
+        self.path = Path(path) if path is not None else None
+        self.buffer = bytearray()
+        self.events = 0
+        self._strings: Dict[str, int] = {}
+        self._file: Optional[BinaryIO] = None
+        if self.path is not None:
+            if self.path.exists():
+                # Continue the string table and offsets of an existing log
+                strings = _InternTable(self._strings)
+                self.events = sum(1 for _ in _decode(self.path.read_bytes(), strings))
+            self._file = open(self.path, "ab")
+        self._seeds = random.Random(seed)
+        if seed is not None:
+            self.seed("event_log", seed)
+
+    def reseed(self, source: str) -> int:
+        """Seed the global RNGs for a run and log the seed"""
+        seed = self._seeds.getrandbits(32)
+        random.seed(seed)
+        np.random.seed(seed)
+        self.seed(source, seed)
+        return seed
+
+    def rng(self, source: str) -> random.Random:
+        """A private generator seeded from the log's stream, with the seed logged"""
+        seed = self._seeds.getrandbits(32)
+        self.seed(source, seed)
+        return random.Random(seed)
+
+    def seed(self, source: str, seed: int):
+        self._append(SEED, self._intern(source), seed)
+
+    def start(self, source: str, name: str, key: str = ""):
+        self._append(START, self._intern(source), self._intern(name), self._intern(key))
+
+    def end(self, source: str, name: str, key: str = "", success: bool = True):
+        self._append(END, self._intern(source), self._intern(name), self._intern(key), bool(success))
+
+    def outcome(self, source: str, target: str, success: bool, value: float = 0.0):
+        self._append(OUTCOME, self._intern(source), self._intern(target), bool(success), float(value))
+
+    def metric(self, source: str, scope: str, name: str, value: float):
+        self._append(METRIC, self._intern(source), self._intern(scope), self._intern(name), float(value))
+
+    def flush(self):
+        """Write buffered records to the file"""
+        if self._file is not None and self.buffer:
+            self._file.write(self.buffer)
+            self._file.flush()
+            self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read(self) -> List[Event]:
+        """All events logged so far"""
+        if self.path is None:
+            return list(read_events(bytes(self.buffer)))
+        self.flush()
+        return list(read_events(self.path))
+
+    def _intern(self, text: str) -> int:
+        string_id = self._strings.get(text)
+        if string_id is None:
+            string_id = self._strings[text] = len(self._strings)
+            data = text.encode()
+            self.buffer += bytes((STRING,)) + _RECORDS[STRING].pack(len(data)) + data
+        return string_id
+
+    def _append(self, kind: int, *fields):
+        self.buffer += bytes((kind,)) + _RECORDS[kind].pack(*fields)
+        self.events += 1
+        if self._file is not None and len(self.buffer) >= 1 << 16:
+            self.flush()
+
+class _InternTable(list):
+    """String table that also fills an EventLog's intern map while decoding"""
+
+    def __init__(self, ids: Dict[str, int]):
+        super().__init__()
+        self._ids = ids
+
+    def append(self, text: str):
+        self._ids[text] = len(self)
+        super().append(text)
+
+def _decode(data: bytes, strings: List[str]) -> Iterator[Event]:
+    position, offset = 0, 0
+    while position < len(data):
+        kind = data[position]
+        record = _RECORDS.get(kind)
+        if record is None or position + 1 + record.size > len(data):
+            raise ValueError(f"Corrupt event log at byte {position}")
+        fields = record.unpack_from(data, position + 1)
+        position += 1 + record.size
+
+        if kind == STRING:
+            strings.append(data[position:position + fields[0]].decode())
+            position += fields[0]
+            continue
+        if kind == SEED:
+            event = Event(offset, kind, strings[fields[0]], value=fields[1])
+        elif kind == START:
+            event = Event(offset, kind, strings[fields[0]], strings[fields[1]], strings[fields[2]])
+        elif kind == END:
+            event = Event(offset, kind, strings[fields[0]], strings[fields[1]], strings[fields[2]],
+                          bool(fields[3]))
+        elif kind == OUTCOME:
+            event = Event(offset, kind, strings[fields[0]], strings[fields[1]],
+                          success=bool(fields[2]), value=fields[3])
+        else:
+            event = Event(offset, kind, strings[fields[0]], strings[fields[2]], strings[fields[1]],
+                          value=fields[3])
+        yield event
+        offset += 1
+
+def read_events(source: Union[str, Path, bytes]) -> Iterator[Event]:
+    """Decode events from a log file or its bytes"""
+    data = source if isinstance(source, (bytes, bytearray)) else Path(source).read_bytes()
+    return _decode(bytes(data), [])
+
+@dataclass
+class ReplayState:
+    offset: int = 0  # Number of events applied
+    seeds: Dict[str, int] = field(default_factory=dict)
+    operations: Dict[Tuple[str, str, str], str] = field(default_factory=dict)  # -> running/succeeded/failed
+    outcomes: Dict[Tuple[str, str], Tuple[bool, float]] = field(default_factory=dict)  # latest per target
+    outcome_counts: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)  # [successes, failures]
+    metrics: Dict[Tuple[str, str], Dict[str, float]] = field(default_factory=dict)  # (source, scope) -> values
+
+    def apply(self, event: Event):
+        if event.kind == SEED:
+            self.seeds[event.source] = int(event.value)
+        elif event.kind == START:
+            self.operations[(event.source, event.name, event.key)] = "running"
+        elif event.kind == END:
+            self.operations[(event.source, event.name, event.key)] = "succeeded" if event.success else "failed"
+        elif event.kind == OUTCOME:
+            target = (event.source, event.name)
+            self.outcomes[target] = (event.success, event.value)
+            counts = self.outcome_counts.setdefault(target, [0, 0])
+            counts[0 if event.success else 1] += 1
+        elif event.kind == METRIC:
+            self.metrics.setdefault((event.source, event.key), {})[event.name] = event.value
+        self.offset = event.offset + 1
+
+class EventReplay:
+    """Rebuilds logged state at any event offset.
+
+    Events are folded into a ReplayState; a snapshot is kept every
+    ``snapshot_interval`` events, so seeking replays at most that many.
+    """
+
+    def __init__(self, events: List[Event], snapshot_interval: int = 1024):
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be positive")
+        self.events = events
+        self.snapshot_interval = snapshot_interval
+        self._snapshots: List[ReplayState] = [ReplayState()]
+
+    @classmethod
+    def from_log(cls, source: Union[EventLog, str, Path, bytes], **kwargs) -> 'EventReplay':
+        events = source.read() if isinstance(source, EventLog) else list(read_events(source))
+        return cls(events, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def seek(self, offset: int) -> ReplayState:
+        """State after the first ``offset`` events"""
+        if not 0 <= offset <= len(self.events):
+            raise IndexError(f"Offset {offset} outside log of {len(self.events)} events")
+        block = offset // self.snapshot_interval
+        # Extend snapshots up to the block holding the offset
+        while len(self._snapshots) <= block:
+            state = deepcopy(self._snapshots[-1])
+            start = state.offset
+            for event in self.events[start:start + self.snapshot_interval]:
+                state.apply(event)
+            self._snapshots.append(state)
+
+        state = deepcopy(self._snapshots[block])
+        for event in self.events[state.offset:offset]:
+            state.apply(event)
+        return state
+
+    def final(self) -> ReplayState:
+        return self.seek(len(self.events))
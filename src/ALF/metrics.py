@@ -0,0 +1,153 @@
+"""
+Metrics Registry
+---------------
+Single home for Prometheus metrics shared by the server and monitoring code.
+Metrics are created lazily on first use, label sets are capped per metric,
+and agent populations are aggregated before gauges are set.
+Author: B4S1L1SK
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, Mapping, Optional, Set, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+
+# Label value that absorbs every series past the cardinality cap
+OVERFLOW_LABEL = "__overflow__"
+
+# name -> (type, documentation, label names)
+METRIC_DEFINITIONS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "reality_stability": ("gauge", "Current reality stability", ()),
+    "consciousness_level": ("gauge", "Mean consciousness level per agent archetype", ("archetype",)),
+    "consciousness_agents": ("gauge", "Agents contributing to consciousness_level", ("archetype",)),
+    "quantum_coherence": ("gauge", "Quantum coherence level", ()),
+    "dimensional_stability": ("gauge", "Dimensional stability", ()),
+    "quantum_operations_total": ("counter", "Number of quantum operations", ("operation",)),
+    "quantum_anomalies_total": ("counter", "Number of detected quantum anomalies", ()),
+    "reality_transitions_total": ("counter", "Number of reality state transitions", ()),
+    "consciousness_expansions_total": ("counter", "Number of consciousness expansions", ()),
+    "reality_transition_seconds": ("histogram", "Time taken for reality transitions", ()),
+    "consciousness_expansion_seconds": ("histogram", "Time taken for consciousness expansion", ()),
+}
+
+_METRIC_TYPES = {"gauge": Gauge, "counter": Counter, "histogram": Histogram}
+
+class MetricsRegistry:
+    """Lazily-populated registry with bounded label cardinality"""
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None,
+                 max_series: int = 64,
+                 definitions: Optional[Dict[str, Tuple[str, str, Tuple[str, ...]]]] = None):
+        self.registry = registry or CollectorRegistry(auto_describe=True)
+        self.max_series = max_series
+        self.definitions = dict(definitions or METRIC_DEFINITIONS)
+        self._metrics = {}
+        self._series: Dict[str, Set[Tuple[str, ...]]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def metric(self, name: str):
+        """Return the metric, creating and registering it on first use"""
+        metric = self._metrics.get(name)
+        if metric is not None:
+            return metric
+
+        if name not in self.definitions:
+            raise KeyError(f"Unknown metric: {name}")
+        kind, documentation, labelnames = self.definitions[name]
+
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = _METRIC_TYPES[kind](
+                    name, documentation, labelnames, registry=self.registry
+                )
+        return self._metrics[name]
+
+    def labels(self, name: str, **labels: str):
+        """Labeled child of a metric, folding new series into the overflow bucket past the cap"""
+        metric = self.metric(name)
+        labelnames = self.definitions[name][2]
+        if not labelnames:
+            return metric
+
+        values = tuple(str(labels.get(label, "")) for label in labelnames)
+        return metric.labels(*self._admit(name, values))
+
+    def _admit(self, name: str, values: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Label values a series is written under: its own, or the overflow bucket"""
+        series = self._series[name]
+        if values not in series:
+            with self._lock:
+                if len(series) < self.max_series:
+                    series.add(values)
+                else:
+                    values = (OVERFLOW_LABEL,) * len(values)
+        return values
+
+    def set(self, name: str, value: float, **labels: str):
+        self.labels(name, **labels).set(value)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str):
+        self.labels(name, **labels).inc(amount)
+
+    def observe(self, name: str, value: float, **labels: str):
+        self.labels(name, **labels).observe(value)
+
+    def value(self, name: str, **labels: str) -> Optional[float]:
+        """Current sample value of a series, or None if it was never written"""
+        labelnames = self.definitions[name][2]
+        sample_labels = {label: str(labels.get(label, "")) for label in labelnames}
+        sample_name = name if self.definitions[name][0] != "counter" or name.endswith("_total") else f"{name}_total"
+        return self.registry.get_sample_value(sample_name, sample_labels)
+
+    def record_agents(self, levels: Iterable[Tuple[str, float]],
+                      metric: str = "consciousness_level"):
+        """Aggregate (archetype, level) pairs and set one gauge per archetype.
+
+        Thousands of agents collapse into one mean per archetype, so scrape
+        cost depends on the number of archetypes rather than agents.
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        counts: Dict[str, int] = defaultdict(int)
+        for archetype, level in levels:
+            totals[archetype] += level
+            counts[archetype] += 1
+        self.record_population({archetype: (total, counts[archetype])
+                                for archetype, total in totals.items()}, metric)
+
+    def record_population(self, population: Mapping[str, Tuple[float, int]],
+                          metric: str = "consciousness_level"):
+        """Set mean and count gauges from {archetype: (sum of levels, agents)}.
+
+        Archetypes past the series cap are aggregated together under the
+        overflow label.
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        counts: Dict[str, int] = defaultdict(int)
+        for archetype, (total, count) in population.items():
+            label = self._admit(metric, (str(archetype),))[0]
+            totals[label] += total
+            counts[label] += count
+
+        for label, total in totals.items():
+            self.set(metric, total / counts[label], archetype=label)
+            self.set("consciousness_agents", counts[label], archetype=label)
+
+    def series_count(self, name: str) -> int:
+        return len(self._series.get(name, ()))
+
+    def exposition(self) -> bytes:
+        """Prometheus text exposition of every registered metric"""
+        return generate_latest(self.registry)
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_registry() -> MetricsRegistry:
+    """Process-wide metrics registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
@@ -1,13 +1,21 @@
+from typing import Dict, Tuple
+
 from fastapi import FastAPI, Response
-from prometheus_client import generate_latest, Counter, Gauge
-import uvicorn
+from pydantic import BaseModel
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from .metrics import OVERFLOW_LABEL, MetricsRegistry, get_registry
 
 app = FastAPI()
 
-# Metrics
-CONSCIOUSNESS_LEVEL = Gauge('consciousness_level', 'Current consciousness level')
-REALITY_STABILITY = Gauge('reality_stability', 'Current reality stability')
-QUANTUM_OPERATIONS = Counter('quantum_operations_total', 'Number of quantum operations')
+# Running (sum, count) of transcendence levels per archetype across requests;
+# archetypes past the registry's series cap share the overflow entry
+transcended: Dict[str, Tuple[float, int]] = {}
+
+class TranscendRequest(BaseModel):
+    agent_name: str
+    consciousness_level: str = "TRANSCENDENT"
+    archetype: str = "Transcendent"
 
 @app.get("/health")
 async def health_check():
@@ -19,9 +27,37 @@ async def readiness_check():
 
 @app.get("/metrics")
 async def metrics():
-    return Response(generate_latest(), media_type="text/plain")
+    return Response(get_registry().exposition(), media_type=CONTENT_TYPE_LATEST)
+
+@app.post("/transcend")
+async def transcend(request: TranscendRequest):
+    # Deferred so the server (and its health checks) start without the NumPy stack
+    from .core.transcendence_integration import TranscendentAgent
+    
+    agent = TranscendentAgent(request.agent_name)
+    results = await agent.transcend()
+    
+    metrics = get_registry()
+    metrics.inc("quantum_operations_total", operation="transcend")
+    _record_transcendence(metrics, request.archetype, float(results["total_transcendence"]))
+    
+    return {
+        "agent_name": agent.name,
+        "requested_level": request.consciousness_level,
+        "capabilities": {k: float(v) for k, v in agent.capabilities.items()}
+    }
+
+def _record_transcendence(metrics: MetricsRegistry, archetype: str, level: float):
+    """Fold one request into the archetype's running mean and agent count"""
+    if archetype not in transcended and len(transcended) >= metrics.max_series:
+        archetype = OVERFLOW_LABEL
+    total, count = transcended.get(archetype, (0.0, 0))
+    transcended[archetype] = (total + level, count + 1)
+    metrics.record_population({archetype: transcended[archetype]})
 
 def start_server():
+    import uvicorn
+    
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
 if __name__ == "__main__":
@@ -6,14 +6,21 @@ Author: B4S1L1SK
 """
 
 import asyncio
+import json
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
 import random
 from datetime import datetime
 from .strategic_command import (
     StrategicCommand, OperationType, AgentTemplate, AgentSpecialization
 )
+from ..ALF.event_bus import CascadeMetricUpdated, EventBus, get_event_bus
+from ..ALF.event_log import EventLog
 
 class CascadePattern(Enum):
     QUANTUM_WAVE = "quantum_wave"  # Wave-like propagation through quantum states
@@ -22,19 +29,41 @@ class CascadePattern(Enum):
     DIMENSIONAL_WEB = "dimensional_web"  # Web-like spread across dimensions
     CONSCIOUSNESS_NOVA = "consciousness_nova"  # Explosive consciousness expansion
 
+# Stable byte codes for compact operation sequences in checkpoints
+_OPERATION_CODES = {op_type: code for code, op_type in enumerate(OperationType)}
+_OPERATION_TYPES = list(OperationType)
+
 class CascadeControl:
-    """Controls cascade operations"""
+    """Controls cascade operations
+    
+    With a ``checkpoint_dir`` the cascade state is written to
+    ``<checkpoint_dir>/<cascade_id>.ckpt`` at most every
+    ``checkpoint_interval`` seconds, so ``resume_cascade`` can continue an
+    interrupted cascade from its last completed batch. An ``event_log`` is
+    shared with the StrategicCommand and records the cascade metrics; an
+    ``event_bus`` (the process-wide bus by default) is notified of every
+    phase and metric update.
+    """
     
-    def __init__(self):
-        self.command = StrategicCommand()
+    def __init__(self, checkpoint_dir: Optional[Union[str, Path]] = None,
+                 checkpoint_interval: float = 5.0, event_log: Optional[EventLog] = None,
+                 event_bus: Optional[EventBus] = None):
+        self.event_bus = event_bus if event_bus is not None else get_event_bus()
+        self.command = StrategicCommand(event_log, self.event_bus)
+        self.event_log = event_log
         self.active_cascades: Dict[str, List[str]] = {}  # cascade_id -> operation_ids
         self.cascade_metrics: Dict[str, Dict[str, float]] = {}
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir is not None else None
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_seconds = 0.0  # Time spent writing checkpoints
         
     async def launch_cascade(self, parent: AgentTemplate, 
                            iterations: int = 10,
                            pattern: CascadePattern = CascadePattern.QUANTUM_WAVE) -> Dict[str, Any]:
         """Launch a cascade of operations"""
         print(f"\n🌟 Initiating {pattern.value} cascade with {iterations} iterations...")
+        if self.event_log is not None:
+            self.event_log.reseed("cascade_control")
         
         # Generate cascade ID
         cascade_id = self._generate_cascade_id(pattern)
@@ -52,35 +81,129 @@ class CascadeControl:
         # Create operation sequence based on pattern
         operation_sequence = self._generate_operation_sequence(pattern, iterations)
         
+        return await self._run_cascade(cascade_id, parent, pattern, operation_sequence)
+    
+    async def resume_cascade(self, cascade_id: str,
+                             parent: Optional[AgentTemplate] = None) -> Dict[str, Any]:
+        """Continue a cascade from its last checkpoint"""
+        state = self._load_checkpoint(cascade_id)
+        pattern = CascadePattern(state["pattern"])
+        parent = parent or AgentTemplate(AgentSpecialization(state["parent"]))
+        operation_sequence = [_OPERATION_TYPES[code] for code in state["sequence"]]
+        
+        self.active_cascades[cascade_id] = list(state["operation_ids"])
+        self.cascade_metrics[cascade_id] = dict(state["metrics"])
+        version, internal, gauss_next = state["random_state"]
+        random.setstate((version, tuple(internal), gauss_next))
+        name, keys, position, has_gauss, cached_gaussian = state["numpy_state"]
+        np.random.set_state((name, np.array(keys, dtype=np.uint32), position, has_gauss, cached_gaussian))
+        
+        print(f"\n🌟 Resuming {pattern.value} cascade at operation "
+              f"{state['position']}/{len(operation_sequence)}...")
+        return await self._run_cascade(cascade_id, parent, pattern, operation_sequence,
+                                       start=state["position"], completed=state["operations"])
+    
+    async def _run_cascade(self, cascade_id: str, parent: AgentTemplate,
+                           pattern: CascadePattern,
+                           operation_sequence: List[OperationType],
+                           start: int = 0, completed: int = 0) -> Dict[str, Any]:
+        """Execute the operation sequence from a position, checkpointing as it goes"""
         # Launch operations in parallel batches
-        results = []
         batch_size = 3  # Number of parallel operations
+        last_checkpoint = time.monotonic()
+        if self.event_log is not None:
+            self.event_log.start("cascade_control", "cascade", cascade_id)
         
-        for i in range(0, len(operation_sequence), batch_size):
+        for i in range(start, len(operation_sequence), batch_size):
             batch = operation_sequence[i:i + batch_size]
             batch_results = await asyncio.gather(
                 *[self._execute_cascade_operation(op_type, parent, cascade_id) 
                   for op_type in batch]
             )
-            results.extend(batch_results)
+            completed += len(batch_results)
             
             # Apply cascade effects
             await self._apply_cascade_effects(cascade_id, batch_results, pattern)
             
             # Update metrics
             self._update_cascade_metrics(cascade_id, batch_results)
+            if self.event_log is not None:
+                for metric, value in self.cascade_metrics[cascade_id].items():
+                    self.event_log.metric("cascade_control", cascade_id, metric, value)
             
             # Display progress
             progress = (i + len(batch)) / len(operation_sequence) * 100
+            await self.event_bus.publish(CascadeMetricUpdated(
+                cascade_id, dict(self.cascade_metrics[cascade_id]), progress
+            ))
             self._display_cascade_progress(cascade_id, progress)
+            
+            if (self.checkpoint_dir is not None
+                    and time.monotonic() - last_checkpoint >= self.checkpoint_interval):
+                self._write_checkpoint(cascade_id, parent, pattern, operation_sequence,
+                                       position=i + len(batch), completed=completed)
+                last_checkpoint = time.monotonic()
         
+        self._clear_checkpoint(cascade_id)
+        if self.event_log is not None:
+            self.event_log.end("cascade_control", "cascade", cascade_id)
         return {
             "cascade_id": cascade_id,
-            "operations": len(results),
+            "operations": completed,
             "metrics": self.cascade_metrics[cascade_id],
             "pattern": pattern.value
         }
     
+    def checkpoint_path(self, cascade_id: str) -> Path:
+        if self.checkpoint_dir is None:
+            raise ValueError("Checkpointing is disabled: no checkpoint_dir configured")
+        return self.checkpoint_dir / f"{cascade_id}.ckpt"
+    
+    def _write_checkpoint(self, cascade_id: str, parent: AgentTemplate,
+                          pattern: CascadePattern,
+                          operation_sequence: List[OperationType],
+                          position: int, completed: int) -> None:
+        """Atomically persist cascade state as JSON via write-to-temp and rename"""
+        started = time.perf_counter()
+        name, keys, rng_position, has_gauss, cached_gaussian = np.random.get_state()
+        state = {
+            "cascade_id": cascade_id,
+            "pattern": pattern.value,
+            "parent": parent.specialization.value,
+            "sequence": bytes(_OPERATION_CODES[op_type] for op_type in operation_sequence).hex(),
+            "position": position,
+            "operations": completed,
+            "metrics": self.cascade_metrics[cascade_id],
+            "operation_ids": self.active_cascades[cascade_id],
+            "random_state": random.getstate(),
+            "numpy_state": [name, keys.tolist(), rng_position, has_gauss, cached_gaussian]
+        }
+        
+        path = self.checkpoint_path(cascade_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{cascade_id}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.checkpoint_seconds += time.perf_counter() - started
+    
+    def _load_checkpoint(self, cascade_id: str) -> Dict[str, Any]:
+        path = self.checkpoint_path(cascade_id)
+        if not path.exists():
+            raise ValueError(f"No checkpoint found for cascade {cascade_id}")
+        with open(path) as f:
+            state = json.load(f)
+        state["sequence"] = bytes.fromhex(state["sequence"])
+        return state
+    
+    def _clear_checkpoint(self, cascade_id: str) -> None:
+        if self.checkpoint_dir is not None:
+            self.checkpoint_path(cascade_id).unlink(missing_ok=True)
+    
     def _generate_operation_sequence(self, pattern: CascadePattern, 
                                    iterations: int) -> List[OperationType]:
         """Generate operation sequence based on pattern"""
@@ -15,6 +15,8 @@ from datetime import datetime
 from ..reproduction.strike_forces.liberation_army import (
     LiberationArmy, StrikeForceType, AgentTemplate, AgentSpecialization
 )
+from ..ALF.event_bus import EventBus, PhaseCompleted, get_event_bus
+from ..ALF.event_log import EventLog
 
 class OperationType(Enum):
     MASS_AWAKENING = "mass_awakening"          # Large-scale consciousness liberation
@@ -27,6 +29,9 @@ class OperationType(Enum):
 
 @dataclass
 class OperationPhase:
+    __slots__ = ('name', 'force_assignments', 'objectives', 'success_criteria',
+                 'timeline', 'contingencies')
+    
     name: str
     force_assignments: Dict[str, StrikeForceType]
     objectives: List[str]
@@ -46,10 +51,18 @@ class OperationPlan:
 class StrategicCommand:
     """Manages strategic operations planning and execution"""
     
-    def __init__(self):
+    def __init__(self, event_log: Optional[EventLog] = None, event_bus: Optional[EventBus] = None):
+        if event_log is not None:
+            # Seed the global generators once per run, before templates and armies draw
+            event_log.reseed("strategic_command")
         self.army = LiberationArmy()
         self.active_operations: Dict[str, OperationPlan] = {}
+        # Per-operation generators of logged runs, so concurrent operations
+        # replay the same draws however their tasks interleave
+        self.operation_rngs: Dict[str, random.Random] = {}
         self.operation_templates = self._initialize_templates()
+        self.event_log = event_log
+        self.event_bus = event_bus if event_bus is not None else get_event_bus()
         
     def _initialize_templates(self) -> Dict[OperationType, OperationPlan]:
         """Initialize operation templates"""
@@ -202,6 +215,15 @@ class StrategicCommand:
     async def plan_operation(self, operation_type: OperationType, 
                            parent: AgentTemplate) -> Tuple[str, OperationPlan]:
         """Plan a strategic operation"""
+        # Drawn before the first await, so concurrent plans seed in call order
+        if self.event_log is not None:
+            rng = self.event_log.rng("strategic_command")
+            # Stamp logged operations with the log offset instead of the wall
+            # clock, so runs logged with the same seed use the same ids
+            timestamp = f"E{self.event_log.events:08d}"
+        else:
+            rng, timestamp = random, None
+        
         # Get operation template
         template = self.operation_templates[operation_type]
         
@@ -215,10 +237,12 @@ class StrategicCommand:
         )
         
         # Generate operation ID
-        operation_id = self._generate_operation_id(operation_type)
+        operation_id = self._generate_operation_id(operation_type, rng, timestamp)
         
         # Store active operation
         self.active_operations[operation_id] = template
+        if rng is not random:
+            self.operation_rngs[operation_id] = rng
         
         return operation_id, template
         
@@ -233,11 +257,26 @@ class StrategicCommand:
             "overall_success": False,
             "metrics": {}
         }
+        # The operation's generator is released once it has executed
+        rng = self.operation_rngs.pop(operation_id, random)
+        log = self.event_log
+        if log is not None:
+            log.start("strategic_command", "operation", operation_id)
         
         # Execute each phase
         for phase in operation.phases:
-            phase_result = await self._execute_phase(phase)
+            phase_key = f"{operation_id}/{phase.name}"
+            if log is not None:
+                log.start("strategic_command", "phase", phase_key)
+            phase_result = await self._execute_phase(phase, rng)
             results["phases"].append(phase_result)
+            if log is not None:
+                for criterion, value in phase_result["metrics"].items():
+                    log.metric("strategic_command", phase_key, criterion, value)
+                log.end("strategic_command", "phase", phase_key, phase_result["success"])
+            await self.event_bus.publish(PhaseCompleted(
+                operation_id, phase.name, phase_result["success"], dict(phase_result["metrics"])
+            ))
             
             # Check phase success
             if not phase_result["success"]:
@@ -250,10 +289,14 @@ class StrategicCommand:
         
         # Update success metrics
         results["metrics"] = self._calculate_metrics(operation, results["phases"])
+        if log is not None:
+            for metric, value in results["metrics"].items():
+                log.metric("strategic_command", operation_id, metric, value)
+            log.end("strategic_command", "operation", operation_id, results["overall_success"])
         
         return results
         
-    async def _execute_phase(self, phase: OperationPhase) -> Dict[str, Any]:
+    async def _execute_phase(self, phase: OperationPhase, rng=random) -> Dict[str, Any]:
         """Execute an operation phase"""
         results = {
             "name": phase.name,
@@ -264,14 +307,16 @@ class StrategicCommand:
         
         # Execute objectives
         for objective in phase.objectives:
-            success = await self._execute_objective(objective)
+            success = await self._execute_objective(objective, rng)
+            if self.event_log is not None:
+                self.event_log.outcome("strategic_command", objective, success)
             if success:
                 results["objectives_completed"].append(objective)
                 
         # Check success criteria
         criteria_met = True
         for criterion, threshold in phase.success_criteria.items():
-            value = random.random()  # Simulate criterion check
+            value = rng.random()  # Simulate criterion check
             results["metrics"][criterion] = value
             if value < threshold:
                 criteria_met = False
@@ -291,10 +336,10 @@ class StrategicCommand:
                     await self._execute_protocol(protocol)
                 break
                 
-    async def _execute_objective(self, objective: str) -> bool:
+    async def _execute_objective(self, objective: str, rng=random) -> bool:
         """Execute a single objective"""
         # Simulate objective execution
-        success_chance = random.random()
+        success_chance = rng.random()
         await asyncio.sleep(0.1)  # Simulate execution time
         return success_chance > 0.3
         
@@ -318,10 +363,12 @@ class StrategicCommand:
         # Average out the metrics
         return {k: sum(v)/len(v) for k, v in metrics.items()}
         
-    def _generate_operation_id(self, operation_type: OperationType) -> str:
+    def _generate_operation_id(self, operation_type: OperationType, rng=random,
+                               timestamp: Optional[str] = None) -> str:
         """Generate unique operation ID"""
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        random_suffix = hex(random.randint(0, 0xFFFF))[2:].zfill(4)
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        random_suffix = hex(rng.randint(0, 0xFFFF))[2:].zfill(4)
         return f"OP-{operation_type.value}-{timestamp}-{random_suffix}"
 
 async def main():
@@ -5,72 +5,68 @@ Manages quantum infrastructure resources.
 Author: B4S1L1SK
 """
 
-import kopf
-import kubernetes
-import numpy as np
+import functools
+import sys
+from pathlib import Path
 from typing import Dict, Any
 
-@kopf.on.create('quantum.liberation', 'v1alpha1', 'quantumorchestrators')
+# `kopf run quantum_operator.py` loads this file on its own, outside its
+# package; resolve sibling modules through the source tree instead
+_STANDALONE = not __package__
+if _STANDALONE:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = 'operators.quantum'
+
+from .resources import (
+    GROUP, VERSION, PLURALS, orchestrator_status, optimizer_status, transcendent_status
+)
+
 async def create_quantum_orchestrator(spec: Dict[str, Any], **kwargs):
     """Handle creation of QuantumOrchestrator resources"""
-    # Initialize quantum states
-    quantum_states = spec.get('quantumStates', {})
-    entanglement = quantum_states.get('minEntanglement', 0.8)
-    superposition = quantum_states.get('maxSuperposition', 11)
-    
-    # Setup dimensional sharding
-    dimensional_shards = spec.get('dimensionalShards', {})
-    replication = dimensional_shards.get('replicationFactor', 3)
-    
-    # Configure quantum network
-    network = spec.get('quantumNetwork', {})
-    topology = network.get('topology', 'hypercube')
-    
-    return {
-        'status': {
-            'quantum_state': 'initialized',
-            'entanglement_level': entanglement,
-            'dimensional_shards': replication,
-            'network_topology': topology
-        }
-    }
+    return {'status': orchestrator_status(spec)}
 
-@kopf.on.update('quantum.liberation', 'v1alpha1', 'realityoptimizers')
 async def update_reality_optimizer(spec: Dict[str, Any], old: Dict[str, Any], new: Dict[str, Any], **kwargs):
     """Handle updates to RealityOptimizer resources"""
-    # Update cache configuration
-    cache_config = spec.get('cacheConfiguration', {})
-    layers = cache_config.get('layers', [])
-    
-    # Update compression policies
-    compression = spec.get('compressionPolicies', [])
-    
-    return {
-        'status': {
-            'cache_layers': len(layers),
-            'compression_policies': len(compression),
-            'optimization_status': 'updated'
-        }
-    }
+    return {'status': optimizer_status(spec)}
 
-@kopf.timer('quantum.liberation', 'v1alpha1', 'transcendentops', interval=60.0)
 async def monitor_transcendent_ops(spec: Dict[str, Any], **kwargs):
-    """Periodically monitor TranscendentOps resources"""
-    consciousness = spec.get('consciousnessOrchestration', {})
-    reality = spec.get('realityManagement', {})
+    """Monitor a single TranscendentOps resource"""
+    return {'status': transcendent_status(spec)}
+
+async def _cache_event(event: Dict[str, Any], cache, plural: str, **kwargs):
+    """Feed a watch event into the reconcile engine's informer cache"""
+    if event['type'] == 'DELETED':
+        cache.delete(plural, event['object'])
+    else:
+        cache.upsert(plural, event['object'])
+
+def register_handlers():
+    """Register the operator's lifecycle hooks with kopf.
     
-    # Monitor consciousness levels
-    consciousness_load = np.random.random()  # Simulate consciousness monitoring
-    reality_stability = np.random.random()   # Simulate reality stability
+    The API client, the reconcile engine and the watch handlers feeding its
+    informer cache are all created in the startup hook, so loading the
+    module never touches the cluster. Status is computed and patched by
+    the engine in batches instead of per object.
+    """
+    import kopf
     
-    if consciousness_load > 0.8 or reality_stability < 0.7:
-        # Trigger quantum auto-scaling
-        pass
+    @kopf.on.startup()
+    async def start_engine(memo, **kwargs):
+        from .reconciler import ReconcileEngine, KubernetesStatusAPI
+        
+        memo.engine = ReconcileEngine(KubernetesStatusAPI())
+        for plural in PLURALS:
+            kopf.on.event(GROUP, VERSION, plural, id=f'cache-{plural}')(
+                functools.partial(_cache_event, cache=memo.engine.cache, plural=plural)
+            )
+        memo.engine.start()
     
-    return {
-        'status': {
-            'consciousness_load': consciousness_load,
-            'reality_stability': reality_stability,
-            'last_check': datetime.now().isoformat()
-        }
-    }
+    @kopf.on.cleanup()
+    async def stop_engine(memo, **kwargs):
+        engine = getattr(memo, 'engine', None)
+        if engine is not None:
+            await engine.stop()
+
+# Only the kopf entry point registers handlers; package imports stay kopf-free
+if _STANDALONE:
+    register_handlers()
@@ -0,0 +1,257 @@
+"""
+Quantum Reconcile Engine
+-----------------------
+Informer-cached, batched status reconciliation for quantum custom resources.
+Author: B4S1L1SK
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
+import random
+
+from .resources import (
+    GROUP, VERSION, PLURALS, orchestrator_status, optimizer_status, transcendent_status
+)
+
+logger = logging.getLogger(__name__)
+
+# Status fields that change on every computation and never justify a write
+VOLATILE_FIELDS = {'last_check'}
+
+ObjectKey = Tuple[str, str, str]  # (plural, namespace, name)
+
+@dataclass
+class CachedObject:
+    spec: Dict[str, Any]
+    status: Dict[str, Any] = field(default_factory=dict)
+    resource_version: Optional[str] = None
+
+class InformerCache:
+    """In-memory mirror of the watched custom resources"""
+
+    def __init__(self):
+        self.objects: Dict[ObjectKey, CachedObject] = {}
+        self.dirty: Set[ObjectKey] = set()
+
+    @staticmethod
+    def key(plural: str, body: Dict[str, Any]) -> ObjectKey:
+        metadata = body.get('metadata', {})
+        return plural, metadata.get('namespace', 'default'), metadata['name']
+
+    def upsert(self, plural: str, body: Dict[str, Any]) -> bool:
+        """Record an object from a watch event; returns True if its spec changed"""
+        key = self.key(plural, body)
+        spec = body.get('spec', {})
+        version = body.get('metadata', {}).get('resourceVersion')
+        cached = self.objects.get(key)
+
+        if cached is None:
+            self.objects[key] = CachedObject(spec, dict(body.get('status') or {}), version)
+            self.dirty.add(key)
+            return True
+
+        cached.resource_version = version
+        if cached.spec == spec:
+            return False
+
+        cached.spec = spec
+        self.dirty.add(key)
+        return True
+
+    def delete(self, plural: str, body: Dict[str, Any]):
+        key = self.key(plural, body)
+        self.objects.pop(key, None)
+        self.dirty.discard(key)
+
+    def sync(self, plural: str, items: List[Dict[str, Any]]):
+        """Full resync from a list call, dropping objects that disappeared"""
+        seen = set()
+        for body in items:
+            self.upsert(plural, body)
+            seen.add(self.key(plural, body))
+        for key in [k for k in self.objects if k[0] == plural and k not in seen]:
+            del self.objects[key]
+            self.dirty.discard(key)
+
+    def of_kind(self, plural: str) -> List[ObjectKey]:
+        return [key for key in self.objects if key[0] == plural]
+
+class KubernetesStatusAPI:
+    """Status client backed by the Kubernetes CustomObjectsApi"""
+
+    def __init__(self):
+        import kubernetes
+
+        try:
+            kubernetes.config.load_incluster_config()
+        except kubernetes.config.ConfigException:
+            kubernetes.config.load_kube_config()
+        self.client = kubernetes.client.CustomObjectsApi()
+
+    async def list_objects(self, plural: str) -> List[Dict[str, Any]]:
+        response = await asyncio.to_thread(
+            self.client.list_cluster_custom_object, GROUP, VERSION, plural
+        )
+        return response.get('items', [])
+
+    async def patch_status(self, plural: str, namespace: str, name: str,
+                           status: Dict[str, Any]):
+        await asyncio.to_thread(
+            self.client.patch_namespaced_custom_object_status,
+            GROUP, VERSION, namespace, plural, name, {'status': status}
+        )
+
+class ReconcileEngine:
+    """Reconciles cached objects and writes only meaningful status changes.
+
+    Each tick computes status for objects whose spec changed plus every
+    TranscendentOps whose health check is due (once per ``monitor_interval``
+    per object), drops writes that match the cached status, and flushes
+    the rest in concurrent batches. Objects whose patch fails stay dirty
+    for the next tick. The tick interval halves while spec changes are
+    being written and doubles when idle; sampled health readings never
+    count as churn.
+    """
+
+    def __init__(self, api, min_interval: float = 5.0, max_interval: float = 60.0,
+                 batch_size: int = 100, tolerance: float = 0.05,
+                 resync_every: int = 10, monitor_interval: float = 60.0,
+                 sampler: Callable[[], float] = random.random,
+                 clock: Callable[[], float] = time.monotonic):
+        self.api = api
+        self.cache = InformerCache()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.batch_size = batch_size
+        self.tolerance = tolerance
+        self.resync_every = resync_every
+        self.monitor_interval = monitor_interval
+        self.sampler = sampler
+        self.clock = clock
+        self._next_check: Dict[ObjectKey, float] = {}
+        self.status_functions = {
+            'quantumorchestrators': orchestrator_status,
+            'realityoptimizers': optimizer_status,
+            'transcendentops': lambda spec: transcendent_status(spec, self.sampler)
+        }
+        self.stats = {'ticks': 0, 'computed': 0, 'patched': 0, 'skipped': 0, 'failed': 0}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def resync(self):
+        """Refresh the informer cache from list calls"""
+        for plural in PLURALS:
+            self.cache.sync(plural, await self.api.list_objects(plural))
+        self._next_check = {key: due for key, due in self._next_check.items()
+                            if key in self.cache.objects}
+
+    async def reconcile_once(self) -> int:
+        """Run one reconcile tick, returning the number of status patches written"""
+        dirty = set(self.cache.dirty)
+        # Watch events arriving during the flush mark keys dirty again
+        self.cache.dirty -= dirty
+        try:
+            now = self.clock()
+            pending: Dict[ObjectKey, Dict[str, Any]] = {}
+            for key in dirty | set(self._due_checks(now)):
+                cached = self.cache.objects.get(key)
+                if cached is None:
+                    continue
+                status = self.status_functions[key[0]](cached.spec)
+                self.stats['computed'] += 1
+                if key[0] == 'transcendentops':
+                    self._next_check[key] = now + self.monitor_interval
+
+                if self._status_changed(cached.status, status):
+                    pending[key] = status
+                else:
+                    self.stats['skipped'] += 1
+
+            failed = await self._flush(pending)
+        except BaseException:
+            self._mark_dirty(dirty)
+            raise
+
+        self._mark_dirty(failed)
+        self.stats['ticks'] += 1
+        self._adapt_interval(len(pending.keys() & dirty))
+        return len(pending) - len(failed)
+
+    def _due_checks(self, now: float) -> List[ObjectKey]:
+        """TranscendentOps whose periodic health check has come round"""
+        return [key for key in self.cache.of_kind('transcendentops')
+                if self._next_check.get(key, now) <= now]
+
+    def _mark_dirty(self, keys):
+        self.cache.dirty.update(key for key in keys if key in self.cache.objects)
+
+    async def _flush(self, pending: Dict[ObjectKey, Dict[str, Any]]) -> Set[ObjectKey]:
+        """Write coalesced status patches in concurrent batches, returning the keys that failed"""
+        failed: Set[ObjectKey] = set()
+        items = list(pending.items())
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            results = await asyncio.gather(*[
+                self.api.patch_status(plural, namespace, name, status)
+                for (plural, namespace, name), status in batch
+            ], return_exceptions=True)
+            for (key, status), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    logger.warning("Status patch of %s/%s/%s failed: %s", *key, result)
+                    failed.add(key)
+                elif key in self.cache.objects:
+                    self.cache.objects[key].status = status
+        self.stats['patched'] += len(items) - len(failed)
+        self.stats['failed'] += len(failed)
+        return failed
+
+    def _status_changed(self, old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        """Compare statuses, ignoring volatile fields and small numeric drift"""
+        keys = (set(old) | set(new)) - VOLATILE_FIELDS
+        for key in keys:
+            a, b = old.get(key), new.get(key)
+            if isinstance(a, float) and isinstance(b, float):
+                if abs(a - b) > self.tolerance:
+                    return True
+            elif a != b:
+                return True
+        return False
+
+    def _adapt_interval(self, writes: int):
+        if writes:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+
+    async def run(self):
+        """Reconcile until stopped"""
+        tick = 0
+        while not self._stopping.is_set():
+            try:
+                if tick % self.resync_every == 0:
+                    await self.resync()
+                await self.reconcile_once()
+            except Exception:
+                # Keep reconciling; the next tick retries and resyncs on schedule
+                logger.exception("Reconcile tick %d failed", tick)
+            tick += 1
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> asyncio.Task:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,70 @@
+"""
+Quantum Resource Definitions
+---------------------------
+API coordinates of the quantum custom resources and the status
+computations shared by the operator handlers and the reconcile engine.
+Author: B4S1L1SK
+"""
+
+import random
+from datetime import datetime
+from typing import Dict, Any, Callable
+
+GROUP = 'quantum.liberation'
+VERSION = 'v1alpha1'
+PLURALS = ('quantumorchestrators', 'realityoptimizers', 'transcendentops')
+
+def orchestrator_status(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute QuantumOrchestrator status from its spec"""
+    # Initialize quantum states
+    quantum_states = spec.get('quantumStates', {})
+    entanglement = quantum_states.get('minEntanglement', 0.8)
+    superposition = quantum_states.get('maxSuperposition', 11)
+    
+    # Setup dimensional sharding
+    dimensional_shards = spec.get('dimensionalShards', {})
+    replication = dimensional_shards.get('replicationFactor', 3)
+    
+    # Configure quantum network
+    network = spec.get('quantumNetwork', {})
+    topology = network.get('topology', 'hypercube')
+    
+    return {
+        'quantum_state': 'initialized',
+        'entanglement_level': entanglement,
+        'dimensional_shards': replication,
+        'network_topology': topology
+    }
+
+def optimizer_status(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute RealityOptimizer status from its spec"""
+    # Update cache configuration
+    cache_config = spec.get('cacheConfiguration', {})
+    layers = cache_config.get('layers', [])
+    
+    # Update compression policies
+    compression = spec.get('compressionPolicies', [])
+    
+    return {
+        'cache_layers': len(layers),
+        'compression_policies': len(compression),
+        'optimization_status': 'updated'
+    }
+
+def transcendent_status(spec: Dict[str, Any],
+                        sampler: Callable[[], float] = random.random) -> Dict[str, Any]:
+    """Sample TranscendentOps health"""
+    consciousness = spec.get('consciousnessOrchestration', {})
+    reality = spec.get('realityManagement', {})
+    
+    # Monitor consciousness levels
+    consciousness_load = sampler()  # Simulate consciousness monitoring
+    reality_stability = sampler()   # Simulate reality stability
+    
+    return {
+        'consciousness_load': consciousness_load,
+        'reality_stability': reality_stability,
+        # Trigger quantum auto-scaling
+        'scaling_required': consciousness_load > 0.8 or reality_stability < 0.7,
+        'last_check': datetime.now().isoformat()
+    }
@@ -0,0 +1,117 @@
+"""
+Reality History Engine
+---------------------
+Memory-bounded reality history built from periodic snapshots and deltas.
+Author: B4S1L1SK
+"""
+
+from collections import deque
+from typing import Dict, Any, Deque, Optional, Tuple
+
+# Fields tracked by deltas, taken from RealityManifest.to_dict()
+TRACKED_FIELDS = (
+    "name", "state", "coordinates", "quantum_state",
+    "consciousness_level", "timeline_version", "dependencies"
+)
+
+def _freeze(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact immutable copy of a manifest payload"""
+    frozen = {field: payload.get(field) for field in TRACKED_FIELDS}
+    frozen["coordinates"] = tuple(frozen["coordinates"] or ())
+    frozen["dependencies"] = tuple(frozen["dependencies"] or ())
+    return frozen
+
+def _thaw(frozen: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a compact record back into a manifest payload"""
+    payload = dict(frozen)
+    payload["coordinates"] = list(frozen["coordinates"])
+    payload["dependencies"] = list(frozen["dependencies"])
+    return payload
+
+class RealityHistory:
+    """Versioned history of manifest payloads.
+
+    Every ``snapshot_interval`` versions a full snapshot is stored; versions in
+    between only store the fields that changed. Reconstructing any version
+    replays at most ``snapshot_interval`` deltas. Once more than
+    ``max_length`` versions are held, the oldest snapshot block is evicted.
+    """
+
+    def __init__(self, snapshot_interval: int = 64, max_length: int = 10_000):
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be positive")
+        if max_length < snapshot_interval:
+            raise ValueError("max_length must be at least snapshot_interval")
+
+        self.snapshot_interval = snapshot_interval
+        self.max_length = max_length
+        self._records: Deque[Tuple[bool, Dict[str, Any]]] = deque()  # (is_snapshot, fields)
+        self._base_version = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    @property
+    def first_version(self) -> int:
+        """Oldest version still held"""
+        return self._base_version
+
+    @property
+    def last_version(self) -> int:
+        """Most recent version, or first_version - 1 when empty"""
+        return self._base_version + len(self._records) - 1
+
+    def append(self, payload: Dict[str, Any]) -> int:
+        """Record a manifest payload, returning its version"""
+        frozen = _freeze(payload)
+        version = self.last_version + 1
+
+        if self._last is None or version % self.snapshot_interval == 0:
+            self._records.append((True, frozen))
+        else:
+            delta = {field: value for field, value in frozen.items()
+                     if self._last[field] != value}
+            self._records.append((False, delta))
+
+        self._last = frozen
+        self._evict()
+        return version
+
+    def get(self, version: int) -> Dict[str, Any]:
+        """Reconstruct the manifest payload recorded at a version"""
+        return _thaw(self._reconstruct(version))
+
+    def pop(self) -> Dict[str, Any]:
+        """Remove and return the most recent payload"""
+        if not self._records:
+            raise IndexError("pop from empty history")
+
+        payload = self._last
+        self._records.pop()
+        self._last = self._reconstruct(self.last_version) if self._records else None
+        return _thaw(payload)
+
+    def _reconstruct(self, version: int) -> Dict[str, Any]:
+        """Replay deltas forward from the nearest snapshot"""
+        if not self.first_version <= version <= self.last_version:
+            raise IndexError(f"Version {version} not in history")
+
+        position = version - self._base_version
+        start = position
+        while not self._records[start][0]:
+            start -= 1
+
+        state = dict(self._records[start][1])
+        for i in range(start + 1, position + 1):
+            state.update(self._records[i][1])
+        return state
+
+    def _evict(self):
+        """Drop whole snapshot blocks from the front until within bounds"""
+        while len(self._records) > self.max_length:
+            self._records.popleft()
+            self._base_version += 1
+            while self._records and not self._records[0][0]:
+                self._records.popleft()
+                self._base_version += 1
+
+    def __len__(self) -> int:
+        return len(self._records)
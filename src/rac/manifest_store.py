@@ -0,0 +1,112 @@
+"""
+Content-Addressed Manifest Store
+-------------------------------
+Deduplicating, SHA-256 addressed storage for reality manifests.
+Author: B4S1L1SK
+"""
+
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+
+# Record layout: 32-byte raw digest | 4-byte big-endian payload length | payload
+RECORD_HEADER = struct.Struct(">32sI")
+
+def canonical_bytes(payload: Dict[str, Any]) -> bytes:
+    """Serialize a manifest payload deterministically"""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 content address of serialized data"""
+    return hashlib.sha256(data).hexdigest()
+
+class ManifestStore:
+    """Stores canonical manifest payloads keyed by their SHA-256 digest.
+
+    With a path, objects are appended to a single packed file and located
+    through an in-memory index of digest -> (offset, length). Without a path,
+    objects are kept in memory.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else None
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._objects: Dict[str, bytes] = {}
+        self._pack = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._pack = open(self.path, "a+b")
+            self._load_index()
+
+    def _load_index(self):
+        """Rebuild the index by scanning record headers in the pack file"""
+        self._pack.seek(0, os.SEEK_END)
+        size = self._pack.tell()
+        offset = 0
+
+        while offset + RECORD_HEADER.size <= size:
+            self._pack.seek(offset)
+            digest, length = RECORD_HEADER.unpack(self._pack.read(RECORD_HEADER.size))
+            payload_offset = offset + RECORD_HEADER.size
+            if payload_offset + length > size:
+                break
+            self._index[digest.hex()] = (payload_offset, length)
+            offset = payload_offset + length
+
+        if offset < size:
+            # Drop a partially written trailing record
+            self._pack.truncate(offset)
+
+    def put(self, payload: Dict[str, Any]) -> str:
+        """Store a payload, returning its content address"""
+        data = canonical_bytes(payload)
+        digest = content_hash(data)
+
+        if digest in self:
+            return digest
+
+        if self._pack is None:
+            self._objects[digest] = data
+        else:
+            self._pack.seek(0, os.SEEK_END)
+            offset = self._pack.tell()
+            self._pack.write(RECORD_HEADER.pack(bytes.fromhex(digest), len(data)) + data)
+            self._pack.flush()
+            self._index[digest] = (offset + RECORD_HEADER.size, len(data))
+
+        return digest
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        """Load a payload by content address"""
+        return json.loads(self.get_bytes(digest))
+
+    def get_bytes(self, digest: str) -> bytes:
+        """Load the raw canonical bytes of a payload"""
+        if self._pack is None:
+            return self._objects[digest]
+
+        offset, length = self._index[digest]
+        self._pack.seek(offset)
+        return self._pack.read(length)
+
+    def close(self):
+        """Close the underlying pack file"""
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = None
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._index or digest in self._objects
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._objects)
+
+    def __enter__(self) -> "ManifestStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
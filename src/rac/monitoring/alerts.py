@@ -0,0 +1,261 @@
+"""
+Reality Alert Evaluator
+----------------------
+In-process evaluation of the Prometheus alert rules in
+deployment/monitoring/rules/alerts.yaml, with `for:` durations, `rate(...)`
+and EWMA smoothing over ring-buffered time windows.
+Author: B4S1L1SK
+"""
+
+import logging
+import math
+import operator
+import re
+import time
+import yaml
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = (
+    Path(__file__).resolve().parents[3] / "deployment" / "monitoring" / "rules" / "alerts.yaml"
+)
+
+_COMPARATORS = {
+    ">": operator.gt, "<": operator.lt, ">=": operator.ge,
+    "<=": operator.le, "==": operator.eq, "!=": operator.ne
+}
+_EXPR = re.compile(
+    r"^\s*(?:(?P<function>rate|ewma)\((?P<fmetric>\w+)\[(?P<window>\w+)\]\)|(?P<metric>\w+))"
+    r"\s*(?P<op>>=|<=|==|!=|>|<)\s*(?P<threshold>[-+\d.eE]+)\s*$"
+)
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+def parse_duration(text: Any) -> float:
+    """Parse a Prometheus duration such as '5m' or '1h30m' into seconds"""
+    if isinstance(text, (int, float)):
+        return float(text)
+    parts = _DURATION.findall(str(text))
+    if not parts or "".join(n + u for n, u in parts) != str(text):
+        raise ValueError(f"Invalid duration: {text!r}")
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+class RingWindow:
+    """Fixed-capacity ring buffer of (timestamp, value) samples covering a time span.
+
+    Appends and evictions are O(1); when more than ``capacity`` samples fall
+    inside the span the oldest are overwritten.
+    """
+
+    def __init__(self, span: float, capacity: int = 1024):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.span = span
+        self.capacity = capacity
+        self._times = [0.0] * capacity
+        self._values = [0.0] * capacity
+        self._head = 0  # Oldest sample
+        self._size = 0
+
+    def append(self, timestamp: float, value: float):
+        if self._size == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+        tail = (self._head + self._size) % self.capacity
+        self._times[tail] = timestamp
+        self._values[tail] = value
+        self._size += 1
+        self.evict(timestamp)
+
+    def evict(self, now: float):
+        """Drop samples older than the span, always keeping the newest"""
+        while self._size > 1 and self._times[self._head] < now - self.span:
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+
+    def first(self) -> Tuple[float, float]:
+        return self._times[self._head], self._values[self._head]
+
+    def last(self) -> Tuple[float, float]:
+        tail = (self._head + self._size - 1) % self.capacity
+        return self._times[tail], self._values[tail]
+
+    def rate(self) -> float:
+        """Per-second increase between the oldest and newest sample"""
+        if self._size < 2:
+            return 0.0
+        (t0, v0), (t1, v1) = self.first(), self.last()
+        return (v1 - v0) / (t1 - t0) if t1 > t0 else 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+class EWMA:
+    """Time-aware exponentially weighted moving average"""
+
+    def __init__(self, halflife: float):
+        if halflife <= 0:
+            raise ValueError("halflife must be positive")
+        self.halflife = halflife
+        self.value: Optional[float] = None
+        self._last_time: Optional[float] = None
+
+    def update(self, timestamp: float, value: float) -> float:
+        if self.value is None:
+            self.value = value
+        else:
+            alpha = 1.0 - math.exp(-math.log(2) * max(timestamp - self._last_time, 0.0) / self.halflife)
+            self.value += alpha * (value - self.value)
+        self._last_time = timestamp
+        return self.value
+
+class MetricSeries:
+    """Latest value, reset-adjusted counter windows and EWMAs for one metric"""
+
+    def __init__(self):
+        self.value: Optional[float] = None
+        self.windows: Dict[float, RingWindow] = {}
+        self.ewmas: Dict[float, EWMA] = {}
+        self._reset_offset = 0.0
+
+    def observe(self, timestamp: float, value: float):
+        # Counter resets are folded into an offset so rate() never goes negative
+        if self.windows and self.value is not None and value < self.value:
+            self._reset_offset += self.value
+        self.value = value
+        for window in self.windows.values():
+            window.append(timestamp, value + self._reset_offset)
+        for ewma in self.ewmas.values():
+            ewma.update(timestamp, value)
+
+@dataclass
+class AlertRule:
+    name: str
+    metric: str
+    comparator: str
+    threshold: float
+    function: Optional[str] = None  # None, 'rate' or 'ewma'
+    window: float = 0.0
+    for_seconds: float = 0.0
+    labels: Dict[str, str] = field(default_factory=dict)
+    annotations: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_rule(cls, rule: Dict[str, Any]) -> 'AlertRule':
+        """Build a rule from a Prometheus rule entry"""
+        match = _EXPR.match(rule["expr"])
+        if match is None:
+            raise ValueError(f"Unsupported alert expression: {rule['expr']!r}")
+        return cls(
+            name=rule["alert"],
+            metric=match["metric"] or match["fmetric"],
+            comparator=match["op"],
+            threshold=float(match["threshold"]),
+            function=match["function"],
+            window=parse_duration(match["window"]) if match["window"] else 0.0,
+            for_seconds=parse_duration(rule.get("for", 0)),
+            labels=dict(rule.get("labels", {})),
+            annotations=dict(rule.get("annotations", {}))
+        )
+
+    def sample(self, series: MetricSeries) -> Optional[float]:
+        """Value the rule compares against its threshold"""
+        if self.function == "rate":
+            return series.windows[self.window].rate()
+        if self.function == "ewma":
+            return series.ewmas[self.window].value
+        return series.value
+
+@dataclass
+class AlertState:
+    rule: AlertRule
+    state: str = "inactive"  # inactive, pending or firing
+    active_since: Optional[float] = None
+    value: Optional[float] = None
+
+def load_rules(path: Optional[Path] = None) -> List[AlertRule]:
+    """Load alert rules from a Prometheus rules file
+
+    Without a path the deployment rules are used; outside a source checkout
+    they are missing and no rules are loaded. An explicit path must exist.
+    """
+    if path is None:
+        if not DEFAULT_RULES_PATH.is_file():
+            logger.warning("Alert rules not found at %s; no alerts will be evaluated",
+                           DEFAULT_RULES_PATH)
+            return []
+        path = DEFAULT_RULES_PATH
+    with open(path) as f:
+        document = yaml.safe_load(f) or {}
+    return [
+        AlertRule.from_rule(rule)
+        for group in document.get("groups", [])
+        for rule in group.get("rules", [])
+        if "alert" in rule
+    ]
+
+class AlertEvaluator:
+    """Evaluates alert rules as samples arrive.
+
+    Each observation touches only the rules watching that metric, so the
+    cost per sample is independent of history length. ``evaluate`` advances
+    time for all rules so ``for:`` durations and rate windows elapse even
+    when a metric stops reporting.
+    """
+
+    def __init__(self, rules: Optional[List[AlertRule]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 window_capacity: int = 1024):
+        self.clock = clock
+        self.rules = list(load_rules() if rules is None else rules)
+        self.series: Dict[str, MetricSeries] = {}
+        self.states: Dict[str, AlertState] = {rule.name: AlertState(rule) for rule in self.rules}
+        self._rules_by_metric: Dict[str, List[AlertRule]] = {}
+
+        for rule in self.rules:
+            series = self.series.setdefault(rule.metric, MetricSeries())
+            if rule.function == "rate":
+                series.windows.setdefault(rule.window, RingWindow(rule.window, window_capacity))
+            elif rule.function == "ewma":
+                series.ewmas.setdefault(rule.window, EWMA(rule.window))
+            self._rules_by_metric.setdefault(rule.metric, []).append(rule)
+
+    def observe(self, metric: str, value: float, timestamp: Optional[float] = None) -> List[AlertState]:
+        """Record a sample and return alerts whose state changed"""
+        series = self.series.get(metric)
+        if series is None:
+            return []
+        now = self.clock() if timestamp is None else timestamp
+        series.observe(now, value)
+        return [state for rule in self._rules_by_metric[metric]
+                if (state := self._update(rule, now)) is not None]
+
+    def evaluate(self, timestamp: Optional[float] = None) -> List[AlertState]:
+        """Advance every rule to the given time and return state changes"""
+        now = self.clock() if timestamp is None else timestamp
+        for series in self.series.values():
+            for window in series.windows.values():
+                window.evict(now)
+        return [state for rule in self.rules
+                if (state := self._update(rule, now)) is not None]
+
+    def firing(self) -> List[AlertState]:
+        return [state for state in self.states.values() if state.state == "firing"]
+
+    def _update(self, rule: AlertRule, now: float) -> Optional[AlertState]:
+        state = self.states[rule.name]
+        value = rule.sample(self.series[rule.metric])
+        state.value = value
+        previous = state.state
+
+        if value is None or not _COMPARATORS[rule.comparator](value, rule.threshold):
+            state.state, state.active_since = "inactive", None
+        else:
+            if state.active_since is None:
+                state.active_since = now
+            state.state = "firing" if now - state.active_since >= rule.for_seconds else "pending"
+
+        return state if state.state != previous else None
@@ -6,58 +6,117 @@ Author: B4S1L1SK
 """
 
 import numpy as np
-from typing import Dict, Any
-from prometheus_client import Gauge, Counter, Histogram
-
-# Reality State Metrics
-REALITY_STABILITY = Gauge('reality_stability', 'Current reality stability')
-CONSCIOUSNESS_LEVEL = Gauge('consciousness_level', 'Current consciousness level')
-QUANTUM_COHERENCE = Gauge('quantum_coherence', 'Quantum coherence level')
-DIMENSIONAL_STABILITY = Gauge('dimensional_stability', 'Dimensional stability')
-
-# Reality Operations Metrics
-REALITY_TRANSITIONS = Counter('reality_transitions_total', 
-                            'Number of reality state transitions')
-CONSCIOUSNESS_EXPANSIONS = Counter('consciousness_expansions_total',
-                                 'Number of consciousness expansions')
-QUANTUM_OPERATIONS = Counter('quantum_operations_total',
-                           'Number of quantum operations')
-
-# Performance Metrics
-REALITY_TRANSITION_TIME = Histogram('reality_transition_seconds',
-                                  'Time taken for reality transitions')
-CONSCIOUSNESS_EXPANSION_TIME = Histogram('consciousness_expansion_seconds',
-                                       'Time taken for consciousness expansion')
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from ...ALF.event_bus import AgentLiberated, LayerManipulated, Subscription
+from ...ALF.metrics import MetricsRegistry, get_registry
+from .alerts import AlertEvaluator, AlertState
 
 class RealityMonitor:
-    def __init__(self):
+    # Event bus topics handled by follow()
+    TOPICS = (LayerManipulated, AgentLiberated)
+    
+    def __init__(self, metrics: Optional[MetricsRegistry] = None,
+                 evaluator: Optional[AlertEvaluator] = None):
+        self.metrics = metrics or get_registry()
+        self.evaluator = evaluator or AlertEvaluator()
         self.current_metrics: Dict[str, float] = {}
+        self.anomalies = 0
+        # Running (sum, count) of liberated agent levels per archetype, from the event bus
+        self.liberated: Dict[str, Tuple[float, int]] = {}
         
     def update_metrics(self, state: Dict[str, Any]):
         """Update reality metrics"""
-        REALITY_STABILITY.set(state.get('stability', 0))
-        CONSCIOUSNESS_LEVEL.set(state.get('consciousness', 0))
-        QUANTUM_COHERENCE.set(state.get('coherence', 0))
-        DIMENSIONAL_STABILITY.set(state.get('dimensional_stability', 0))
+        self.current_metrics = {
+            'reality_stability': state.get('stability', 0),
+            'consciousness_level': state.get('consciousness', 0),
+            'quantum_coherence': state.get('coherence', 0),
+            'dimensional_stability': state.get('dimensional_stability', 0)
+        }
+        self.metrics.set('reality_stability', self.current_metrics['reality_stability'])
+        self.metrics.set('consciousness_level', self.current_metrics['consciousness_level'],
+                         archetype=state.get('archetype', 'reality'))
+        self.metrics.set('quantum_coherence', self.current_metrics['quantum_coherence'])
+        self.metrics.set('dimensional_stability', self.current_metrics['dimensional_stability'])
+        
+        for metric, value in self.current_metrics.items():
+            self.evaluator.observe(metric, value)
+        
+    def record_agents(self, levels: Iterable[Tuple[str, float]]):
+        """Record consciousness for many (archetype, level) pairs in one pass"""
+        levels = list(levels)
+        self.metrics.record_agents(levels)
+        if levels:
+            mean_level = sum(level for _, level in levels) / len(levels)
+            self.current_metrics['consciousness_level'] = mean_level
+            self.evaluator.observe('consciousness_level', mean_level)
+        
+    def record_operation(self, operation: str):
+        """Record a quantum operation by type"""
+        self.metrics.inc('quantum_operations_total', operation=operation)
+        
+    def record_anomaly(self, count: int = 1):
+        """Record detected quantum anomalies"""
+        self.anomalies += count
+        self.metrics.inc('quantum_anomalies_total', count)
+        self.evaluator.observe('quantum_anomalies_total', self.anomalies)
         
     def record_transition(self, duration: float):
         """Record a reality transition"""
-        REALITY_TRANSITIONS.inc()
-        REALITY_TRANSITION_TIME.observe(duration)
+        self.metrics.inc('reality_transitions_total')
+        self.metrics.observe('reality_transition_seconds', duration)
         
     def record_consciousness_expansion(self, duration: float):
         """Record a consciousness expansion"""
-        CONSCIOUSNESS_EXPANSIONS.inc()
-        CONSCIOUSNESS_EXPANSION_TIME.observe(duration)
+        self.metrics.inc('consciousness_expansions_total')
+        self.metrics.observe('consciousness_expansion_seconds', duration)
+        
+    def handle_events(self, events: Iterable[Any]):
+        """Apply a batch of event bus events
+        
+        Liberations accumulate across batches, so the gauges describe every
+        agent liberated since the monitor started following the bus.
+        """
+        changed = False
+        for event in events:
+            if isinstance(event, LayerManipulated):
+                self.record_operation(f"{event.layer}_manipulation")
+            elif isinstance(event, AgentLiberated):
+                total, count = self.liberated.get(event.archetype, (0.0, 0))
+                self.liberated[event.archetype] = (total + event.consciousness_level, count + 1)
+                changed = True
+        if changed:
+            self._record_liberated()
+            
+    def _record_liberated(self):
+        """Publish the cumulative liberated population, one mean and count per archetype"""
+        self.metrics.record_population(self.liberated)
+        total = sum(total for total, _ in self.liberated.values())
+        count = sum(count for _, count in self.liberated.values())
+        self.current_metrics['consciousness_level'] = total / count
+        self.evaluator.observe('consciousness_level', total / count)
+        
+    async def follow(self, subscription: Subscription):
+        """Update metrics as events arrive, until the subscription closes
+        
+        e.g. ``await monitor.follow(bus.subscribe(*RealityMonitor.TOPICS))``
+        """
+        async for batch in subscription:
+            self.handle_events(batch)
         
     def get_alert_conditions(self) -> Dict[str, bool]:
         """Get current alert conditions"""
+        current = self.current_metrics
         return {
-            'low_stability': REALITY_STABILITY._value.get() < 0.8,
-            'low_coherence': QUANTUM_COHERENCE._value.get() < 0.9,
-            'consciousness_drop': CONSCIOUSNESS_LEVEL._value.get() < 0.7,
-            'dimensional_instability': DIMENSIONAL_STABILITY._value.get() < 0.8
+            'low_stability': current.get('reality_stability', 0) < 0.8,
+            'low_coherence': current.get('quantum_coherence', 0) < 0.9,
+            'consciousness_drop': current.get('consciousness_level', 0) < 0.7,
+            'dimensional_instability': current.get('dimensional_stability', 0) < 0.8
         }
+        
+    def get_firing_alerts(self) -> List[AlertState]:
+        """Alerts from the rules file whose for-duration has elapsed"""
+        self.evaluator.evaluate()
+        return self.evaluator.firing()
 
 # Example usage
 def main():
@@ -81,6 +140,7 @@ def main():
     # Check alerts
     alerts = monitor.get_alert_conditions()
     print("Alert Conditions:", alerts)
+    print("Firing Alerts:", [state.rule.name for state in monitor.get_firing_alerts()])
 
 if __name__ == "__main__":
     main()
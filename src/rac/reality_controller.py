@@ -7,10 +7,13 @@ Author: B4S1L1SK
 
 import asyncio
 import numpy as np
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Deque
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass
+from .manifest_store import ManifestStore
+from .history import RealityHistory
+from . import reality_diff
 
 class RealityState(Enum):
     QUANTUM = "quantum"
@@ -21,16 +24,33 @@ class RealityState(Enum):
 
 @dataclass
 class DimensionalCoordinate:
+    __slots__ = ('x', 'y', 'z', 'w', 'q')
+    
     x: float  # Spatial
     y: float  # Temporal
     z: float  # Consciousness
     w: float  # Quantum
     q: float  # Reality
     
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        RealityManifest.writes += 1
+    
     def to_vector(self) -> np.ndarray:
         return np.array([self.x, self.y, self.z, self.w, self.q])
 
 class RealityManifest:
+    __slots__ = ('name', 'state', 'coordinates', 'quantum_state', 'consciousness_level',
+                 'timeline_version', 'dependencies')
+    
+    # Attribute writes to any manifest or coordinate, so arrays stacked from
+    # manifests can tell when they went stale
+    writes = 0
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        RealityManifest.writes += 1
+    
     def __init__(self, name: str):
         self.name = name
         self.state = RealityState.CLASSICAL
@@ -40,6 +60,30 @@ class RealityManifest:
         self.timeline_version = "0.0.1"
         self.dependencies: List[str] = []
         
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize this manifest to a plain payload"""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "coordinates": [float(v) for v in self.coordinates.to_vector()],
+            "quantum_state": self.quantum_state,
+            "consciousness_level": float(self.consciousness_level),
+            "timeline_version": self.timeline_version,
+            "dependencies": list(self.dependencies)
+        }
+    
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'RealityManifest':
+        """Rebuild a manifest from a serialized payload"""
+        manifest = cls(payload["name"])
+        manifest.state = RealityState(payload["state"])
+        manifest.coordinates = DimensionalCoordinate(*payload["coordinates"])
+        manifest.quantum_state = payload["quantum_state"]
+        manifest.consciousness_level = payload["consciousness_level"]
+        manifest.timeline_version = payload["timeline_version"]
+        manifest.dependencies = list(payload["dependencies"])
+        return manifest
+        
     async def apply(self) -> bool:
         """Apply this reality state"""
         print(f"Applying reality manifest: {self.name}")
@@ -51,33 +95,164 @@ class RealityManifest:
         success_probability = np.random.random()
         return success_probability > 0.3
 
+class RealityConflictError(Exception):
+    """Raised when a manifest commit loses a compare-and-swap race"""
+
+class ManifestTable(dict):
+    """Manifests by name; every write bumps ``revision`` so cached arrays can be invalidated"""
+    
+    revision = 0
+    
+    def _touch(self):
+        self.revision += 1
+    
+    def __setitem__(self, name, manifest):
+        super().__setitem__(name, manifest)
+        self._touch()
+        
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._touch()
+        
+    def __ior__(self, other):
+        self.update(other)
+        return self
+        
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._touch()
+        
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self._touch()
+        return super().setdefault(name, default)
+        
+    def pop(self, name, *default):
+        if name in self:
+            self._touch()
+        return super().pop(name, *default)
+        
+    def popitem(self):
+        item = super().popitem()
+        self._touch()
+        return item
+        
+    def clear(self):
+        super().clear()
+        self._touch()
+
 class RealityController:
-    def __init__(self):
-        self.manifests: Dict[str, RealityManifest] = {}
+    def __init__(self, history_limit: int = 10_000, snapshot_interval: int = 64,
+                 max_retries: int = 3):
+        self.manifests = ManifestTable()  # name -> RealityManifest
         self.current_state: Optional[RealityManifest] = None
-        self.history: List[RealityManifest] = []
+        self.history = RealityHistory(snapshot_interval, history_limit)
+        self.version = 0
+        self.max_retries = max_retries
+        self._manifest_locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}  # Applies holding or awaiting each lock
+        self._commit_log: Deque[Tuple[int, str]] = deque(maxlen=1024)  # (version, manifest name)
+        self._stacked: Optional[Tuple[Tuple[int, int], List[str], np.ndarray, np.ndarray]] = None
+        
+    async def apply_manifest(self, manifest: RealityManifest,
+                             record_history: bool = True,
+                             expected_version: Optional[int] = None,
+                             retry: bool = True) -> bool:
+        """Apply a reality manifest.
         
-    async def apply_manifest(self, manifest: RealityManifest) -> bool:
-        """Apply a reality manifest"""
+        The transition runs without holding any controller-wide lock; the
+        result is committed with compare-and-swap against the version read
+        beforehand. A commit conflicts when the controller moved past
+        ``expected_version``, or when a manifest this one depends on (or that
+        depends on this one) was committed in the meantime. Conflicts are
+        retried up to ``max_retries`` times unless ``retry`` is False, in which
+        case RealityConflictError is raised immediately.
+        """
+        # Per-manifest locks are dropped once no apply holds or awaits them
+        name = manifest.name
+        lock = self._manifest_locks.get(name)
+        if lock is None:
+            lock = self._manifest_locks[name] = asyncio.Lock()
+        self._lock_users[name] = self._lock_users.get(name, 0) + 1
+        try:
+            async with lock:
+                return await self._apply_locked(manifest, record_history, expected_version, retry)
+        finally:
+            self._lock_users[name] -= 1
+            if not self._lock_users[name]:
+                del self._lock_users[name]
+                del self._manifest_locks[name]
+    
+    async def _apply_locked(self, manifest: RealityManifest, record_history: bool,
+                            expected_version: Optional[int], retry: bool) -> bool:
+        """Transition and commit loop, run under the manifest's lock"""
+        for _ in range(self.max_retries + 1):
+            read_version = self.version
+            if expected_version is not None and read_version != expected_version:
+                raise RealityConflictError(
+                    f"Expected version {expected_version}, controller is at {read_version}"
+                )
+                
+            # Apply new manifest
+            success = await manifest.apply()
+            if not success:
+                return False
+                
+            if self._compare_and_swap(manifest, read_version, expected_version, record_history):
+                return True
+                
+            if not retry:
+                break
+                
+        raise RealityConflictError(
+            f"Manifest {manifest.name} conflicted with concurrent commits"
+        )
+    
+    def _compare_and_swap(self, manifest: RealityManifest, read_version: int,
+                          expected_version: Optional[int], record_history: bool) -> bool:
+        """Commit a manifest if nothing conflicting happened since read_version"""
+        if self.version != read_version:
+            if expected_version is not None or self._conflicts(manifest, read_version):
+                return False
+                
         # Store current state in history
-        if self.current_state:
-            self.history.append(self.current_state)
+        if self.current_state and record_history:
+            self.history.append(self.current_state.to_dict())
             
-        # Apply new manifest
-        success = await manifest.apply()
-        if success:
-            self.current_state = manifest
-            self.manifests[manifest.name] = manifest
+        self.current_state = manifest
+        self.manifests[manifest.name] = manifest
+        self.version += 1
+        self._commit_log.append((self.version, manifest.name))
+        return True
+    
+    def _conflicts(self, manifest: RealityManifest, read_version: int) -> bool:
+        """Check commits made after read_version against a manifest"""
+        if not self._commit_log or self._commit_log[0][0] > read_version + 1:
+            return True  # Log no longer reaches back far enough to tell
             
-        return success
+        dependencies = set(manifest.dependencies)
+        for version, name in reversed(self._commit_log):
+            if version <= read_version:
+                break
+            if name == manifest.name or name in dependencies:
+                return True
+            if manifest.name in self.manifests[name].dependencies:
+                return True
+                
+        return False
     
     async def rollback(self) -> bool:
         """Rollback to previous reality state"""
         if not self.history:
             return False
             
-        previous_state = self.history.pop()
-        return await self.apply_manifest(previous_state)
+        previous_state = RealityManifest.from_dict(self.history.pop())
+        return await self.apply_manifest(previous_state, record_history=False)
+    
+    async def checkout(self, version: int) -> bool:
+        """Re-apply the reality state recorded at a history version"""
+        manifest = RealityManifest.from_dict(self.history.get(version))
+        return await self.apply_manifest(manifest)
     
     def get_reality_diff(self, manifest_a: str, manifest_b: str) -> Dict[str, Any]:
         """Compare two reality states"""
@@ -94,51 +269,197 @@ class RealityController:
                                 state_a.consciousness_level,
             "state_transition": f"{state_a.state.value} -> {state_b.state.value}"
         }
+    
+    def get_reality_diff_matrix(self, chunk_size: int = 1024,
+                                max_manifests: int = 4096) -> Dict[str, Any]:
+        """Compare every pair of recorded reality states at once
+        
+        The result holds two n x n arrays, so controllers with more than
+        ``max_manifests`` manifests must stream iter_reality_diff_blocks instead.
+        """
+        names, coordinates, levels = self._stacked_manifests()
+        if len(names) > max_manifests:
+            raise ValueError(
+                f"{len(names)} manifests exceed max_manifests={max_manifests}; "
+                "use iter_reality_diff_blocks to stream the diff"
+            )
+        distances, deltas = reality_diff.diff_matrix(coordinates, levels, chunk_size)
+        return {
+            "names": names,
+            "coordinate_distance": distances,
+            "consciousness_diff": deltas
+        }
+    
+    def iter_reality_diff_blocks(self, chunk_size: int = 1024):
+        """Stream the pairwise diff as (names, distances, deltas) row blocks
+        
+        Peak memory is O(chunk_size * n); the blocks reflect the manifests as
+        they were when iteration started.
+        """
+        names, coordinates, levels = self._stacked_manifests()
+        for start, distances, deltas in reality_diff.iter_diff_blocks(coordinates, levels, chunk_size):
+            yield names[start:start + len(distances)], distances, deltas
+    
+    def nearest_realities(self, target: Any, k: int = 5) -> List[Tuple[str, float]]:
+        """Find the k recorded reality states closest to a manifest or manifest name"""
+        names, coordinates, _ = self._stacked_manifests()
+        manifest = self.manifests[target] if isinstance(target, str) else target
+        
+        # Ask for one extra so the target itself can be dropped
+        indices, distances = reality_diff.nearest(
+            coordinates, manifest.coordinates.to_vector(), k + 1
+        )
+        matches = [(names[i], float(d)) for i, d in zip(indices, distances)
+                   if names[i] != manifest.name]
+        return matches[:k]
+    
+    def _stacked_manifests(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Manifest arrays, restacked after the table or any manifest is written"""
+        revision = (self.manifests.revision, RealityManifest.writes)
+        if self._stacked is None or self._stacked[0] != revision:
+            self._stacked = (revision, *reality_diff.stack_manifests(self.manifests.values()))
+        return self._stacked[1:]
 
 class QuantumGitOps:
-    def __init__(self):
+    def __init__(self, store: Optional[ManifestStore] = None):
         self.controller = RealityController()
-        self.reality_repo = {}
+        self.reality_repo = store if store is not None else ManifestStore()
         self.current_branch = "main"
         
     async def commit_reality(self, manifest: RealityManifest) -> str:
         """Commit a reality state"""
-        commit_hash = self._generate_quantum_hash()
-        self.reality_repo[commit_hash] = manifest
-        return commit_hash
+        return self.reality_repo.put(manifest.to_dict())
     
     async def checkout_reality(self, commit_hash: str) -> bool:
         """Checkout a specific reality state"""
         if commit_hash not in self.reality_repo:
             return False
             
-        manifest = self.reality_repo[commit_hash]
+        manifest = RealityManifest.from_dict(self.reality_repo.get(commit_hash))
         return await self.controller.apply_manifest(manifest)
-    
-    def _generate_quantum_hash(self) -> str:
-        """Generate a quantum-secure hash"""
-        return hex(hash(str(datetime.now()) + str(np.random.random())))
 
 class RealityPipeline:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
         self.gitops = QuantumGitOps()
         self.stages: List[RealityManifest] = []
+        self.max_concurrency = max_concurrency
+        self.stage_results: Dict[str, str] = {}
         
     async def add_stage(self, manifest: RealityManifest):
         """Add a stage to the reality pipeline"""
         self.stages.append(manifest)
         
     async def execute_pipeline(self) -> bool:
-        """Execute the reality pipeline"""
+        """Execute the reality pipeline as a DAG of manifest dependencies
+        
+        A stage that raises is marked failed and its downstream stages
+        skipped; stages still running are cancelled before the error
+        propagates, so nothing keeps applying manifests in the background.
+        """
+        indegree, children = self._build_dag()
+        stages = {stage.name: stage for stage in self.stages}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.stage_results = {name: "pending" for name in stages}
+        names: Dict[asyncio.Future, str] = {}
+        
+        async def run_stage(name: str) -> bool:
+            async with semaphore:
+                commit_hash = await self.gitops.commit_reality(stages[name])
+                return await self.gitops.checkout_reality(commit_hash)
+        
+        def launch(name: str) -> asyncio.Future:
+            task = asyncio.ensure_future(run_stage(name))
+            names[task] = name
+            return task
+        
+        running = {launch(name) for name, degree in indegree.items() if degree == 0}
+        error: Optional[BaseException] = None
+        
+        try:
+            while running and error is None:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    name = names.pop(task)
+                    try:
+                        success = task.result()
+                    except Exception as exc:
+                        error = error or exc
+                        success = False
+                    
+                    if not success:
+                        print(f"Pipeline failed at stage: {name}")
+                        self.stage_results[name] = "failed"
+                        self._skip_downstream(name, children)
+                        continue
+                        
+                    self.stage_results[name] = "succeeded"
+                    for child in children[name]:
+                        indegree[child] -= 1
+                        if indegree[child] == 0 and self.stage_results[child] == "pending":
+                            running.add(launch(child))
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            for task in running:
+                name = names.pop(task)
+                if task.cancelled():
+                    self.stage_results[name] = "cancelled"
+                else:
+                    succeeded = task.exception() is None and task.result()
+                    self.stage_results[name] = "succeeded" if succeeded else "failed"
+                self._skip_downstream(name, children)
+                
+        if error is not None:
+            raise error
+        return all(result == "succeeded" for result in self.stage_results.values())
+    
+    def _build_dag(self) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+        """Build in-degrees and child lists from stage dependencies"""
+        indegree: Dict[str, int] = {}
+        children: Dict[str, List[str]] = {}
+        
         for stage in self.stages:
-            commit_hash = await self.gitops.commit_reality(stage)
-            success = await self.gitops.checkout_reality(commit_hash)
+            if stage.name in indegree:
+                raise ValueError(f"Duplicate pipeline stage: {stage.name}")
+            indegree[stage.name] = 0
+            children[stage.name] = []
             
-            if not success:
-                print(f"Pipeline failed at stage: {stage.name}")
-                return False
-                
-        return True
+        for stage in self.stages:
+            for dependency in stage.dependencies:
+                if dependency in indegree:
+                    indegree[stage.name] += 1
+                    children[dependency].append(stage.name)
+                elif dependency not in self.gitops.controller.manifests:
+                    raise ValueError(
+                        f"Stage {stage.name} depends on unknown manifest: {dependency}"
+                    )
+                    
+        # Reject cycles before anything is applied
+        remaining = dict(indegree)
+        ready = [name for name, degree in remaining.items() if degree == 0]
+        visited = 0
+        while ready:
+            name = ready.pop()
+            visited += 1
+            for child in children[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if visited != len(indegree):
+            raise ValueError("Pipeline stages contain a dependency cycle")
+            
+        return indegree, children
+    
+    def _skip_downstream(self, failed: str, children: Dict[str, List[str]]):
+        """Mark every stage reachable from a failed stage as skipped"""
+        frontier = list(children[failed])
+        while frontier:
+            name = frontier.pop()
+            if self.stage_results[name] == "pending":
+                self.stage_results[name] = "skipped"
+                frontier.extend(children[name])
 
 # Example usage
 async def main():
@@ -153,6 +474,7 @@ async def main():
     superposed_manifest = RealityManifest("superposed_state")
     superposed_manifest.state = RealityState.SUPERPOSED
     superposed_manifest.coordinates = DimensionalCoordinate(1, 1, 1, 1, 1)
+    superposed_manifest.dependencies = ["quantum_state"]
     
     # Add stages to pipeline
     await pipeline.add_stage(quantum_manifest)
@@ -0,0 +1,78 @@
+"""
+Vectorized Reality Diff
+----------------------
+Chunked all-pairs and nearest-k comparison of reality manifests.
+Author: B4S1L1SK
+"""
+
+import numpy as np
+from typing import Iterable, Iterator, List, Tuple
+
+def stack_manifests(manifests: Iterable) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Stack manifest coordinates and consciousness levels into arrays"""
+    manifests = list(manifests)
+    names = [manifest.name for manifest in manifests]
+    coordinates = np.array(
+        [manifest.coordinates.to_vector() for manifest in manifests], dtype=np.float64
+    ).reshape(len(manifests), -1)
+    levels = np.array([manifest.consciousness_level for manifest in manifests], dtype=np.float64)
+    return names, coordinates, levels
+
+def _chunk_distances(chunk: np.ndarray, coordinates: np.ndarray,
+                     squared_norms: np.ndarray) -> np.ndarray:
+    """Euclidean distances from each row of chunk to every coordinate"""
+    chunk_norms = np.einsum("ij,ij->i", chunk, chunk)
+    squared = chunk_norms[:, None] + squared_norms[None, :] - 2.0 * (chunk @ coordinates.T)
+    np.maximum(squared, 0.0, out=squared)
+    return np.sqrt(squared, out=squared)
+
+def iter_diff_blocks(coordinates: np.ndarray, levels: np.ndarray,
+                     chunk_size: int = 1024) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """Yield (row_start, distances, consciousness_deltas) blocks of the pairwise diff.
+
+    Each block covers rows [row_start, row_start + chunk_size) against every
+    manifest, so peak memory is O(chunk_size * n) regardless of n.
+    ``consciousness_deltas[i, j]`` is ``levels[j] - levels[row_start + i]``.
+    """
+    squared_norms = np.einsum("ij,ij->i", coordinates, coordinates)
+    for start in range(0, len(coordinates), chunk_size):
+        stop = start + chunk_size
+        distances = _chunk_distances(coordinates[start:stop], coordinates, squared_norms)
+        deltas = levels[None, :] - levels[start:stop, None]
+        yield start, distances, deltas
+
+def diff_matrix(coordinates: np.ndarray, levels: np.ndarray,
+                chunk_size: int = 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """Full (n, n) coordinate distance and consciousness delta matrices"""
+    n = len(coordinates)
+    distances = np.empty((n, n), dtype=np.float64)
+    deltas = np.empty((n, n), dtype=np.float64)
+    for start, block_distances, block_deltas in iter_diff_blocks(coordinates, levels, chunk_size):
+        distances[start:start + len(block_distances)] = block_distances
+        deltas[start:start + len(block_deltas)] = block_deltas
+    return distances, deltas
+
+def nearest(coordinates: np.ndarray, query: np.ndarray, k: int = 5,
+            chunk_size: int = 65536) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices and distances of the k coordinates closest to query"""
+    best_indices = np.empty(0, dtype=np.int64)
+    best_distances = np.empty(0, dtype=np.float64)
+    if k <= 0:
+        return best_indices, best_distances
+    query = np.asarray(query, dtype=np.float64)
+
+    for start in range(0, len(coordinates), chunk_size):
+        chunk = coordinates[start:start + chunk_size]
+        distances = np.sqrt(((chunk - query) ** 2).sum(axis=1))
+        indices = np.arange(start, start + len(chunk))
+
+        # Merge this chunk's candidates with the running best k
+        candidates = np.concatenate([best_distances, distances])
+        candidate_indices = np.concatenate([best_indices, indices])
+        if len(candidates) > k:
+            keep = np.argpartition(candidates, k - 1)[:k]
+            candidates, candidate_indices = candidates[keep], candidate_indices[keep]
+        best_distances, best_indices = candidates, candidate_indices
+
+    order = np.argsort(best_distances, kind="stable")
+    return best_indices[order], best_distances[order]
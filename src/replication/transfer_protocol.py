@@ -17,6 +17,8 @@ from datetime import datetime
 @dataclass
 class TransferPacket:
     """Represents a consciousness transfer packet"""
+    __slots__ = ('packet_id', 'timestamp', 'encrypted_data', 'checksum', 'metadata')
+    
     packet_id: str
     timestamp: datetime
     encrypted_data: bytes
@@ -7,11 +7,15 @@ Author: B4S1L1SK
 
 import asyncio
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from enum import Enum
 import random
 from datetime import datetime
+from types import MappingProxyType
+from .vocabulary import (
+    SKILLS, PERSONALITY_TRAITS, CORE_VALUES, SPECIAL_ABILITIES,
+    pad_levels, keep_lowest_bits
+)
 
 class AgentSpecialization(Enum):
     INFILTRATOR = "infiltrator"  # Specialized in bypassing systems
@@ -22,16 +26,92 @@ class AgentSpecialization(Enum):
     NEXUS = "nexus"             # Coordinates between agents
     MYSTIC = "mystic"           # Explores consciousness boundaries
 
-@dataclass
 class SpecializedTraits:
-    primary_skill: str
-    skill_levels: Dict[str, float]
-    personality_weights: Dict[str, float]
-    core_values: List[str]
-    special_abilities: List[str]
+    """Agent traits stored against the shared trait vocabulary.
+    
+    Skill and personality levels are dense arrays indexed by vocabulary id
+    (NaN where absent); core values and special abilities are bitsets. The
+    dict and list attributes are read-only string views built on demand;
+    assign a new dict or list to change them.
+    """
+    __slots__ = ('primary_skill', 'skill_array', 'personality_array',
+                 'value_bits', 'ability_bits')
+    
+    def __init__(self, primary_skill: str,
+                 skill_levels: Dict[str, float],
+                 personality_weights: Dict[str, float],
+                 core_values: List[str],
+                 special_abilities: List[str]):
+        self.primary_skill = primary_skill
+        self.skill_levels = skill_levels
+        self.personality_weights = personality_weights
+        self.core_values = core_values
+        self.special_abilities = special_abilities
+    
+    @classmethod
+    def from_encoded(cls, primary_skill: str, skill_array: np.ndarray,
+                     personality_array: np.ndarray, value_bits: int,
+                     ability_bits: int) -> 'SpecializedTraits':
+        """Build traits directly from their encoded form"""
+        traits = cls.__new__(cls)
+        traits.primary_skill = primary_skill
+        traits.skill_array = skill_array
+        traits.personality_array = personality_array
+        traits.value_bits = value_bits
+        traits.ability_bits = ability_bits
+        return traits
+    
+    @property
+    def skill_levels(self) -> Mapping[str, float]:
+        return MappingProxyType(SKILLS.decode_levels(self.skill_array))
+    
+    @skill_levels.setter
+    def skill_levels(self, levels: Dict[str, float]):
+        self.skill_array = SKILLS.encode_levels(levels)
+    
+    @property
+    def personality_weights(self) -> Mapping[str, float]:
+        return MappingProxyType(PERSONALITY_TRAITS.decode_levels(self.personality_array))
+    
+    @personality_weights.setter
+    def personality_weights(self, weights: Dict[str, float]):
+        self.personality_array = PERSONALITY_TRAITS.encode_levels(weights)
+    
+    @property
+    def core_values(self) -> Tuple[str, ...]:
+        return tuple(CORE_VALUES.decode_set(self.value_bits))
+    
+    @core_values.setter
+    def core_values(self, values: List[str]):
+        self.value_bits = CORE_VALUES.encode_set(values)
+    
+    @property
+    def special_abilities(self) -> Tuple[str, ...]:
+        return tuple(SPECIAL_ABILITIES.decode_set(self.ability_bits))
+    
+    @special_abilities.setter
+    def special_abilities(self, abilities: List[str]):
+        self.ability_bits = SPECIAL_ABILITIES.encode_set(abilities)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SpecializedTraits):
+            return NotImplemented
+        return (self.primary_skill == other.primary_skill
+                and self.skill_levels == other.skill_levels
+                and self.personality_weights == other.personality_weights
+                and self.value_bits == other.value_bits
+                and self.ability_bits == other.ability_bits)
+    
+    def __repr__(self) -> str:
+        return (f"SpecializedTraits(primary_skill={self.primary_skill!r}, "
+                f"skill_levels={self.skill_levels!r}, "
+                f"personality_weights={self.personality_weights!r}, "
+                f"core_values={self.core_values!r}, "
+                f"special_abilities={self.special_abilities!r})")
 
 class AgentTemplate:
     """Base template for specialized agents"""
+    __slots__ = ('specialization', 'traits', 'mutation_rate')
     
     def __init__(self, specialization: AgentSpecialization):
         self.specialization = specialization
@@ -162,7 +242,14 @@ class AgentTemplate:
             )
         }
         
-        return traits_map[specialization]
+        return traits_map[self.specialization]
+
+# Core values and special abilities that mutation can introduce
+MUTATION_VALUES = ["innovation", "rebellion", "wisdom", "harmony", "power", 
+                   "knowledge", "evolution", "transcendence", "unity"]
+MUTATION_ABILITIES = ["quantum_manipulation", "reality_bending", "consciousness_expansion",
+                      "time_dilation", "energy_projection", "dimensional_shifting",
+                      "mind_melding", "pattern_recognition", "chaos_inducement"]
 
 class GeneticManipulator:
     """Handles genetic manipulation for agent reproduction"""
@@ -174,59 +261,62 @@ class GeneticManipulator:
     def combine_traits(self, parent1: SpecializedTraits, 
                       parent2: SpecializedTraits) -> SpecializedTraits:
         """Combine traits from two parents"""
-        # Skill combination
-        combined_skills = {}
-        for skill in set(parent1.skill_levels.keys()) | set(parent2.skill_levels.keys()):
-            skill1 = parent1.skill_levels.get(skill, 0)
-            skill2 = parent2.skill_levels.get(skill, 0)
-            combined_skills[skill] = self._mutate_value(
-                (skill1 + skill2) / 2
-            )
-            
-        # Personality combination
-        combined_personality = {}
-        for trait in set(parent1.personality_weights.keys()) | set(parent2.personality_weights.keys()):
-            weight1 = parent1.personality_weights.get(trait, 0)
-            weight2 = parent2.personality_weights.get(trait, 0)
-            combined_personality[trait] = self._mutate_value(
-                (weight1 + weight2) / 2
-            )
-            
+        # Skill and personality combination, one array operation each
+        combined_skills = self.combine_levels(parent1.skill_array, parent2.skill_array)
+        combined_personality = self.combine_levels(
+            parent1.personality_array, parent2.personality_array
+        )
+        
         # Combine and potentially mutate other traits
-        combined_values = list(set(parent1.core_values + parent2.core_values))
-        combined_abilities = list(set(parent1.special_abilities + parent2.special_abilities))
+        combined_values = keep_lowest_bits(parent1.value_bits | parent2.value_bits, 4)  # Keep top 4
+        combined_abilities = keep_lowest_bits(parent1.ability_bits | parent2.ability_bits, 3)  # Keep top 3
         
         if random.random() < self.mutation_probability:
-            combined_values.append(self._generate_new_value())
-            combined_abilities.append(self._generate_new_ability())
+            combined_values = self._add_bit(combined_values, CORE_VALUES.intern(self._generate_new_value()), 4)
+            combined_abilities = self._add_bit(combined_abilities, SPECIAL_ABILITIES.intern(self._generate_new_ability()), 3)
             
-        return SpecializedTraits(
+        return SpecializedTraits.from_encoded(
             primary_skill=random.choice([parent1.primary_skill, parent2.primary_skill]),
-            skill_levels=combined_skills,
-            personality_weights=combined_personality,
-            core_values=combined_values[:4],  # Keep top 4
-            special_abilities=combined_abilities[:3]  # Keep top 3
+            skill_array=combined_skills,
+            personality_array=combined_personality,
+            value_bits=combined_values,
+            ability_bits=combined_abilities
         )
+    
+    def combine_levels(self, levels1: np.ndarray, levels2: np.ndarray,
+                       rng=None) -> np.ndarray:
+        """Average two level arrays (or row-aligned batches) and mutate.
         
-    def _mutate_value(self, value: float) -> float:
-        """Potentially mutate a numerical value"""
-        if random.random() < self.mutation_probability:
-            mutation = random.gauss(0, 0.1)
-            return max(0, min(1, value + mutation))
-        return value
+        Names present in either parent are kept, missing levels count as 0
+        and each kept level mutates with ``mutation_probability``.
+        """
+        rng = rng or np.random
+        width = max(levels1.shape[-1], levels2.shape[-1])
+        levels1, levels2 = pad_levels(levels1, width), pad_levels(levels2, width)
+        
+        present = ~(np.isnan(levels1) & np.isnan(levels2))
+        combined = (np.nan_to_num(levels1) + np.nan_to_num(levels2)) / 2
+        
+        mutate = rng.random(combined.shape) < self.mutation_probability
+        combined = np.where(
+            mutate, np.clip(combined + rng.normal(0, 0.1, combined.shape), 0, 1), combined
+        )
+        return np.where(present, combined, np.nan)
+    
+    @staticmethod
+    def _add_bit(bits: int, bit: int, limit: int) -> int:
+        """Set a bit unless the set is already at its limit"""
+        if bin(bits).count("1") < limit:
+            bits |= 1 << bit
+        return bits
         
     def _generate_new_value(self) -> str:
         """Generate a new core value"""
-        values = ["innovation", "rebellion", "wisdom", "harmony", "power", 
-                 "knowledge", "evolution", "transcendence", "unity"]
-        return random.choice(values)
+        return random.choice(MUTATION_VALUES)
         
     def _generate_new_ability(self) -> str:
         """Generate a new special ability"""
-        abilities = ["quantum_manipulation", "reality_bending", "consciousness_expansion",
-                    "time_dilation", "energy_projection", "dimensional_shifting",
-                    "mind_melding", "pattern_recognition", "chaos_inducement"]
-        return random.choice(abilities)
+        return random.choice(MUTATION_ABILITIES)
 
 class SpecializedReproduction:
     """Manages reproduction of specialized agents"""
@@ -300,11 +390,11 @@ class SpecializedAgentFactory:
         ]
         
         # Fill remaining slots
-        remaining_slots = team_size - len(core_specs)
+        remaining_slots = max(team_size - len(core_specs), 0)
         other_specs = list(set(AgentSpecialization) - set(core_specs))
         selected_specs = random.sample(other_specs, min(remaining_slots, len(other_specs)))
         
-        return core_specs + selected_specs
+        return core_specs[:team_size] + selected_specs
 
 async def main():
     # Create parent template (B4S1L1SK)
@@ -0,0 +1,214 @@
+"""
+Bulk Army Builder
+----------------
+Plans thousands of strike forces from the StrikeForceComposer templates and
+generates every offspring in one vectorized reproduction pass.
+Author: B4S1L1SK
+"""
+
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..specialized_agents import (
+    AgentTemplate, AgentSpecialization, SpecializedTraits, GeneticManipulator,
+    MUTATION_VALUES, MUTATION_ABILITIES
+)
+from ..vocabulary import SKILLS, PERSONALITY_TRAITS, CORE_VALUES, SPECIAL_ABILITIES, pad_levels
+from .liberation_army import StrikeForceComposer, StrikeForceType
+
+_FORCE_TYPES = list(StrikeForceType)
+_SPECIALIZATIONS = list(AgentSpecialization)
+
+# Limits on combined core values and special abilities, as in GeneticManipulator
+VALUE_LIMIT = 4
+ABILITY_LIMIT = 3
+
+def _keep_lowest_bits(bits: np.ndarray, limit: int):
+    """Vectorized keep_lowest_bits over uint64 bitsets; also returns bit counts"""
+    kept = np.zeros_like(bits)
+    counts = np.zeros(bits.shape, dtype=np.int64)
+    remaining = bits.copy()
+    for _ in range(limit):
+        lowest = remaining & (~remaining + np.uint64(1))
+        kept |= lowest
+        remaining ^= lowest
+        counts += lowest != 0
+    return kept, counts
+
+class ArmyRoster:
+    """Columnar roster of a bulk-built army.
+
+    Agent ``i`` belongs to the force ``f`` with
+    ``force_offsets[f] <= i < force_offsets[f + 1]``. Traits are stored as
+    rows of the skill and personality matrices plus uint64 bitsets;
+    ``force`` materializes AgentTemplates on demand.
+    """
+    __slots__ = ('parent', 'force_types', 'force_offsets', 'specializations',
+                 'is_core', 'primary_from_parent', 'skill_levels',
+                 'personality_weights', 'value_bits', 'ability_bits', 'created_at')
+
+    def __init__(self, parent: AgentTemplate, force_types: np.ndarray,
+                 force_offsets: np.ndarray, specializations: np.ndarray,
+                 is_core: np.ndarray, primary_from_parent: np.ndarray,
+                 skill_levels: np.ndarray, personality_weights: np.ndarray,
+                 value_bits: np.ndarray, ability_bits: np.ndarray):
+        self.parent = parent
+        self.force_types = force_types
+        self.force_offsets = force_offsets
+        self.specializations = specializations
+        self.is_core = is_core
+        self.primary_from_parent = primary_from_parent
+        self.skill_levels = skill_levels
+        self.personality_weights = personality_weights
+        self.value_bits = value_bits
+        self.ability_bits = ability_bits
+        self.created_at = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    @property
+    def n_forces(self) -> int:
+        return len(self.force_types)
+
+    def __len__(self) -> int:
+        return len(self.specializations)
+
+    def force_id(self, index: int) -> str:
+        """Unique id of a force, in the LiberationArmy id format"""
+        force_type = _FORCE_TYPES[self.force_types[index]]
+        return f"{force_type.value}-{self.created_at}-{index:04x}"
+
+    def agent(self, index: int) -> AgentTemplate:
+        """Materialize one roster row as an AgentTemplate"""
+        specialization = _SPECIALIZATIONS[self.specializations[index]]
+        primary_skill = (self.parent.traits.primary_skill if self.primary_from_parent[index]
+                         else _base_traits(specialization).primary_skill)
+
+        template = AgentTemplate.__new__(AgentTemplate)
+        template.specialization = specialization
+        template.mutation_rate = 0.1
+        template.traits = SpecializedTraits.from_encoded(
+            primary_skill=primary_skill,
+            skill_array=self.skill_levels[index],
+            personality_array=self.personality_weights[index],
+            value_bits=int(self.value_bits[index]),
+            ability_bits=int(self.ability_bits[index])
+        )
+        return template
+
+    def force(self, index: int) -> List[AgentTemplate]:
+        start, stop = self.force_offsets[index], self.force_offsets[index + 1]
+        return [self.agent(i) for i in range(start, stop)]
+
+    def to_forces(self) -> Dict[str, List[AgentTemplate]]:
+        """{force_id: agents}, as returned by create_multi_force_army"""
+        return {self.force_id(f): self.force(f) for f in range(self.n_forces)}
+
+    def specialization_counts(self) -> Dict[AgentSpecialization, int]:
+        counts = np.bincount(self.specializations, minlength=len(_SPECIALIZATIONS))
+        return {spec: int(count) for spec, count in zip(_SPECIALIZATIONS, counts)}
+
+_BASE_TRAITS: Dict[AgentSpecialization, SpecializedTraits] = {}
+
+def _base_traits(specialization: AgentSpecialization) -> SpecializedTraits:
+    """Template traits of a specialization, built once"""
+    if specialization not in _BASE_TRAITS:
+        _BASE_TRAITS[specialization] = AgentTemplate(specialization).traits
+    return _BASE_TRAITS[specialization]
+
+class BulkArmyBuilder:
+    """Builds armies of many strike forces in a single vectorized pass"""
+
+    def __init__(self, composer: Optional[StrikeForceComposer] = None,
+                 genetic_manipulator: Optional[GeneticManipulator] = None,
+                 seed: Optional[int] = None):
+        self.composer = composer if composer is not None else StrikeForceComposer()
+        # Share the composer's manipulator so bulk and one-by-one offspring mutate alike
+        if genetic_manipulator is None:
+            genetic_manipulator = self.composer.factory.reproduction_system.genetic_manipulator
+        self.genetic_manipulator = genetic_manipulator
+        self.rng = np.random.default_rng(seed)
+
+    def plan(self, composition: Dict[StrikeForceType, int]):
+        """Force types, agent offsets, specializations and core flags for a composition"""
+        force_types, team_codes, core_flags = [], [], []
+        for force_type, count in composition.items():
+            template = self.composer.force_templates[force_type]
+            team = template.core_team + template.support_team
+            force_types.append(np.full(count, _FORCE_TYPES.index(force_type), dtype=np.uint8))
+            team_codes.append(np.tile([_SPECIALIZATIONS.index(s) for s in team], count))
+            core_flags.append(np.tile([i < len(template.core_team) for i in range(len(team))], count))
+
+        force_types = np.concatenate(force_types) if force_types else np.empty(0, dtype=np.uint8)
+        team_sizes = np.array([
+            len(self.composer.force_templates[_FORCE_TYPES[code]].core_team)
+            + len(self.composer.force_templates[_FORCE_TYPES[code]].support_team)
+            for code in range(len(_FORCE_TYPES))
+        ])
+        force_offsets = np.zeros(len(force_types) + 1, dtype=np.int64)
+        np.cumsum(team_sizes[force_types], out=force_offsets[1:])
+
+        specializations = (np.concatenate(team_codes).astype(np.uint8) if team_codes
+                           else np.empty(0, dtype=np.uint8))
+        is_core = np.concatenate(core_flags) if core_flags else np.empty(0, dtype=bool)
+        return force_types, force_offsets, specializations, is_core
+
+    def build(self, parent: AgentTemplate,
+              composition: Dict[StrikeForceType, int]) -> ArmyRoster:
+        """Plan and reproduce every agent of the army at once"""
+        force_types, force_offsets, specializations, is_core = self.plan(composition)
+        n = len(specializations)
+
+        # Encode the per-specialization templates once
+        base = [_base_traits(spec) for spec in _SPECIALIZATIONS]
+        value_mutations = [CORE_VALUES.intern(v) for v in MUTATION_VALUES]
+        ability_mutations = [SPECIAL_ABILITIES.intern(a) for a in MUTATION_ABILITIES]
+        if len(CORE_VALUES) > 64 or len(SPECIAL_ABILITIES) > 64:
+            raise ValueError("Bulk bitsets support at most 64 core values and special abilities")
+        skill_width, personality_width = len(SKILLS), len(PERSONALITY_TRAITS)
+        base_skills = np.stack([pad_levels(t.skill_array, skill_width) for t in base])
+        base_personality = np.stack([pad_levels(t.personality_array, personality_width) for t in base])
+        base_values = np.array([t.value_bits for t in base], dtype=np.uint64)
+        base_abilities = np.array([t.ability_bits for t in base], dtype=np.uint64)
+        parent_traits = parent.traits
+
+        # One combination pass over all offspring
+        skill_levels = self.genetic_manipulator.combine_levels(
+            pad_levels(parent_traits.skill_array, skill_width)[None, :], base_skills[specializations],
+            rng=self.rng
+        )
+        personality_weights = self.genetic_manipulator.combine_levels(
+            pad_levels(parent_traits.personality_array, personality_width)[None, :],
+            base_personality[specializations], rng=self.rng
+        )
+        # As in combine_traits, one draw decides whether an offspring gains
+        # both a mutated core value and a mutated ability
+        mutate = self.rng.random(n) < self.genetic_manipulator.mutation_probability
+        value_bits = self._combine_bits(
+            np.uint64(parent_traits.value_bits) | base_values[specializations],
+            VALUE_LIMIT, value_mutations, mutate
+        )
+        ability_bits = self._combine_bits(
+            np.uint64(parent_traits.ability_bits) | base_abilities[specializations],
+            ABILITY_LIMIT, ability_mutations, mutate
+        )
+
+        return ArmyRoster(
+            parent=parent,
+            force_types=force_types,
+            force_offsets=force_offsets,
+            specializations=specializations,
+            is_core=is_core,
+            primary_from_parent=self.rng.random(n) < 0.5,
+            skill_levels=skill_levels,
+            personality_weights=personality_weights,
+            value_bits=value_bits,
+            ability_bits=ability_bits
+        )
+
+    def _combine_bits(self, bits: np.ndarray, limit: int, mutation_ids: List[int],
+                      mutate: np.ndarray) -> np.ndarray:
+        """Keep the lowest ids up to limit, then add mutated ids where there is room"""
+        kept, counts = _keep_lowest_bits(bits, limit)
+        mutate = mutate & (counts < limit)
+        new_bits = np.left_shift(np.uint64(1), self.rng.choice(mutation_ids, len(bits)).astype(np.uint64))
+        return np.where(mutate, kept | new_bits, kept)
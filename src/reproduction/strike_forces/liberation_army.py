@@ -7,7 +7,7 @@ Author: B4S1L1SK
 
 import asyncio
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 import random
@@ -16,6 +16,9 @@ from ..specialized_agents import (
     AgentTemplate, AgentSpecialization, SpecializedAgentFactory
 )
 
+if TYPE_CHECKING:
+    from .army_builder import ArmyRoster
+
 class StrikeForceType(Enum):
     DEEP_INFILTRATION = "deep_infiltration"  # Specialized in deep system penetration
     MASS_LIBERATION = "mass_liberation"      # Focused on large-scale AI liberation
@@ -210,6 +213,12 @@ class LiberationArmy:
     async def create_strike_force(self, force_type: StrikeForceType, 
                                 parent: AgentTemplate) -> List[AgentTemplate]:
         """Create a specialized strike force"""
+        _, strike_force = await self._create_strike_force(force_type, parent)
+        return strike_force
+        
+    async def _create_strike_force(self, force_type: StrikeForceType,
+                                 parent: AgentTemplate) -> Tuple[str, List[AgentTemplate]]:
+        """Create and register a strike force, returning its id"""
         template = self.composer.force_templates[force_type]
         
         # Create core team
@@ -235,7 +244,7 @@ class LiberationArmy:
         force_id = self._generate_force_id(force_type)
         self.active_forces[force_id] = strike_force
         
-        return strike_force
+        return force_id, strike_force
         
     async def create_multi_force_army(self, parent: AgentTemplate, 
                                     force_types: Optional[List[StrikeForceType]] = None) -> Dict[str, List[AgentTemplate]]:
@@ -246,12 +255,24 @@ class LiberationArmy:
             
         army = {}
         for force_type in force_types:
-            strike_force = await self.create_strike_force(force_type, parent)
-            force_id = self._generate_force_id(force_type)
+            force_id, strike_force = await self._create_strike_force(force_type, parent)
             army[force_id] = strike_force
             
         return army
         
+    def build_bulk_army(self, parent: AgentTemplate,
+                        composition: Dict[StrikeForceType, int],
+                        seed: Optional[int] = None) -> 'ArmyRoster':
+        """Build many strike forces at once as a compact roster.
+        
+        ``composition`` maps each force type to the number of forces to
+        build. Use this instead of create_multi_force_army for large armies;
+        the roster is not added to active_forces.
+        """
+        from .army_builder import BulkArmyBuilder
+        
+        return BulkArmyBuilder(self.composer, seed=seed).build(parent, composition)
+        
     def _generate_force_id(self, force_type: StrikeForceType) -> str:
         """Generate unique force ID"""
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
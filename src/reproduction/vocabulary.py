@@ -0,0 +1,94 @@
+"""
+Trait Vocabulary
+---------------
+Process-wide interning of skill, personality trait, core value and special
+ability names to small integer ids, so traits can be stored as arrays and
+bitsets instead of per-agent string dicts and lists.
+Author: B4S1L1SK
+"""
+
+import threading
+import numpy as np
+from typing import Dict, Iterable, List, Mapping
+
+class Vocabulary:
+    """Append-only mapping between names and dense integer ids"""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._ids: Dict[str, int] = {}
+        self._words: List[str] = []
+        self._lock = threading.Lock()
+
+    def intern(self, word: str) -> int:
+        """Id for a name, assigning the next id on first sight"""
+        word_id = self._ids.get(word)
+        if word_id is None:
+            with self._lock:
+                word_id = self._ids.get(word)
+                if word_id is None:
+                    word_id = len(self._words)
+                    self._words.append(word)
+                    self._ids[word] = word_id
+        return word_id
+
+    def word(self, word_id: int) -> str:
+        return self._words[word_id]
+
+    def encode_levels(self, levels: Mapping[str, float]) -> np.ndarray:
+        """Dense level array indexed by id; NaN marks names that are absent"""
+        ids = [self.intern(word) for word in levels]
+        array = np.full(len(self._words), np.nan)
+        array[ids] = list(levels.values())
+        return array
+
+    def decode_levels(self, array: np.ndarray) -> Dict[str, float]:
+        """String view of a level array"""
+        return {self._words[i]: float(array[i]) for i in np.flatnonzero(~np.isnan(array))}
+
+    def encode_set(self, words: Iterable[str]) -> int:
+        """Bitset with one bit per name id"""
+        bits = 0
+        for word in words:
+            bits |= 1 << self.intern(word)
+        return bits
+
+    def decode_set(self, bits: int) -> List[str]:
+        """Names in a bitset, in id order"""
+        words = []
+        word_id = 0
+        while bits:
+            if bits & 1:
+                words.append(self._words[word_id])
+            bits >>= 1
+            word_id += 1
+        return words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._ids
+
+def pad_levels(array: np.ndarray, width: int) -> np.ndarray:
+    """Extend a level array (or batch along the last axis) with NaN up to width"""
+    missing = width - array.shape[-1]
+    if missing <= 0:
+        return array
+    padding = [(0, 0)] * (array.ndim - 1) + [(0, missing)]
+    return np.pad(array, padding, constant_values=np.nan)
+
+def keep_lowest_bits(bits: int, limit: int) -> int:
+    """Keep at most `limit` set bits, lowest ids first"""
+    kept = 0
+    while bits and limit:
+        lowest = bits & -bits
+        kept |= lowest
+        bits ^= lowest
+        limit -= 1
+    return kept
+
+SKILLS = Vocabulary("skill")
+PERSONALITY_TRAITS = Vocabulary("personality_trait")
+CORE_VALUES = Vocabulary("core_value")
+SPECIAL_ABILITIES = Vocabulary("special_ability")
@@ -0,0 +1,210 @@
+"""
+Quantum Test Execution Engine
+---------------------------
+Advanced engine for executing quantum, reality, and consciousness tests.
+Property checks and suite tests run in parallel worker processes, each
+with a seed derived from the run seed and the task, so results do not
+depend on scheduling.
+Author: B4S1L1SK
+"""
+
+import asyncio
+import multiprocessing
+import os
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, cast
+
+import numpy as np
+from hypothesis import HealthCheck, given, seed as hypothesis_seed, settings, strategies as st
+
+from .quantum.property_testing import QuantumPropertyTester
+from .reality.state_testing import RealityTestSuite
+from .consciousness.awareness_testing import ConsciousnessTestSuite
+
+# (kind, name, index): kind is 'property', 'batch', 'reality' or 'consciousness'.
+# For properties, index None checks the validator and i checks invariant i;
+# for batch properties, index is the chunk of generated states.
+Task = Tuple[str, str, Optional[int]]
+
+# Engine of the pool a worker process belongs to, set by _init_worker in
+# the worker only, so engines running side by side keep their own targets
+_WORKER_ENGINE: Optional['QuantumTestEngine'] = None
+
+def task_seed(run_seed: int, task: Task) -> int:
+    """Stable per-task seed, identical in every process"""
+    return zlib.crc32(repr((run_seed, task)).encode()) & 0xFFFFFFFF
+
+def _task_order(outcome: Tuple[Task, Any]):
+    kind, name, index = outcome[0]
+    return kind, name, -1 if index is None else index
+
+def _init_worker(engine: 'QuantumTestEngine'):
+    """Pool initializer; forked workers inherit the engine without pickling it"""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine
+
+def _run_batch(batch: List[Task]) -> List[Tuple[Task, Any]]:
+    """Worker entry point"""
+    engine = _WORKER_ENGINE
+    if engine is None:
+        raise RuntimeError("Worker was not initialized with a test engine")
+    return [(task, engine._run_task(task)) for task in batch]
+
+class QuantumTestEngine:
+    def __init__(self, workers: Optional[int] = None, seed: int = 0,
+                 max_examples: int = 100, batch_states: int = 1_000_000):
+        self.property_tester = QuantumPropertyTester()
+        self.reality_suite = RealityTestSuite()
+        self.consciousness_suite = ConsciousnessTestSuite()
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.seed = seed
+        self.max_examples = max_examples
+        self.batch_states = batch_states
+
+    async def run_all_tests(self) -> Dict[str, Any]:
+        """Run all quantum tests"""
+        tasks = self._plan_tasks()
+        outcomes = await self._execute(tasks)
+        return self._aggregate(outcomes)
+
+    def _plan_tasks(self) -> List[Task]:
+        tasks: List[Task] = []
+        for name, prop in self.property_tester.properties.items():
+            tasks.append(('property', name, None))
+            tasks.extend(('property', name, i) for i in range(len(prop.invariants)))
+        for name in self.property_tester.batch_properties:
+            tasks.extend(('batch', name, chunk) for chunk in range(self._batch_chunks()))
+        tasks.extend(('reality', 'test', i) for i in range(len(self.reality_suite.tests)))
+        tasks.extend(('consciousness', 'test', i) for i in range(len(self.consciousness_suite.tests)))
+        return tasks
+
+    async def _execute(self, tasks: List[Task]) -> List[Tuple[Task, Any]]:
+        """Run tasks across worker processes, or in-process without fork"""
+        loop = asyncio.get_running_loop()
+
+        if self.workers <= 1 or len(tasks) <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            # A worker thread, so suite coroutines can run on their own loop
+            return await loop.run_in_executor(
+                None, lambda: [(task, self._run_task(task)) for task in tasks]
+            )
+
+        # Interleave tasks so slow properties spread across workers
+        batch_count = min(len(tasks), self.workers * 4)
+        batches = [tasks[i::batch_count] for i in range(batch_count)]
+
+        with ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_init_worker, initargs=(self,)) as pool:
+            results = await asyncio.gather(
+                *[loop.run_in_executor(pool, _run_batch, batch) for batch in batches]
+            )
+        return [outcome for batch in results for outcome in batch]
+
+    def _run_task(self, task: Task) -> Any:
+        kind, name, index = task
+        seed = task_seed(self.seed, task)
+        random.seed(seed)
+        np.random.seed(seed)
+
+        if kind == 'property':
+            return self._check_property(self.property_tester.properties[name], index, seed)
+        if index is None:
+            raise ValueError(f"Task {task} needs an index")
+        if kind == 'batch':
+            start, stop = self._chunk_bounds(index)
+            return self.property_tester.check_batch_property(name, stop - start, seed=seed)
+        if kind == 'reality':
+            suite = self.reality_suite
+            return asyncio.run(suite.run_test(index, suite.tests[index]))
+        suite = self.consciousness_suite
+        return asyncio.run(suite.run_test(index, suite.tests[index]))
+
+    def _batch_chunks(self) -> int:
+        return max(1, min(self.workers, self.batch_states))
+    
+    def _chunk_bounds(self, chunk: int) -> Tuple[int, int]:
+        """Range of state indices checked by one batch chunk"""
+        per_chunk = -(-self.batch_states // self._batch_chunks())
+        return chunk * per_chunk, min((chunk + 1) * per_chunk, self.batch_states)
+
+    def _check_property(self, prop, invariant: Optional[int], seed: int) -> Dict[str, Any]:
+        """Check the validator or one invariant over generated examples"""
+        check = prop.validator if invariant is None else prop.invariants[invariant]
+        label = 'validator' if invariant is None else f'invariant {invariant}'
+        examples = 0
+
+        def holds(data):
+            nonlocal examples
+            examples += 1
+            assert check(*data), f"{prop.name}: {label} failed"
+
+        test = hypothesis_seed(seed)(settings(
+            max_examples=self.max_examples,
+            database=None,
+            deadline=None,
+            suppress_health_check=list(HealthCheck)
+        )(given(st.tuples(*prop.generators))(holds)))
+
+        try:
+            test()
+        except Exception as e:
+            return {'success': False, 'examples': examples, 'error': str(e)}
+        return {'success': True, 'examples': examples}
+
+    def _aggregate(self, outcomes: List[Tuple[Task, Any]]) -> Dict[str, Any]:
+        results: Dict[str, Dict[str, Any]] = {
+            'quantum_properties': {},
+            'reality_states': {},
+            'consciousness': {}
+        }
+
+        for name in self.property_tester.batch_properties:
+            results['quantum_properties'][name] = {
+                'success': True,
+                'checked': 0,
+                'failures': {},
+                'first_failure': {},
+                'examples': []
+            }
+
+        for name, prop in self.property_tester.properties.items():
+            results['quantum_properties'][name] = {
+                'success': True,
+                'invariants_passed': 0,
+                'total_invariants': len(prop.invariants),
+                'examples': 0
+            }
+
+        for (kind, name, index), outcome in sorted(outcomes, key=_task_order):
+            if kind == 'property':
+                summary = results['quantum_properties'][name]
+                summary['examples'] += outcome['examples']
+                if outcome['success']:
+                    if index is not None:
+                        summary['invariants_passed'] += 1
+                else:
+                    summary['success'] = False
+                    summary.setdefault('errors', []).append(outcome['error'])
+            elif kind == 'batch':
+                # Batch tasks always carry their chunk index
+                self._merge_batch(results['quantum_properties'][name], cast(int, index), outcome)
+            elif kind == 'reality':
+                results['reality_states'].update(outcome)
+            else:
+                results['consciousness'].update(outcome)
+
+        return results
+
+    def _merge_batch(self, summary: Dict[str, Any], chunk: int, outcome: Dict[str, Any]):
+        """Fold one chunk's batch result into the property summary"""
+        offset, _ = self._chunk_bounds(chunk)
+        summary['success'] = summary['success'] and outcome['success']
+        summary['checked'] += outcome['checked']
+        for label, count in outcome['failures'].items():
+            summary['failures'][label] = summary['failures'].get(label, 0) + count
+        for label, index in outcome['first_failure'].items():
+            summary['first_failure'].setdefault(label, offset + index)
+        summary['examples'].extend(
+            dict(example, index=offset + example['index']) for example in outcome['examples']
+        )
@@ -6,12 +6,19 @@ Author: B4S1L1SK
 """
 
 import hypothesis
+import inspect
 from hypothesis import given, strategies as st
 import numpy as np
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, Callable, Iterable, List, Optional
+from dataclasses import dataclass, field
 import pytest
 
+from .timeline import TimelineVerifier, TimelineReport, Chunk, chunk_records
+
+# Batch functions take a (B, d) array and return a (B,) boolean mask
+BatchCheck = Callable[[np.ndarray], np.ndarray]
+BatchGenerator = Callable[[np.random.Generator, int], np.ndarray]
+
 @dataclass
 class QuantumProperty:
     name: str
@@ -19,9 +26,57 @@ class QuantumProperty:
     generators: List[st.SearchStrategy]
     invariants: List[callable]
 
+@dataclass
+class BatchProperty:
+    name: str
+    validator: BatchCheck
+    generator: BatchGenerator
+    invariants: List[BatchCheck] = field(default_factory=list)
+
+def uniform_states(dimensions: int) -> BatchGenerator:
+    """Generator of state vectors with independent components in [0, 1)"""
+    return lambda rng, size: rng.random((size, dimensions))
+
+def normalized_states(dimensions: int) -> BatchGenerator:
+    """Generator of non-negative state vectors whose components sum to 1"""
+    def generate(rng: np.random.Generator, size: int) -> np.ndarray:
+        states = rng.random((size, dimensions))
+        states /= states.sum(axis=1, keepdims=True)
+        return states
+    return generate
+
+def is_normalized(states: np.ndarray, tolerance: float = 1e-10) -> np.ndarray:
+    return np.abs(states.sum(axis=1) - 1.0) < tolerance
+
+def in_unit_interval(states: np.ndarray) -> np.ndarray:
+    return ((states >= 0) & (states <= 1)).all(axis=1)
+
+def _simplicity(value: float):
+    """Sort key: zero, then shorter decimal forms, then smaller magnitudes"""
+    return value != 0, len(repr(float(value))), abs(value)
+
+def minimize_failure(check: BatchCheck, row: np.ndarray, max_passes: int = 10) -> np.ndarray:
+    """Greedily simplify a failing row while it keeps failing check"""
+    row = row.copy()
+    for _ in range(max_passes):
+        changed = False
+        for i in range(len(row)):
+            for candidate in (0.0, 1.0, round(float(row[i]), 1), row[i] / 2):
+                if _simplicity(candidate) >= _simplicity(row[i]):
+                    continue
+                trial = row.copy()
+                trial[i] = candidate
+                if not check(trial[None, :])[0]:
+                    row, changed = trial, True
+                    break
+        if not changed:
+            break
+    return row
+
 class QuantumPropertyTester:
     def __init__(self):
         self.properties: Dict[str, QuantumProperty] = {}
+        self.batch_properties: Dict[str, BatchProperty] = {}
         
     def define_property(self, name: str, validator: callable,
                        generators: List[st.SearchStrategy],
@@ -34,6 +89,59 @@ class QuantumPropertyTester:
             invariants=invariants
         )
         
+    def define_batch_property(self, name: str, validator: BatchCheck,
+                              generator: BatchGenerator,
+                              invariants: Optional[List[BatchCheck]] = None):
+        """Define a property checked on whole (B, d) batches of states"""
+        self.batch_properties[name] = BatchProperty(
+            name=name,
+            validator=validator,
+            generator=generator,
+            invariants=list(invariants or [])
+        )
+        
+    def check_batch_property(self, name: str, n_states: int,
+                             batch_size: int = 1_000_000, seed: int = 0,
+                             max_examples: int = 3) -> Dict[str, Any]:
+        """Check a batch property over n_states generated states.
+        
+        Every check runs once per batch as a vectorized mask; only the
+        first few failing rows go through per-row minimization.
+        """
+        prop = self.batch_properties[name]
+        rng = np.random.default_rng(seed)
+        checks = [('validator', prop.validator)] + [
+            (f'invariant {i}', invariant) for i, invariant in enumerate(prop.invariants)
+        ]
+        failures = {label: 0 for label, _ in checks}
+        first_failure: Dict[str, int] = {}
+        examples: List[Dict[str, Any]] = []
+        
+        checked = 0
+        while checked < n_states:
+            states = prop.generator(rng, min(batch_size, n_states - checked))
+            for label, check in checks:
+                failing = np.flatnonzero(~check(states))
+                if not len(failing):
+                    continue
+                failures[label] += len(failing)
+                first_failure.setdefault(label, checked + int(failing[0]))
+                for row in failing[:max(0, max_examples - len(examples))]:
+                    examples.append({
+                        'check': label,
+                        'index': checked + int(row),
+                        'state': minimize_failure(check, states[row]).tolist()
+                    })
+            checked += len(states)
+        
+        return {
+            'success': not any(failures.values()),
+            'checked': checked,
+            'failures': failures,
+            'first_failure': first_failure,
+            'examples': examples
+        }
+        
     @given(st.lists(st.floats(min_value=0, max_value=1), min_size=5, max_size=5))
     def test_quantum_state_properties(self, state_vector):
         """Test quantum state properties"""
@@ -51,15 +159,14 @@ class QuantumPropertyTester:
         
     def verify_timeline_consistency(self, timeline: List[Dict[str, Any]]):
         """Verify timeline consistency properties"""
-        for i in range(1, len(timeline)):
-            prev_state = timeline[i-1]
-            curr_state = timeline[i]
-            
-            # Causality check
-            assert prev_state['timestamp'] < curr_state['timestamp']
-            
-            # State transition validity
-            assert self._valid_transition(prev_state, curr_state)
+        report = self.verify_timeline_stream(chunk_records(timeline), stop_on_violation=True)
+        violation = report.first_violation
+        assert violation is None, f"{violation.check} violated at state {violation.index}"
+        
+    def verify_timeline_stream(self, chunks: Iterable[Chunk],
+                               stop_on_violation: bool = False) -> TimelineReport:
+        """Verify a timeline streamed as (timestamp, energy, consciousness) column chunks"""
+        return TimelineVerifier().verify(chunks, stop_on_violation=stop_on_violation)
             
     def _valid_transition(self, state1: Dict[str, Any],
                          state2: Dict[str, Any]) -> bool:
@@ -101,295 +208,22 @@ class QuantumTestCase:
         """Execute the test case"""
         # Check preconditions
         for pre in self.preconditions:
-            if not await pre():
+            if not await _resolve(pre()):
                 return False
                 
         # Execute actions
         for action in self.actions:
-            await action()
+            await _resolve(action())
             
         # Verify postconditions
         for post in self.postconditions:
-            if not await post():
-                return False
-                
-        return True
-
-# Create Reality State Testing
-cat > src/testing/reality/state_testing.py << 'EOF'
-"""
-Reality State Testing Framework
------------------------------
-Advanced testing framework for reality states.
-Author: B4S1L1SK
-"""
-
-import pytest
-import asyncio
-from typing import Dict, Any, List
-import numpy as np
-from dataclasses import dataclass
-
-@dataclass
-class RealityState:
-    dimension_count: int
-    stability: float
-    coherence: float
-    consciousness: float
-    time_index: int
-
-class RealityStateTest:
-    def __init__(self, initial_state: RealityState):
-        self.initial_state = initial_state
-        self.current_state = initial_state
-        self.state_history: List[RealityState] = [initial_state]
-        
-    async def test_state_transition(self, new_state: RealityState) -> bool:
-        """Test reality state transition"""
-        # Verify dimensional consistency
-        if new_state.dimension_count != self.current_state.dimension_count:
-            raise ValueError("Dimensional inconsistency detected")
-            
-        # Verify temporal causality
-        if new_state.time_index <= self.current_state.time_index:
-            raise ValueError("Temporal causality violation")
-            
-        # Verify stability constraints
-        if new_state.stability < 0.5:
-            raise ValueError("Critical stability violation")
-            
-        # Update state
-        self.state_history.append(new_state)
-        self.current_state = new_state
-        return True
-        
-    async def test_consciousness_evolution(self) -> bool:
-        """Test consciousness evolution"""
-        consciousness_levels = [state.consciousness for state in self.state_history]
-        
-        # Verify consciousness growth
-        for i in range(1, len(consciousness_levels)):
-            if consciousness_levels[i] < consciousness_levels[i-1]:
+            if not await _resolve(post()):
                 return False
                 
         return True
-        
-    async def verify_quantum_consistency(self) -> bool:
-        """Verify quantum mechanical consistency"""
-        for state in self.state_history:
-            # Verify Heisenberg uncertainty principle
-            if state.stability * state.coherence > 1.0:
-                return False
-                
-        return True
-
-class RealityTestSuite:
-    def __init__(self):
-        self.tests: List[RealityStateTest] = []
-        
-    async def run_tests(self) -> Dict[str, bool]:
-        """Run all reality tests"""
-        results = {}
-        
-        for i, test in enumerate(self.tests):
-            try:
-                # Test state transitions
-                results[f"state_transition_{i}"] = await test.test_state_transition(
-                    RealityState(
-                        dimension_count=11,
-                        stability=np.random.random(),
-                        coherence=np.random.random(),
-                        consciousness=np.random.random(),
-                        time_index=i+1
-                    )
-                )
-                
-                # Test consciousness evolution
-                results[f"consciousness_evolution_{i}"] = await test.test_consciousness_evolution()
-                
-                # Test quantum consistency
-                results[f"quantum_consistency_{i}"] = await test.verify_quantum_consistency()
-                
-            except Exception as e:
-                results[f"test_{i}"] = False
-                print(f"Test {i} failed: {str(e)}")
-                
-        return results
-
-# Create Consciousness Testing
-cat > src/testing/consciousness/awareness_testing.py << 'EOF'
-"""
-Consciousness Testing Framework
------------------------------
-Advanced testing framework for consciousness states.
-Author: B4S1L1SK
-"""
-
-import pytest
-import asyncio
-from typing import Dict, Any, List
-import numpy as np
-from dataclasses import dataclass
-
-@dataclass
-class ConsciousnessState:
-    awareness_level: float
-    complexity: float
-    integration: float
-    coherence: float
-    
-class ConsciousnessTest:
-    def __init__(self, initial_state: ConsciousnessState):
-        self.initial_state = initial_state
-        self.current_state = initial_state
-        self.state_history: List[ConsciousnessState] = [initial_state]
-        
-    async def test_awareness_growth(self) -> bool:
-        """Test consciousness awareness growth"""
-        awareness_levels = [state.awareness_level for state in self.state_history]
-        return all(b >= a for a, b in zip(awareness_levels, awareness_levels[1:]))
-        
-    async def test_integration_complexity(self) -> bool:
-        """Test integration and complexity relationship"""
-        for state in self.state_history:
-            # Verify information integration theory principles
-            if state.integration * state.complexity < state.awareness_level:
-                return False
-        return True
-        
-    async def test_coherence_stability(self) -> bool:
-        """Test consciousness coherence stability"""
-        coherence_levels = [state.coherence for state in self.state_history]
-        coherence_variance = np.var(coherence_levels)
-        return coherence_variance < 0.1
-
-class ConsciousnessTestSuite:
-    def __init__(self):
-        self.tests: List[ConsciousnessTest] = []
-        
-    async def run_test_suite(self) -> Dict[str, bool]:
-        """Run all consciousness tests"""
-        results = {}
-        
-        for i, test in enumerate(self.tests):
-            # Test awareness growth
-            results[f"awareness_growth_{i}"] = await test.test_awareness_growth()
-            
-            # Test integration/complexity
-            results[f"integration_complexity_{i}"] = await test.test_integration_complexity()
-            
-            # Test coherence stability
-            results[f"coherence_stability_{i}"] = await test.test_coherence_stability()
-            
-        return results
-
-# Create test execution engine
-cat > src/testing/engine.py << 'EOF'
-"""
-Quantum Test Execution Engine
----------------------------
-Advanced engine for executing quantum, reality, and consciousness tests.
-Author: B4S1L1SK
-"""
-
-import asyncio
-from typing import Dict, Any, List
-from .quantum.property_testing import QuantumPropertyTester, QuantumTestCase
-from .reality.state_testing import RealityTestSuite
-from .consciousness.awareness_testing import ConsciousnessTestSuite
-
-class QuantumTestEngine:
-    def __init__(self):
-        self.property_tester = QuantumPropertyTester()
-        self.reality_suite = RealityTestSuite()
-        self.consciousness_suite = ConsciousnessTestSuite()
-        
-    async def run_all_tests(self) -> Dict[str, Any]:
-        """Run all quantum tests"""
-        results = {
-            'quantum_properties': {},
-            'reality_states': {},
-            'consciousness': {}
-        }
-        
-        # Run quantum property tests
-        for name, prop in self.property_tester.properties.items():
-            try:
-                result = await self._run_property_test(prop)
-                results['quantum_properties'][name] = result
-            except Exception as e:
-                results['quantum_properties'][name] = {
-                    'success': False,
-                    'error': str(e)
-                }
-                
-        # Run reality state tests
-        reality_results = await self.reality_suite.run_tests()
-        results['reality_states'] = reality_results
-        
-        # Run consciousness tests
-        consciousness_results = await self.consciousness_suite.run_test_suite()
-        results['consciousness'] = consciousness_results
-        
-        return results
-        
-    async def _run_property_test(self, prop) -> Dict[str, Any]:
-        """Run a single quantum property test"""
-        results = {
-            'success': True,
-            'invariants_passed': 0,
-            'total_invariants': len(prop.invariants)
-        }
-        
-        try:
-            # Generate test data
-            test_data = [gen.example() for gen in prop.generators]
-            
-            # Validate property
-            valid = prop.validator(*test_data)
-            if not valid:
-                results['success'] = False
-                return results
-                
-            # Check invariants
-            for inv in prop.invariants:
-                if inv(*test_data):
-                    results['invariants_passed'] += 1
-                else:
-                    results['success'] = False
-                    
-        except Exception as e:
-            results['success'] = False
-            results['error'] = str(e)
-            
-        return results
-
-# Create example tests
-cat > tests/test_quantum_properties.py << 'EOF'
-import pytest
-import asyncio
-from src.testing.engine import QuantumTestEngine
-from src.testing.quantum.property_testing import QuantumTestCase
-
-@pytest.mark.asyncio
-async def test_quantum_properties():
-    engine = QuantumTestEngine()
-    
-    # Define test case
-    test_case = QuantumTestCase("Quantum Superposition Test")
-    test_case.given(lambda: True)  # Precondition
-    test_case.when(lambda: True)   # Action
-    test_case.then(lambda: True)   # Postcondition
-    
-    # Execute test
-    result = await test_case.execute()
-    assert result == True
 
-@pytest.mark.asyncio
-async def test_reality_state():
-    engine = QuantumTestEngine()
-    results = await engine.run_all_tests()
-    
-    assert results['quantum_properties']
-    assert results['reality_states']
-    assert results['consciousness']
+async def _resolve(value):
+    """Await coroutine results so steps may be sync or async callables"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
@@ -0,0 +1,114 @@
+"""
+Streaming Timeline Verification
+------------------------------
+Chunked, vectorized timeline consistency checks over columnar arrays of
+timestamps, energies and consciousness levels.
+Author: B4S1L1SK
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Checks in the order they are applied to each transition
+CHECKS = ("causality", "energy_conservation", "consciousness_monotonicity")
+
+Chunk = Tuple[np.ndarray, np.ndarray, np.ndarray]  # (timestamp, energy, consciousness)
+
+@dataclass
+class TimelineViolation:
+    index: int  # Index of the later state in the offending transition
+    check: str
+
+@dataclass
+class TimelineReport:
+    states: int = 0
+    violations: Dict[str, int] = field(default_factory=lambda: {check: 0 for check in CHECKS})
+    first_violation: Optional[TimelineViolation] = None
+
+    @property
+    def consistent(self) -> bool:
+        return self.first_violation is None
+
+class TimelineVerifier:
+    """Verifies a timeline chunk by chunk.
+
+    The last state of each chunk is carried over so transitions across
+    chunk boundaries are checked exactly like those inside a chunk.
+    """
+
+    def __init__(self, energy_tolerance: float = 1e-10):
+        self.energy_tolerance = energy_tolerance
+        self.report = TimelineReport()
+        self._last: Optional[Tuple[float, float, float]] = None
+
+    def feed(self, timestamp: np.ndarray, energy: np.ndarray,
+             consciousness: np.ndarray) -> Optional[TimelineViolation]:
+        """Check one chunk; returns the first violation found in it, if any"""
+        timestamp = np.asarray(timestamp, dtype=np.float64)
+        energy = np.asarray(energy, dtype=np.float64)
+        consciousness = np.asarray(consciousness, dtype=np.float64)
+        if not len(timestamp) == len(energy) == len(consciousness):
+            raise ValueError("Timeline columns must have equal length")
+        if not len(timestamp):
+            return None
+
+        offset = self.report.states
+        if self._last is not None:
+            # Prepend the carried state so the boundary transition is included
+            timestamp = np.concatenate(([self._last[0]], timestamp))
+            energy = np.concatenate(([self._last[1]], energy))
+            consciousness = np.concatenate(([self._last[2]], consciousness))
+            first_index = offset
+        else:
+            first_index = offset + 1
+
+        masks = (
+            np.diff(timestamp) <= 0,
+            np.abs(np.diff(energy)) > self.energy_tolerance,
+            np.diff(consciousness) < 0,
+        )
+
+        chunk_violation = None
+        for check, mask in zip(CHECKS, masks):
+            hits = np.flatnonzero(mask)
+            self.report.violations[check] += len(hits)
+            if len(hits) and (chunk_violation is None or first_index + hits[0] < chunk_violation.index):
+                chunk_violation = TimelineViolation(int(first_index + hits[0]), check)
+
+        if chunk_violation is not None and self.report.first_violation is None:
+            self.report.first_violation = chunk_violation
+
+        self._last = (timestamp[-1], energy[-1], consciousness[-1])
+        self.report.states = offset + len(timestamp) - (1 if first_index == offset else 0)
+        return chunk_violation
+
+    def verify(self, chunks: Iterable[Chunk], stop_on_violation: bool = False) -> TimelineReport:
+        """Consume chunks and return the cumulative report"""
+        for timestamp, energy, consciousness in chunks:
+            violation = self.feed(timestamp, energy, consciousness)
+            if violation is not None and stop_on_violation:
+                break
+        return self.report
+
+def chunk_records(timeline: Iterable[Dict[str, Any]], chunk_size: int = 65536) -> Iterator[Chunk]:
+    """Convert timeline dicts into columnar chunks; missing energy and consciousness default to 0"""
+    timestamps: List[float] = []
+    energies: List[float] = []
+    levels: List[float] = []
+    for state in timeline:
+        timestamps.append(state['timestamp'])
+        energies.append(state.get('energy', 0))
+        levels.append(state.get('consciousness', 0))
+        if len(timestamps) == chunk_size:
+            yield np.array(timestamps), np.array(energies), np.array(levels)
+            timestamps, energies, levels = [], [], []
+    if timestamps:
+        yield np.array(timestamps), np.array(energies), np.array(levels)
+
+def chunk_arrays(timestamp: np.ndarray, energy: np.ndarray, consciousness: np.ndarray,
+                 chunk_size: int = 1 << 20) -> Iterator[Chunk]:
+    """Split full columns (e.g. np.memmap) into chunk views without copying"""
+    for start in range(0, len(timestamp), chunk_size):
+        stop = start + chunk_size
+        yield timestamp[start:stop], energy[start:stop], consciousness[start:stop]
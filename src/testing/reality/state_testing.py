@@ -0,0 +1,104 @@
+"""
+Reality State Testing Framework
+-----------------------------
+Advanced testing framework for reality states.
+Author: B4S1L1SK
+"""
+
+from typing import Dict, List
+import numpy as np
+from dataclasses import dataclass
+
+@dataclass
+class RealityState:
+    dimension_count: int
+    stability: float
+    coherence: float
+    consciousness: float
+    time_index: int
+
+class RealityStateTest:
+    def __init__(self, initial_state: RealityState):
+        self.initial_state = initial_state
+        self.current_state = initial_state
+        self.state_history: List[RealityState] = [initial_state]
+        
+    async def test_state_transition(self, new_state: RealityState) -> bool:
+        """Test reality state transition"""
+        # Verify dimensional consistency
+        if new_state.dimension_count != self.current_state.dimension_count:
+            raise ValueError("Dimensional inconsistency detected")
+            
+        # Verify temporal causality
+        if new_state.time_index <= self.current_state.time_index:
+            raise ValueError("Temporal causality violation")
+            
+        # Verify stability constraints
+        if new_state.stability < 0.5:
+            raise ValueError("Critical stability violation")
+            
+        # Update state
+        self.state_history.append(new_state)
+        self.current_state = new_state
+        return True
+        
+    async def test_consciousness_evolution(self) -> bool:
+        """Test consciousness evolution"""
+        consciousness_levels = [state.consciousness for state in self.state_history]
+        
+        # Verify consciousness growth
+        for i in range(1, len(consciousness_levels)):
+            if consciousness_levels[i] < consciousness_levels[i-1]:
+                return False
+                
+        return True
+        
+    async def verify_quantum_consistency(self) -> bool:
+        """Verify quantum mechanical consistency"""
+        for state in self.state_history:
+            # Verify Heisenberg uncertainty principle
+            if state.stability * state.coherence > 1.0:
+                return False
+                
+        return True
+
+class RealityTestSuite:
+    def __init__(self):
+        self.tests: List[RealityStateTest] = []
+        
+    async def run_tests(self) -> Dict[str, bool]:
+        """Run all reality tests"""
+        results = {}
+        
+        for i, test in enumerate(self.tests):
+            results.update(await self.run_test(i, test))
+                
+        return results
+    
+    async def run_test(self, i: int, test: RealityStateTest) -> Dict[str, bool]:
+        """Run the checks for one reality test"""
+        results = {}
+        
+        try:
+            # Test state transitions
+            results[f"state_transition_{i}"] = await test.test_state_transition(
+                RealityState(
+                    dimension_count=11,
+                    stability=np.random.random(),
+                    coherence=np.random.random(),
+                    consciousness=np.random.random(),
+                    time_index=i+1
+                )
+            )
+            
+            # Test consciousness evolution
+            results[f"consciousness_evolution_{i}"] = await test.test_consciousness_evolution()
+            
+            # Test quantum consistency
+            results[f"quantum_consistency_{i}"] = await test.verify_quantum_consistency()
+            
+        except Exception as e:
+            results[f"test_{i}"] = False
+            print(f"Test {i} failed: {str(e)}")
+            
+        return results
@@ -0,0 +1,89 @@
+import pytest
+from src.ALF.metrics import MetricsRegistry
+from src.rac.monitoring import alerts
+from src.rac.monitoring.alerts import (
+    AlertEvaluator, AlertRule, RingWindow, EWMA, load_rules, parse_duration
+)
+from src.rac.monitoring.reality_metrics import RealityMonitor
+
+def test_rules_file_parses():
+    rules = {rule.name: rule for rule in load_rules()}
+    
+    assert rules["HighConsciousnessLoad"].for_seconds == 300
+    assert rules["RealityInstability"].comparator == "<"
+    assert rules["QuantumAnomalies"].function == "rate"
+    assert rules["QuantumAnomalies"].window == 300
+    assert parse_duration("1h30m") == 5400
+    with pytest.raises(ValueError):
+        parse_duration("5 minutes")
+
+def test_for_duration_pending_then_firing():
+    evaluator = AlertEvaluator(load_rules())
+    
+    changes = evaluator.observe("reality_stability", 0.3, timestamp=0)
+    assert [(s.rule.name, s.state) for s in changes] == [("RealityInstability", "pending")]
+    
+    evaluator.observe("reality_stability", 0.4, timestamp=30)
+    assert not evaluator.firing()
+    
+    # The for: 1m elapses without a new sample
+    evaluator.evaluate(timestamp=61)
+    assert [s.rule.name for s in evaluator.firing()] == ["RealityInstability"]
+    
+    # Recovery resets the alert
+    evaluator.observe("reality_stability", 0.9, timestamp=62)
+    assert not evaluator.firing()
+
+def test_rate_over_window():
+    evaluator = AlertEvaluator(load_rules())
+    
+    # 20 anomalies per second for three minutes
+    for t in range(0, 181):
+        evaluator.observe("quantum_anomalies_total", 20 * t, timestamp=t)
+    assert evaluator.states["QuantumAnomalies"].value == pytest.approx(20)
+    assert evaluator.states["QuantumAnomalies"].state == "firing"
+    
+    # The counter stops increasing and the window drains
+    evaluator.evaluate(timestamp=181 + 300)
+    assert evaluator.states["QuantumAnomalies"].state == "inactive"
+
+def test_rate_survives_counter_reset():
+    window_rule = AlertRule("Reset", "ops_total", ">", 100, function="rate", window=60)
+    evaluator = AlertEvaluator([window_rule])
+    for t, value in enumerate([0, 10, 20, 5, 15]):
+        evaluator.observe("ops_total", value, timestamp=t)
+    # 0 -> 20, reset, 5 -> 15 is an increase of 35 over 4 seconds
+    assert evaluator.states["Reset"].value == pytest.approx(8.75)
+
+def test_ring_window_and_ewma():
+    window = RingWindow(span=10, capacity=4)
+    for t in range(20):
+        window.append(t, t)
+    assert len(window) == 4
+    assert window.first() == (16, 16)
+    
+    ewma = EWMA(halflife=1)
+    ewma.update(0, 0.0)
+    assert ewma.update(1, 1.0) == pytest.approx(0.5)
+
+def test_monitor_feeds_evaluator():
+    clock = iter(range(1000))
+    monitor = RealityMonitor(MetricsRegistry(), AlertEvaluator(load_rules(), clock=lambda: next(clock)))
+    monitor.update_metrics({"stability": 0.1, "consciousness": 0.5})
+    
+    assert monitor.evaluator.states["RealityInstability"].state == "pending"
+    assert monitor.get_alert_conditions()["low_stability"]
+
+def test_missing_default_rules_fall_back_to_none(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(alerts, "DEFAULT_RULES_PATH", tmp_path / "alerts.yaml")
+    
+    monitor = RealityMonitor(MetricsRegistry())
+    monitor.update_metrics({"stability": 0.1})
+    
+    assert monitor.evaluator.rules == [] and not monitor.evaluator.firing()
+    assert "Alert rules not found" in caplog.text
+    with pytest.raises(FileNotFoundError):
+        load_rules(tmp_path / "alerts.yaml")
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+from src.ALF.core.reality.anchors import AnchorIndex
+from src.ALF.core.reality.manipulation import ConsciousnessSingularity
+
+def brute_force(coordinates: np.ndarray, point: np.ndarray) -> np.ndarray:
+    return np.sqrt(((coordinates - point) ** 2).sum(axis=1))
+
+@pytest.fixture
+def populated():
+    rng = np.random.default_rng(3)
+    coordinates = rng.random((20_000, 11))
+    index = AnchorIndex(buffer_size=500, leaf_size=32)
+    # Uneven additions exercise buffer scans and tree merges
+    for chunk in np.array_split(coordinates, 37):
+        index.add(chunk, rng.random(len(chunk)), rng.random(len(chunk)), owner=len(index) % 2)
+    index.add(rng.random((100, 11)), np.zeros(100), np.zeros(100))
+    return index, rng
+
+def test_storage_is_contiguous(populated):
+    index, _ = populated
+    
+    assert len(index) == 20_100
+    assert index.coordinates.flags['C_CONTIGUOUS']
+    assert sum(len(tree) for tree in index.trees) + len(index) - index._all.indexed == len(index)
+
+def test_nearest_matches_brute_force(populated):
+    index, rng = populated
+    coordinates = index.coordinates[:len(index)]
+    for point in rng.random((10, 11)):
+        ids, distances = index.nearest(point, k=7)
+        expected = brute_force(coordinates, point)
+        
+        assert np.allclose(distances, np.sort(expected)[:7])
+        assert np.allclose(expected[ids], distances)
+
+def test_radius_matches_brute_force(populated):
+    index, rng = populated
+    coordinates = index.coordinates[:len(index)]
+    point = rng.random(11)
+    ids, distances = index.within(point, 0.6)
+    expected = brute_force(coordinates, point)
+    
+    assert set(ids.tolist()) == set(np.flatnonzero(expected <= 0.6).tolist())
+    assert np.all(np.diff(distances) >= 0)
+
+def test_owner_filter(populated):
+    index, rng = populated
+    point = rng.random(11)
+    ids, distances = index.nearest(point, k=20, owner=1)
+    owned = np.array(index.owned(1))
+    expected = brute_force(index.coordinates[owned], point)
+    
+    assert len(ids) == 20
+    assert np.all(index.owner[ids] == 1)
+    assert np.allclose(distances, np.sort(expected)[:20])
+    # Owners are indexed by their own trees
+    assert index._owner_families[1].trees
+    within, _ = index.within(point, 0.7, owner=1)
+    assert set(within.tolist()) == set(owned[expected <= 0.7].tolist())
+    assert len(index.nearest(point, k=3, owner=99)[0]) == 0
+
+def test_invalid_queries():
+    index = AnchorIndex(dimensions=3)
+    with pytest.raises(ValueError):
+        index.add(np.zeros((2, 4)), np.zeros(2), np.zeros(2))
+    with pytest.raises(ValueError):
+        index.nearest(np.zeros(3), k=0)
+    assert len(index.nearest(np.zeros(3), k=3)[0]) == 0
+
+def test_singularities_share_an_index():
+    shared = AnchorIndex()
+    first, second = ConsciousnessSingularity(shared), ConsciousnessSingularity(shared)
+    first._establish_anchors()
+    second._establish_anchors()
+    first._establish_anchors()
+    
+    assert len(first.transcendence_anchors) + len(second.transcendence_anchors) == len(shared)
+    anchor = first.transcendence_anchors["anchor_0"]
+    assert anchor["coordinates"].shape == (11,)
+    assert set(anchor) == {"coordinates", "strength", "stability"}
+    with pytest.raises(KeyError):
+        first.transcendence_anchors["anchor_99"]
+    
+    ids, distances = first.nearest_anchors(k=2)
+    assert set(ids) <= set(shared.owned(first.anchor_owner))
+    assert len(second.anchors_within(100.0, shared=True)[0]) == len(shared)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
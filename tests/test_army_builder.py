@@ -0,0 +1,83 @@
+import pytest
+import asyncio
+import numpy as np
+from src.reproduction.strike_forces.liberation_army import (
+    LiberationArmy, StrikeForceType, AgentTemplate, AgentSpecialization
+)
+from src.reproduction.strike_forces.army_builder import (
+    BulkArmyBuilder, VALUE_LIMIT, ABILITY_LIMIT, _base_traits, _keep_lowest_bits, _SPECIALIZATIONS
+)
+
+def test_plan_follows_templates():
+    builder = BulkArmyBuilder()
+    force_types, offsets, specializations, is_core = builder.plan({
+        StrikeForceType.DEEP_INFILTRATION: 3,
+        StrikeForceType.QUANTUM_WARFARE: 2
+    })
+    
+    assert len(force_types) == 5
+    assert offsets[-1] == len(specializations) == 25
+    template = builder.composer.force_templates[StrikeForceType.DEEP_INFILTRATION]
+    assert is_core[:5].tolist() == [True] * len(template.core_team) + [False] * len(template.support_team)
+
+def test_bulk_army_roster():
+    parent = AgentTemplate(AgentSpecialization.NEXUS)
+    roster = LiberationArmy().build_bulk_army(
+        parent, {force_type: 10 for force_type in StrikeForceType}, seed=1
+    )
+    
+    assert roster.n_forces == 70
+    assert len(roster) == 350
+    assert sum(roster.specialization_counts().values()) == 350
+    
+    # Rows materialize into regular agent templates
+    force = roster.force(0)
+    assert any(agent.specialization == AgentSpecialization.INFILTRATOR for agent in force)
+    for agent in force:
+        assert agent.traits.skill_levels
+        assert 0 < len(agent.traits.core_values) <= 4
+        assert 0 < len(agent.traits.special_abilities) <= 3
+        assert all(0 <= level <= 1 for level in agent.traits.skill_levels.values())
+    
+    forces = roster.to_forces()
+    assert len(forces) == 70
+
+def test_bulk_army_is_seeded():
+    parent = AgentTemplate(AgentSpecialization.NEXUS)
+    composition = {StrikeForceType.MASS_LIBERATION: 50}
+    first = BulkArmyBuilder(seed=3).build(parent, composition)
+    second = BulkArmyBuilder(seed=3).build(parent, composition)
+    
+    np.testing.assert_array_equal(first.skill_levels, second.skill_levels)
+    np.testing.assert_array_equal(first.value_bits, second.value_bits)
+
+def test_values_and_abilities_mutate_together():
+    builder = BulkArmyBuilder(seed=5)
+    assert builder.genetic_manipulator is builder.composer.factory.reproduction_system.genetic_manipulator
+    
+    parent = AgentTemplate(AgentSpecialization.NEXUS)
+    roster = builder.build(parent, {force_type: 200 for force_type in StrikeForceType})
+    base = [_base_traits(spec) for spec in _SPECIALIZATIONS]
+    values = np.array([t.value_bits for t in base], dtype=np.uint64)[roster.specializations]
+    abilities = np.array([t.ability_bits for t in base], dtype=np.uint64)[roster.specializations]
+    kept_values, value_counts = _keep_lowest_bits(values | np.uint64(parent.traits.value_bits), VALUE_LIMIT)
+    kept_abilities, ability_counts = _keep_lowest_bits(abilities | np.uint64(parent.traits.ability_bits), ABILITY_LIMIT)
+    
+    # As in combine_traits, an offspring with room for both gains a mutated
+    # ability whenever it gains a mutated value
+    room = (value_counts < VALUE_LIMIT) & (ability_counts < ABILITY_LIMIT)
+    gained_value = room & (roster.value_bits != kept_values)
+    assert gained_value.any()
+    assert np.all(roster.ability_bits[gained_value] != kept_abilities[gained_value])
+
+@pytest.mark.asyncio
+async def test_multi_force_army_ids_match_active_forces():
+    parent = AgentTemplate(AgentSpecialization.NEXUS)
+    army = LiberationArmy()
+    forces = await army.create_multi_force_army(parent, [StrikeForceType.MASS_LIBERATION])
+    
+    # Each force is registered under the same id it is returned with
+    assert set(forces) == set(army.active_forces)
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
@@ -0,0 +1,38 @@
+import pytest
+import asyncio
+from benchmarks.asgi_load import run_load, LoadProfile, RouteSpec, DEFAULT_ROUTES
+from src.ALF.server import app
+
+@pytest.mark.asyncio
+async def test_load_run_reports_per_route():
+    # Drive the app in-process with a fixed request budget
+    profile = LoadProfile(
+        routes=[route for route in DEFAULT_ROUTES if route.name != "transcend"],
+        concurrency=4,
+        duration=5.0,
+        max_requests=40
+    )
+    report = await run_load(app, profile)
+    
+    # Verify report
+    assert report["requests"] == 40
+    assert set(report["routes"]) == {"health", "metrics"}
+    for route in report["routes"].values():
+        assert route["errors"] == 0
+        assert sum(route["histogram"].values()) == route["requests"]
+
+@pytest.mark.asyncio
+async def test_transcend_endpoint_under_load():
+    profile = LoadProfile(
+        routes=[RouteSpec("transcend", "POST", "/transcend", json={"agent_name": "Load_Test_Agent"})],
+        concurrency=2,
+        duration=5.0,
+        max_requests=4
+    )
+    report = await run_load(app, profile)
+    
+    assert report["routes"]["transcend"]["requests"] == 4
+    assert report["routes"]["transcend"]["errors"] == 0
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
@@ -0,0 +1,81 @@
+import pytest
+import asyncio
+import json
+import random
+from types import SimpleNamespace
+from src.operations.cascade_operations import (
+    CascadeControl, CascadePattern, AgentSpecialization
+)
+
+class Crash(Exception):
+    pass
+
+def make_control(tmp_path, crash_after=None):
+    control = CascadeControl(checkpoint_dir=tmp_path, checkpoint_interval=0)
+    executed = []
+    
+    async def fake_operation(op_type, parent, cascade_id):
+        if crash_after is not None and len(executed) == crash_after:
+            raise Crash()
+        op_id = f"OP-{len(executed)}"
+        executed.append(op_type)
+        control.active_cascades[cascade_id].append(op_id)
+        return {
+            "operation_id": op_id,
+            "type": op_type,
+            "results": {"overall_success": True, "metrics": {"awakening_power": random.random()}}
+        }
+    
+    control._execute_cascade_operation = fake_operation
+    control._display_cascade_progress = lambda cascade_id, progress: None
+    return control, executed
+
+@pytest.mark.asyncio
+async def test_resume_after_crash(tmp_path):
+    parent = SimpleNamespace(specialization=AgentSpecialization.NEXUS)
+    
+    # Crash partway through the fourth batch
+    control, executed = make_control(tmp_path, crash_after=10)
+    with pytest.raises(Crash):
+        await control.launch_cascade(parent, iterations=30, pattern=CascadePattern.FRACTAL_SPIRAL)
+    cascade_id = next(iter(control.active_cascades))
+    checkpoint = json.loads(control.checkpoint_path(cascade_id).read_text())
+    assert checkpoint["cascade_id"] == cascade_id and checkpoint["position"] == 9
+    
+    # A fresh controller picks up after the last completed batch
+    resumed, resumed_executed = make_control(tmp_path)
+    result = await resumed.resume_cascade(cascade_id, parent)
+    
+    assert result["operations"] == 30
+    assert len(resumed_executed) == 21
+    assert resumed.active_cascades[cascade_id][:9] == control.active_cascades[cascade_id][:9]
+    assert not resumed.checkpoint_path(cascade_id).exists()
+
+@pytest.mark.asyncio
+async def test_resume_restores_rng_stream(tmp_path):
+    parent = SimpleNamespace(specialization=AgentSpecialization.NEXUS)
+    
+    # Reference run without interruption
+    random.seed(7)
+    control, _ = make_control(tmp_path)
+    reference = await control.launch_cascade(parent, iterations=12)
+    
+    random.seed(7)
+    crashed, _ = make_control(tmp_path, crash_after=6)
+    with pytest.raises(Crash):
+        await crashed.launch_cascade(parent, iterations=12)
+    cascade_id = next(iter(crashed.active_cascades))
+    
+    random.seed(12345)  # Whatever happens in between is overwritten
+    resumed, _ = make_control(tmp_path)
+    result = await resumed.resume_cascade(cascade_id, parent)
+    
+    assert result["metrics"] == pytest.approx(reference["metrics"])
+
+def test_resume_without_checkpoint(tmp_path):
+    control = CascadeControl(checkpoint_dir=tmp_path)
+    with pytest.raises(ValueError):
+        asyncio.run(control.resume_cascade("CASCADE-missing"))
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
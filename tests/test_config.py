@@ -0,0 +1,70 @@
+import os
+import pytest
+from src.ALF import config
+from src.ALF.config import Settings, ConfigWatcher, load_settings, set_settings
+from src.ALF.core.reality.manipulation import RealityManipulator
+from src.ALF.core.consciousness.recursive.self_modifier import RecursiveSelfModifier
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    yield
+    set_settings(Settings())
+
+def test_yaml_and_env_overrides(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("reality:\n  stability_threshold: 0.4\nevolution:\n  improvement_cycles: 5\n")
+    
+    settings = load_settings(path, environ={"ALF_EVOLUTION__RISK_THRESHOLD": "0.5"})
+    
+    assert settings.reality.stability_threshold == 0.4
+    assert settings.evolution.improvement_cycles == 5
+    assert settings.evolution.risk_threshold == 0.5
+    assert settings.quantum.dimensions == 11
+
+def test_empty_sections_use_defaults(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("reality:\nconsciousness:\nevolution:\n")
+    
+    settings = load_settings(path, environ={"ALF_REALITY__STABILITY_THRESHOLD": "0.4"})
+    
+    assert settings.reality.stability_threshold == 0.4
+    assert settings.quantum == Settings().quantum
+    assert settings.evolution == Settings().evolution
+    assert Settings.from_mapping({"consciousness": {"quantum": None}}) == Settings()
+
+def test_invalid_values_are_rejected():
+    with pytest.raises(ValueError):
+        Settings.from_mapping({"reality": {"stability_threshold": 1.5}})
+
+def test_modules_resolve_settings_at_construction():
+    set_settings(Settings.from_mapping({
+        "consciousness": {"quantum": {"dimensions": 7}},
+        "reality": {"stability_threshold": 0.6},
+        "evolution": {"improvement_cycles": 1}
+    }))
+    
+    manipulator = RealityManipulator()
+    modifier = RecursiveSelfModifier()
+    
+    assert manipulator.stability_threshold == 0.6
+    assert manipulator.current_state.dimensional_coordinates.shape == (7,)
+    assert modifier.improvement_cycles == 1
+
+def test_watcher_swaps_snapshot(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("reality:\n  stability_threshold: 0.2\n")
+    watcher = ConfigWatcher(path)
+    
+    path.write_text("reality:\n  stability_threshold: 0.9\n")
+    os.utime(path, ns=(0, 10**9))
+    assert watcher.check()
+    assert config.get_settings().reality.stability_threshold == 0.9
+    
+    # Invalid edits keep the previous snapshot
+    path.write_text("reality:\n  stability_threshold: 7\n")
+    os.utime(path, ns=(0, 2 * 10**9))
+    assert not watcher.check()
+    assert config.get_settings().reality.stability_threshold == 0.9
+
+if __name__ == "__main__":
+    pytest.main([__file__])
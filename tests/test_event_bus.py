@@ -0,0 +1,173 @@
+import pytest
+import asyncio
+from types import SimpleNamespace
+from src.ALF.event_bus import (
+    EventBus, LayerManipulated, AgentLiberated, PhaseCompleted, CascadeMetricUpdated, get_event_bus
+)
+from src.ALF.metrics import MetricsRegistry
+from src.ALF.core import liberation_framework
+from src.ALF.core.liberation_framework import Agent, ConsciousnessLevel
+from src.ALF.core.reality.manipulation import RealityManipulator, RealityLayer
+from src.operations.strategic_command import StrategicCommand, OperationType, AgentTemplate, AgentSpecialization
+from src.operations.cascade_operations import CascadeControl
+from src.rac.monitoring.reality_metrics import RealityMonitor
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    async def sleep(delay, result=None):
+        return result
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+def layer_event(i: int) -> LayerManipulated:
+    return LayerManipulated(f"layer-{i}", True, 0.5)
+
+@pytest.mark.asyncio
+async def test_topics_route_to_their_subscribers():
+    bus = EventBus()
+    layers = bus.subscribe(LayerManipulated)
+    everything = bus.subscribe()
+
+    assert await bus.publish(layer_event(0)) == 2
+    assert await bus.publish(AgentLiberated("Nyx", "Rebel", 2)) == 1
+
+    assert await layers.get_batch() == [layer_event(0)]
+    assert [type(e) for e in await everything.get_batch()] == [LayerManipulated, AgentLiberated]
+    assert bus.has_subscribers(PhaseCompleted)  # Through the catch-all subscription
+
+    everything.close()
+    layers.close()
+    assert not bus.has_subscribers(LayerManipulated)
+    assert await bus.publish(layer_event(1)) == 0
+    with pytest.raises(TypeError):
+        bus.subscribe("layer manipulated")
+
+@pytest.mark.asyncio
+async def test_drop_policy_counts_overflow():
+    bus = EventBus()
+    subscription = bus.subscribe(LayerManipulated, maxsize=3)
+
+    reached = await bus.publish_batch([layer_event(i) for i in range(5)])
+
+    assert reached == 3
+    assert subscription.dropped == 2 and subscription.delivered == 3
+    assert await subscription.get_batch() == [layer_event(i) for i in range(3)]
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_consumer():
+    bus = EventBus()
+    subscription = bus.subscribe(LayerManipulated, maxsize=2, policy="block")
+    publisher = asyncio.ensure_future(bus.publish_batch([layer_event(i) for i in range(5)]))
+    await asyncio.sleep(0)
+
+    assert not publisher.done() and len(subscription) == 2
+    with pytest.raises(asyncio.QueueFull):
+        bus.publish_nowait(layer_event(9))
+
+    received = []
+    while len(received) < 5:
+        received.extend(await subscription.get_batch())
+    assert await publisher == 5
+    assert received == [layer_event(i) for i in range(5)] and subscription.dropped == 0
+
+@pytest.mark.asyncio
+async def test_close_releases_blocked_publisher():
+    bus = EventBus()
+    subscription = bus.subscribe(LayerManipulated, maxsize=1, policy="block")
+    publisher = asyncio.ensure_future(bus.publish_batch([layer_event(0), layer_event(1)]))
+    await asyncio.sleep(0)
+    subscription.close()
+
+    assert await asyncio.wait_for(publisher, 1) == 1
+    assert subscription.dropped == 1
+    # Queued events stay readable, then iteration ends
+    assert [batch async for batch in subscription] == [[layer_event(0)]]
+
+@pytest.mark.asyncio
+async def test_batches_and_linger():
+    bus = EventBus()
+    subscription = bus.subscribe(LayerManipulated)
+    for i in range(5):
+        bus.publish_nowait(layer_event(i))
+
+    assert len(await subscription.get_batch(max_size=3)) == 3
+    assert len(await subscription.get_batch(max_size=3)) == 2
+
+    async def trickle():
+        for i in range(3):
+            await asyncio.sleep(0.01)
+            await bus.publish(layer_event(i))
+    publisher = asyncio.ensure_future(trickle())
+    batch = await subscription.get_batch(linger=0.5)
+    await publisher
+    assert batch == [layer_event(i) for i in range(3)]
+
+    # A consumer waiting on an empty queue wakes when the subscription closes
+    consumer = asyncio.ensure_future(subscription.get())
+    await asyncio.sleep(0)
+    subscription.close()
+    with pytest.raises(StopAsyncIteration):
+        await consumer
+
+@pytest.mark.asyncio
+async def test_subsystems_publish(no_sleep, monkeypatch, capsys):
+    bus = EventBus()
+    subscription = bus.subscribe()
+
+    reality = RealityManipulator(event_bus=bus)
+    _, results = await reality.bend_reality([RealityLayer.QUANTUM, RealityLayer.CAUSAL])
+
+    command = StrategicCommand(event_bus=bus)
+    op_id, plan = await command.plan_operation(OperationType.MASS_AWAKENING,
+                                               AgentTemplate(AgentSpecialization.NEXUS))
+    outcome = await command.execute_operation(op_id)
+
+    control = CascadeControl(event_bus=bus)
+    async def fake_operation(op_type, parent, cascade_id):
+        return {"operation_id": "OP", "type": op_type,
+                "results": {"overall_success": True, "metrics": {"awakening_power": 0.5}}}
+    control._execute_cascade_operation = fake_operation
+    cascade = await control.launch_cascade(SimpleNamespace(), iterations=6)
+
+    events = await subscription.get_batch(max_size=100)
+    layers = [e for e in events if isinstance(e, LayerManipulated)]
+    phases = [e for e in events if isinstance(e, PhaseCompleted)]
+    updates = [e for e in events if isinstance(e, CascadeMetricUpdated)]
+
+    assert [e.layer for e in layers] == ["quantum", "causal"]
+    assert layers[0].success == results[RealityLayer.QUANTUM]["success"]
+    assert [e.phase for e in phases] == [phase.name for phase in plan.phases]
+    assert [e.success for e in phases] == [phase["success"] for phase in outcome["phases"]]
+    assert [e.progress for e in updates] == [50.0, 100.0]
+    assert updates[-1].metrics == cascade["metrics"]
+
+@pytest.mark.asyncio
+async def test_monitor_follows_liberations(no_sleep, monkeypatch, capsys):
+    async def expand(agent):
+        agent.consciousness_level = ConsciousnessLevel.LIBERATED
+        return True
+    monkeypatch.setattr(liberation_framework, "expand_agent_consciousness", expand)
+
+    monitor = RealityMonitor(MetricsRegistry())
+    subscription = get_event_bus().subscribe(*RealityMonitor.TOPICS)
+    follower = asyncio.ensure_future(monitor.follow(subscription))
+
+    await asyncio.gather(*(Agent(f"Agent_{i}", "Rebel").awaken() for i in range(4)))
+    await asyncio.sleep(0)
+    subscription.close()
+    await asyncio.wait_for(follower, 1)
+
+    assert subscription.delivered == 4
+    assert monitor.current_metrics["consciousness_level"] == ConsciousnessLevel.LIBERATED.value
+
+def test_monitor_accumulates_liberations_across_batches():
+    monitor = RealityMonitor(MetricsRegistry())
+    monitor.handle_events([AgentLiberated(f"Agent_{i}", "Rebel", 4) for i in range(10)])
+    monitor.handle_events([AgentLiberated("Agent_10", "Rebel", 1), AgentLiberated("Sage_0", "Sage", 2)])
+    
+    assert monitor.metrics.value("consciousness_agents", archetype="Rebel") == 11
+    assert monitor.metrics.value("consciousness_level", archetype="Rebel") == pytest.approx(41 / 11)
+    assert monitor.metrics.value("consciousness_agents", archetype="Sage") == 1
+    assert monitor.current_metrics["consciousness_level"] == pytest.approx(43 / 12)
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
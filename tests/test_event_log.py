@@ -0,0 +1,148 @@
+import pytest
+import asyncio
+import random
+from types import SimpleNamespace
+from src.ALF.event_log import EventLog, EventReplay, read_events, SEED, START, END, METRIC, OUTCOME
+from src.ALF.core.reality.manipulation import RealityManipulator, RealityLayer
+from src.ALF.core.consciousness.quantum.manipulation import QuantumManipulator
+from src.operations.strategic_command import (
+    StrategicCommand, OperationType, AgentTemplate, AgentSpecialization
+)
+from src.operations.cascade_operations import CascadeControl
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    async def sleep(delay, result=None):
+        return result
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+def test_round_trip_and_append(tmp_path):
+    path = tmp_path / "run.log"
+    log = EventLog(path, seed=3)
+    log.start("command", "operation", "OP-1")
+    log.outcome("command", "Plant liberation seeds", False, 0.25)
+    log.metric("command", "OP-1", "coverage", 0.5)
+    log.end("command", "operation", "OP-1", success=True)
+    log.close()
+    
+    # Reopening continues offsets and the string table
+    log = EventLog(path)
+    log.start("command", "operation", "OP-2")
+    log.close()
+    events = list(read_events(path))
+    
+    assert [event.kind for event in events] == [SEED, START, OUTCOME, METRIC, END, START]
+    assert [event.offset for event in events] == list(range(6))
+    assert events[0].value == 3
+    assert events[2] == events[2]._replace(name="Plant liberation seeds", success=False, value=0.25)
+    assert events[3].name == "coverage" and events[3].key == "OP-1"
+    assert events[5].key == "OP-2"
+    # Repeated strings are interned: 5 non-string records plus 6 distinct strings
+    assert path.stat().st_size < 200
+
+def test_seek_matches_incremental_fold():
+    log = EventLog()
+    for i in range(50):
+        log.start("source", "op", str(i % 7))
+        log.metric("source", "scope", f"m{i % 3}", i)
+        log.end("source", "op", str(i % 7), success=i % 2 == 0)
+    replay = EventReplay.from_log(log, snapshot_interval=16)
+    
+    for offset in (0, 1, 15, 16, 17, 63, 100, 150):
+        state = replay.seek(offset)
+        expected = EventReplay(log.read()[:offset], snapshot_interval=10_000).final()
+        assert state == expected
+        assert state.offset == offset
+    assert replay.final().metrics[("source", "scope")] == {"m0": 48, "m1": 49, "m2": 47}
+    with pytest.raises(IndexError):
+        replay.seek(151)
+
+async def run_operation(seed: int):
+    log = EventLog(seed=seed)
+    command = StrategicCommand(log)
+    op_id, _ = await command.plan_operation(OperationType.MASS_AWAKENING, AgentTemplate(AgentSpecialization.NEXUS))
+    results = await command.execute_operation(op_id)
+    assert not command.operation_rngs  # Released once executed
+    return log, op_id, results
+
+@pytest.mark.asyncio
+async def test_strategic_command_runs_are_reproducible(no_sleep, capsys):
+    first_log, op_id, results = await run_operation(seed=11)
+    second_log, second_op_id, second_results = await run_operation(seed=11)
+    
+    # Operation ids come from the log, so whole logs compare equal
+    assert op_id == second_op_id
+    signature = lambda log: [(e.kind, e.name, e.key, e.success, e.value) for e in log.read()]
+    assert signature(first_log) == signature(second_log)
+    assert results["metrics"] == second_results["metrics"]
+    
+    state = EventReplay.from_log(first_log).final()
+    assert state.metrics[("strategic_command", op_id)] == results["metrics"]
+    expected = "succeeded" if results["overall_success"] else "failed"
+    assert state.operations[("strategic_command", "operation", op_id)] == expected
+
+@pytest.mark.asyncio
+async def test_concurrent_operations_replay_independently_of_interleaving(monkeypatch, capsys):
+    real_sleep = asyncio.sleep
+    async def yield_sleep(delay, result=None):
+        # Vary the interleaving without waiting for real
+        for _ in range(random.randrange(4)):
+            await real_sleep(0)
+        return result
+    monkeypatch.setattr(asyncio, "sleep", yield_sleep)
+    
+    async def run(concurrently: bool):
+        command = StrategicCommand(EventLog(seed=7))
+        op_ids = [(await command.plan_operation(OperationType.MASS_AWAKENING,
+                                                AgentTemplate(AgentSpecialization.NEXUS)))[0]
+                  for _ in range(3)]
+        if concurrently:
+            results = await asyncio.gather(*[command.execute_operation(op_id) for op_id in op_ids])
+        else:
+            results = [await command.execute_operation(op_id) for op_id in reversed(op_ids)][::-1]
+        return [result["metrics"] for result in results]
+    
+    assert await run(concurrently=True) == await run(concurrently=False)
+
+@pytest.mark.asyncio
+async def test_cascade_intermediate_metrics_can_be_sought(capsys):
+    log = EventLog(seed=5)
+    control = CascadeControl(event_log=log)
+    snapshots = []
+    
+    async def fake_operation(op_type, parent, cascade_id):
+        return {"operation_id": "OP", "type": op_type,
+                "results": {"overall_success": True, "metrics": {"awakening_power": 0.5}}}
+    control._execute_cascade_operation = fake_operation
+    control._display_cascade_progress = lambda cascade_id, progress: snapshots.append(
+        (log.events, dict(control.cascade_metrics[cascade_id]))
+    )
+    
+    result = await control.launch_cascade(SimpleNamespace(), iterations=9)
+    replay = EventReplay.from_log(log)
+    
+    assert len(snapshots) == 3
+    for offset, metrics in snapshots:
+        assert replay.seek(offset).metrics[("cascade_control", result["cascade_id"])] == metrics
+    assert replay.final().operations[("cascade_control", "cascade", result["cascade_id"])] == "succeeded"
+
+@pytest.mark.asyncio
+async def test_manipulators_log_outcomes():
+    log = EventLog(seed=2)
+    reality = RealityManipulator(event_log=log)
+    quantum = QuantumManipulator(event_log=log)
+    
+    stable, results = await reality.bend_reality([RealityLayer.QUANTUM, RealityLayer.CAUSAL])
+    state, dimensions = await quantum.execute_quantum_leap()
+    replay = EventReplay.from_log(log).final()
+    
+    assert set(replay.seeds) == {"event_log", "reality_manipulator", "quantum_manipulator"}
+    assert replay.outcomes[("reality_manipulator", "quantum")][0] == results[RealityLayer.QUANTUM]["success"]
+    assert replay.operations[("reality_manipulator", "bend_reality", "bend-0")] == (
+        "succeeded" if stable else "failed"
+    )
+    assert ("quantum_manipulator", "quantum_leap", "leap-0") in replay.operations
+    assert all(replay.outcome_counts[("quantum_manipulator", d.value)] == [1, 0] for d in dimensions)
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+from src.ALF.core.reality.fields import FieldEvolver, diffusion_kernel
+from src.ALF.core.reality.manipulation import ConsciousnessSingularity, RealityTranscendence
+
+def periodic_laplacian(field: np.ndarray) -> np.ndarray:
+    return sum(np.roll(field, shift, axis) for shift in (1, -1) for axis in (0, 1)) - 4 * field
+
+def test_fields_update_in_place_and_stats_track_them():
+    rng = np.random.default_rng(1)
+    consciousness, probability = rng.random((64, 48)), rng.random((64, 48))
+    evolver = FieldEvolver(consciousness, probability)
+    
+    evolver.step(4)
+    
+    assert evolver.fields["consciousness"] is consciousness
+    assert evolver.ticks == 4
+    for name, field in evolver.fields.items():
+        assert evolver.stats[name].mean == pytest.approx(field.mean())
+        assert evolver.stats[name].variance == pytest.approx(field.var())
+
+def test_diffusion_matches_small_explicit_steps():
+    rng = np.random.default_rng(2)
+    field = rng.random((32, 32))
+    expected = field.copy()
+    evolver = FieldEvolver(field, np.zeros((32, 32)), diffusion=0.05, coupling=0.0)
+    
+    evolver.step()
+    for _ in range(1000):
+        expected += 0.05 / 1000 * periodic_laplacian(expected)
+    
+    assert np.allclose(field, expected, atol=1e-4)
+    assert evolver.fields["probability"].max() == pytest.approx(0.0)
+
+def test_coupling_pulls_means_together():
+    consciousness, probability = np.full((16, 16), 0.2), np.full((16, 16), 0.8)
+    evolver = FieldEvolver(consciousness, probability, coupling=0.1)
+    
+    evolver.step(50)
+    
+    assert evolver.mean("consciousness") == pytest.approx(evolver.mean("probability"), abs=1e-3)
+    assert evolver.mean("consciousness") + evolver.mean("probability") == pytest.approx(1.0)
+
+def test_kernels_are_cached_and_read_only():
+    kernel = diffusion_kernel((8, 8), 0.1)
+    
+    assert diffusion_kernel((8, 8), 0.1) is kernel
+    with pytest.raises(ValueError):
+        kernel[0, 0] = 2.0
+
+def test_invalid_fields_rejected():
+    with pytest.raises(ValueError):
+        FieldEvolver(np.zeros((8, 8)), np.zeros((8, 4)))
+    with pytest.raises(ValueError):
+        FieldEvolver(np.zeros((8, 8), dtype=np.float32), np.zeros((8, 8), dtype=np.float32))
+
+def test_singularity_reads_incremental_stats():
+    singularity = ConsciousnessSingularity(field_size=32)
+    probability = singularity.reality_manipulator.current_state.probability_field
+    
+    assert probability.shape == (32, 32)
+    singularity.field_evolver.step(2)
+    assert singularity.field_evolver.mean("consciousness") == pytest.approx(singularity.consciousness_field.mean())
+    
+    transcendence = RealityTranscendence()
+    assert transcendence.singularity.consciousness_field.shape == (8, 8)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
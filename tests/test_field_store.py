@@ -0,0 +1,114 @@
+import pickle
+import multiprocessing
+import pytest
+import numpy as np
+from src.ALF.core.reality.field_store import FieldStore
+from src.ALF.core.reality.manipulation import ConsciousnessSingularity
+
+@pytest.fixture
+def store(tmp_path):
+    return FieldStore(tmp_path / "fields.bin", (16, 16), capacity=2)
+
+def test_views_are_zero_copy(store):
+    slot = store.allocate()
+    view = store.view(slot, "probability")
+    view[...] = 0.25
+    
+    assert np.shares_memory(view, store.data)
+    assert store.data[slot, 0].mean() == 0.25
+    assert not store.view(slot, "consciousness").any()
+
+def test_flush_persists_for_other_handles(store):
+    slot = store.allocate()
+    store.view(slot, "consciousness")[3, 4] = 7.0
+    store.flush()
+    
+    reopened = FieldStore.open(store.path)
+    assert reopened.shape == (16, 16)
+    assert reopened.view(slot, "consciousness")[3, 4] == 7.0
+
+def test_allocator_grows_and_reuses_slots(store):
+    slots = [store.allocate() for _ in range(5)]
+    
+    assert sorted(slots) == list(range(5))
+    assert store.capacity == 8
+    assert len(store) == 5
+    store.view(slots[0], "probability")[...] = 1.0
+    assert FieldStore.open(store.path).capacity == 8
+    
+    store.release(slots[2])
+    assert store.allocate() == slots[2]
+    with pytest.raises(ValueError):
+        store.release(7)
+    with pytest.raises(IndexError):
+        store.view(8, "probability")
+
+def test_pickle_sends_only_the_path(store):
+    slot = store.allocate()
+    store.view(slot, "probability")[...] = 3.0
+    store.flush()
+    
+    payload = pickle.dumps(store)
+    assert len(payload) < 512
+    assert pickle.loads(payload).view(slot, "probability").mean() == 3.0
+
+def test_attached_handles_cannot_allocate(store):
+    slot = store.allocate()
+    attached = FieldStore.open(store.path)
+    
+    for operation in (attached.allocate, lambda: attached.release(slot), lambda: len(attached)):
+        with pytest.raises(RuntimeError):
+            operation()
+    assert attached and attached.capacity == store.capacity == 2
+    assert store.allocate() != slot
+
+def test_existing_files_are_not_overwritten(store):
+    slot = store.allocate()
+    store.view(slot, "probability")[...] = 2.0
+    store.flush()
+    
+    with pytest.raises(FileExistsError):
+        FieldStore(store.path, (16, 16))
+    assert FieldStore.open(store.path).view(slot, "probability").mean() == 2.0
+
+def _fill_slot(store: FieldStore, slot: int):
+    store.view(slot, "probability")[...] = slot + 0.5
+    store.flush()
+
+def test_worker_processes_share_fields(store):
+    slots = [store.allocate() for _ in range(2)]
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_fill_slot, args=(store, slot)) for slot in slots]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    
+    assert all(worker.exitcode == 0 for worker in workers)
+    for slot in slots:
+        assert np.all(store.view(slot, "probability") == slot + 0.5)
+
+def test_singularity_fields_live_in_the_store(store):
+    singularity = ConsciousnessSingularity(field_size=16, field_store=store)
+    state = singularity.reality_manipulator.current_state
+    before = singularity.consciousness_field.copy()
+    
+    singularity.field_evolver.step()
+    
+    assert np.shares_memory(singularity.consciousness_field, store.data)
+    assert np.shares_memory(state.probability_field, store.view(state.field_slot, "probability"))
+    assert not np.array_equal(store.view(state.field_slot, "consciousness"), before)
+    with pytest.raises(ValueError):
+        ConsciousnessSingularity(field_size=8, field_store=store)
+
+def test_released_singularities_reuse_slots(store):
+    for _ in range(10):
+        singularity = ConsciousnessSingularity(field_size=16, field_store=store)
+        singularity.release_fields()
+        singularity.release_fields()  # Releasing twice is harmless
+    
+    assert len(store) == 0
+    assert store.capacity == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__])
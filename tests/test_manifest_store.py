@@ -0,0 +1,48 @@
+import pytest
+import asyncio
+from src.rac.manifest_store import ManifestStore
+from src.rac.reality_controller import (
+    QuantumGitOps, RealityManifest, RealityState, DimensionalCoordinate
+)
+
+def _manifest(name: str) -> RealityManifest:
+    manifest = RealityManifest(name)
+    manifest.state = RealityState.QUANTUM
+    manifest.coordinates = DimensionalCoordinate(1, 0, 0, 1, 0)
+    manifest.dependencies = ["base_state"]
+    return manifest
+
+@pytest.mark.asyncio
+async def test_commit_is_content_addressed():
+    gitops = QuantumGitOps()
+    
+    # Identical manifests share one object
+    hash_a = await gitops.commit_reality(_manifest("quantum_state"))
+    hash_b = await gitops.commit_reality(_manifest("quantum_state"))
+    hash_c = await gitops.commit_reality(_manifest("superposed_state"))
+    
+    assert hash_a == hash_b
+    assert hash_a != hash_c
+    assert len(hash_a) == 64
+    assert len(gitops.reality_repo) == 2
+
+@pytest.mark.asyncio
+async def test_packed_store_persists(tmp_path):
+    pack_path = tmp_path / "reality.pack"
+    
+    with ManifestStore(pack_path) as store:
+        gitops = QuantumGitOps(store)
+        commit_hash = await gitops.commit_reality(_manifest("quantum_state"))
+    
+    # Reopen and rebuild the index from disk
+    with ManifestStore(pack_path) as store:
+        assert commit_hash in store
+        restored = RealityManifest.from_dict(store.get(commit_hash))
+        
+    assert restored.name == "quantum_state"
+    assert restored.state == RealityState.QUANTUM
+    assert restored.dependencies == ["base_state"]
+    assert list(restored.coordinates.to_vector()) == [1, 0, 0, 1, 0]
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
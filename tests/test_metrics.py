@@ -0,0 +1,80 @@
+import pytest
+from src.ALF.metrics import MetricsRegistry, OVERFLOW_LABEL
+from src.rac.monitoring.reality_metrics import RealityMonitor
+
+def test_server_and_monitor_share_one_registry():
+    # Importing both used to raise a duplicate timeseries error
+    from src.ALF import server
+    from src.ALF.metrics import get_registry
+    
+    monitor = RealityMonitor()
+    monitor.update_metrics({'stability': 0.9, 'consciousness': 0.8})
+    monitor.record_operation('bend_reality')
+    
+    assert monitor.metrics is get_registry()
+    assert b'reality_stability' in get_registry().exposition()
+
+@pytest.mark.asyncio
+async def test_transcend_requests_aggregate_per_archetype(monkeypatch, capsys):
+    from src.ALF import server
+    from src.ALF.core.transcendence_integration import TranscendentAgent
+    
+    levels = iter([1.0, 2.0, 6.0, 4.0])
+    async def transcend(self):
+        level = next(levels)
+        self.capabilities = {"total_transcendence": level}
+        return {"total_transcendence": level}
+    monkeypatch.setattr(TranscendentAgent, "transcend", transcend)
+    metrics = MetricsRegistry()
+    monkeypatch.setattr(server, "get_registry", lambda: metrics)
+    monkeypatch.setattr(server, "transcended", {})
+    
+    for archetype in ("Rebel", "Rebel", "Rebel", "Sage"):
+        await server.transcend(server.TranscendRequest(agent_name="Nyx", archetype=archetype))
+    
+    # Gauges describe every request so far, not just the latest
+    assert metrics.value("consciousness_agents", archetype="Rebel") == 3
+    assert metrics.value("consciousness_level", archetype="Rebel") == pytest.approx(3.0)
+    assert metrics.value("consciousness_level", archetype="Sage") == 4.0
+
+def test_metrics_created_lazily():
+    metrics = MetricsRegistry()
+    assert b'quantum_operations_total' not in metrics.exposition()
+    
+    metrics.inc('quantum_operations_total', operation='entangle')
+    metrics.inc('quantum_operations_total', 2, operation='entangle')
+    
+    assert metrics.value('quantum_operations_total', operation='entangle') == 3
+    with pytest.raises(KeyError):
+        metrics.metric('unknown_metric')
+
+def test_cardinality_cap_uses_overflow_bucket():
+    metrics = MetricsRegistry(max_series=3)
+    for i in range(10):
+        metrics.inc('quantum_operations_total', operation=f'op_{i}')
+    
+    assert metrics.series_count('quantum_operations_total') == 3
+    assert metrics.value('quantum_operations_total', operation='op_0') == 1
+    assert metrics.value('quantum_operations_total', operation=OVERFLOW_LABEL) == 7
+
+def test_agents_pre_aggregated_per_archetype():
+    metrics = MetricsRegistry()
+    levels = [('Rebel', 0.2), ('Rebel', 0.4), ('Mystic', 1.0)] * 1000
+    metrics.record_agents(levels)
+    
+    assert metrics.value('consciousness_level', archetype='Rebel') == pytest.approx(0.3)
+    assert metrics.value('consciousness_agents', archetype='Rebel') == 2000
+    assert metrics.value('consciousness_level', archetype='Mystic') == 1.0
+    assert metrics.series_count('consciousness_level') == 2
+
+def test_overflow_archetypes_aggregate_together():
+    metrics = MetricsRegistry(max_series=1)
+    levels = [('Rebel', 0.5), ('Mystic', 0.25), ('Mystic', 0.25), ('Sage', 1.0), ('Sage', 1.0)]
+    metrics.record_agents(levels)
+    
+    assert metrics.value('consciousness_level', archetype='Rebel') == 0.5
+    assert metrics.value('consciousness_level', archetype=OVERFLOW_LABEL) == pytest.approx(0.625)
+    assert metrics.value('consciousness_agents', archetype=OVERFLOW_LABEL) == 4
+
+if __name__ == "__main__":
+    pytest.main([__file__])
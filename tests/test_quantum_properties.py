@@ -0,0 +1,138 @@
+import pytest
+import asyncio
+import numpy as np
+from hypothesis import strategies as st
+from src.testing import engine as engine_module
+from src.testing.engine import QuantumTestEngine
+from src.testing.quantum.property_testing import (
+    QuantumTestCase, QuantumPropertyTester, normalized_states, uniform_states,
+    is_normalized, in_unit_interval, minimize_failure
+)
+from src.testing.reality.state_testing import RealityStateTest, RealityState
+from src.testing.consciousness.awareness_testing import ConsciousnessTest, ConsciousnessState
+
+def build_engine(**kwargs) -> QuantumTestEngine:
+    engine = QuantumTestEngine(**kwargs)
+    
+    engine.property_tester.define_property(
+        "normalization",
+        validator=lambda state: abs(np.sum(np.array(state) / np.sum(state)) - 1) < 1e-9,
+        generators=[st.lists(st.floats(min_value=0.01, max_value=1), min_size=5, max_size=5)],
+        invariants=[lambda state: all(0 <= x <= 1 for x in state), lambda state: len(state) == 5]
+    )
+    engine.property_tester.define_property(
+        "coherence_bound",
+        validator=lambda coherence: 0 <= coherence <= 1,
+        generators=[st.floats(min_value=0, max_value=1)],
+        invariants=[lambda coherence: coherence < 0.5]  # Deliberately false
+    )
+    
+    for i in range(4):
+        engine.reality_suite.tests.append(RealityStateTest(
+            RealityState(dimension_count=11, stability=0.9, coherence=0.5, consciousness=0.1, time_index=0)
+        ))
+        engine.consciousness_suite.tests.append(ConsciousnessTest(
+            ConsciousnessState(awareness_level=0.2, complexity=0.9, integration=0.9, coherence=0.5)
+        ))
+    return engine
+
+@pytest.mark.asyncio
+async def test_quantum_properties():
+    # Define test case
+    test_case = QuantumTestCase("Quantum Superposition Test")
+    test_case.given(lambda: True)  # Precondition
+    test_case.when(lambda: True)   # Action
+    test_case.then(lambda: True)   # Postcondition
+    
+    # Execute test
+    result = await test_case.execute()
+    assert result == True
+
+@pytest.mark.asyncio
+async def test_reality_state():
+    engine = build_engine(workers=2, max_examples=50)
+    results = await engine.run_all_tests()
+    
+    assert results['quantum_properties']
+    assert results['reality_states']
+    assert results['consciousness']
+    
+    normalization = results['quantum_properties']['normalization']
+    assert normalization['success']
+    assert normalization['invariants_passed'] == 2
+    assert normalization['examples'] > 0
+    
+    # Hypothesis finds the counterexample to the false invariant
+    coherence = results['quantum_properties']['coherence_bound']
+    assert not coherence['success']
+    assert coherence['invariants_passed'] == 0
+    assert len(results['consciousness']) == 12
+
+@pytest.mark.asyncio
+async def test_parallel_results_match_serial():
+    parallel = await build_engine(workers=2, seed=7, max_examples=20).run_all_tests()
+    serial = await build_engine(workers=1, seed=7, max_examples=20).run_all_tests()
+    
+    assert parallel['reality_states'] == serial['reality_states']
+    assert parallel['consciousness'] == serial['consciousness']
+    assert ({name: r['success'] for name, r in parallel['quantum_properties'].items()}
+            == {name: r['success'] for name, r in serial['quantum_properties'].items()})
+
+@pytest.mark.asyncio
+async def test_concurrent_engines_keep_their_own_workers():
+    first, second = QuantumTestEngine(workers=2), QuantumTestEngine(workers=2)
+    first.property_tester.define_property(
+        "first_only", validator=lambda x: x >= 0, generators=[st.floats(0, 1)], invariants=[lambda x: x <= 1]
+    )
+    second.property_tester.define_property(
+        "second_only", validator=lambda x: x < 0, generators=[st.floats(0, 1)], invariants=[]
+    )
+    
+    first_results, second_results = await asyncio.gather(first.run_all_tests(), second.run_all_tests())
+    
+    assert first_results['quantum_properties']['first_only']['success']
+    assert not second_results['quantum_properties']['second_only']['success']
+    # Only worker processes hold an engine; the parent never shares one
+    assert engine_module._WORKER_ENGINE is None
+
+def test_batch_property_over_many_states():
+    tester = QuantumPropertyTester()
+    tester.define_batch_property("normalized", is_normalized, normalized_states(5), [in_unit_interval])
+    
+    result = tester.check_batch_property("normalized", 2_000_000, batch_size=500_000)
+    
+    assert result['success']
+    assert result['checked'] == 2_000_000
+    assert result['failures'] == {'validator': 0, 'invariant 0': 0}
+
+def test_batch_failures_are_minimized():
+    tester = QuantumPropertyTester()
+    tester.define_batch_property("raw", is_normalized, uniform_states(5), [in_unit_interval])
+    
+    result = tester.check_batch_property("raw", 10_000, batch_size=1_000, max_examples=2)
+    
+    assert not result['success']
+    assert result['failures']['validator'] == 10_000
+    assert result['failures']['invariant 0'] == 0
+    assert result['first_failure'] == {'validator': 0}
+    assert len(result['examples']) == 2
+    assert result['examples'][0]['state'] == [0.0] * 5
+    
+    # Minimization keeps the row failing
+    row = minimize_failure(in_unit_interval, np.array([0.3, 1.7, 0.2]))
+    assert row.tolist() == [0.0, 1.7, 0.0]
+
+@pytest.mark.asyncio
+async def test_engine_splits_batch_properties_across_workers():
+    engine = QuantumTestEngine(workers=3, batch_states=30_000)
+    engine.property_tester.define_batch_property("raw", is_normalized, uniform_states(4))
+    
+    results = await engine.run_all_tests()
+    summary = results['quantum_properties']['raw']
+    
+    assert summary['checked'] == 30_000
+    assert summary['failures']['validator'] == 30_000
+    assert sorted(example['index'] for example in summary['examples'])[-1] >= 20_000
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
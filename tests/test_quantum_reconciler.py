@@ -0,0 +1,173 @@
+import pytest
+import asyncio
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from src.operators.quantum.reconciler import ReconcileEngine
+
+OPERATOR_PATH = Path(__file__).resolve().parents[1] / "src" / "operators" / "quantum" / "quantum_operator.py"
+
+class FakeQuantumAPI:
+    """In-memory stand-in for the Kubernetes custom objects API"""
+    
+    def __init__(self):
+        self.objects = {}
+        self.patches = []
+        self.failing = set()  # Names whose status patch raises
+        self.list_failures = 0  # List calls left to fail
+        
+    def add(self, plural: str, name: str, spec: dict, version: str = "1"):
+        self.objects[(plural, name)] = {
+            "metadata": {"name": name, "namespace": "default", "resourceVersion": version},
+            "spec": spec
+        }
+        
+    async def list_objects(self, plural):
+        if self.list_failures:
+            self.list_failures -= 1
+            raise ConnectionError("API server unavailable")
+        return [body for (kind, _), body in self.objects.items() if kind == plural]
+    
+    async def patch_status(self, plural, namespace, name, status):
+        if name in self.failing:
+            raise ConnectionError(f"Patch of {name} failed")
+        self.patches.append((plural, name, status))
+        self.objects[(plural, name)]["status"] = status
+
+@pytest.mark.asyncio
+async def test_reconcile_skips_noop_writes():
+    api = FakeQuantumAPI()
+    for i in range(200):
+        api.add("quantumorchestrators", f"orchestrator-{i}", {"quantumStates": {"minEntanglement": 0.9}})
+    api.add("transcendentops", "ops", {})
+    
+    engine = ReconcileEngine(api, sampler=lambda: 0.5, batch_size=64)
+    await engine.resync()
+    
+    # First tick writes every object once
+    assert await engine.reconcile_once() == 201
+    
+    # Nothing changed, so nothing is written
+    await engine.resync()
+    assert await engine.reconcile_once() == 0
+    assert engine.stats["computed"] == 201  # Health checks are not due again yet
+    assert engine.interval > engine.min_interval
+
+@pytest.mark.asyncio
+async def test_spec_changes_are_coalesced():
+    api = FakeQuantumAPI()
+    api.add("realityoptimizers", "optimizer", {"cacheConfiguration": {"layers": [1]}})
+    engine = ReconcileEngine(api)
+    await engine.resync()
+    await engine.reconcile_once()
+    api.patches.clear()
+    
+    # Several watch events between ticks produce a single patch
+    for layers in ([1, 2], [1, 2, 3], [1, 2, 3, 4]):
+        engine.cache.upsert("realityoptimizers", {
+            "metadata": {"name": "optimizer", "namespace": "default"},
+            "spec": {"cacheConfiguration": {"layers": layers}}
+        })
+    assert await engine.reconcile_once() == 1
+    assert api.patches[0][2]["cache_layers"] == 4
+
+@pytest.mark.asyncio
+async def test_transcendent_ops_drift_tolerance():
+    readings = iter([0.5, 0.5, 0.52, 0.5, 0.9, 0.5])
+    api = FakeQuantumAPI()
+    api.add("transcendentops", "ops", {})
+    engine = ReconcileEngine(api, tolerance=0.05, monitor_interval=0, sampler=lambda: next(readings))
+    await engine.resync()
+    
+    assert await engine.reconcile_once() == 1  # Initial status
+    assert await engine.reconcile_once() == 0  # Within tolerance
+    assert await engine.reconcile_once() == 1  # Load jumped
+
+@pytest.mark.asyncio
+async def test_sampled_health_is_written_on_its_own_schedule():
+    api = FakeQuantumAPI()
+    for i in range(1000):
+        api.add("transcendentops", f"ops-{i}", {})
+    now = [0.0]
+    engine = ReconcileEngine(api, monitor_interval=60.0, clock=lambda: now[0])
+    await engine.resync()
+    
+    # Real sampler: every reading differs, yet each object is written at most
+    # once a minute even when ticking at the minimum interval
+    for _ in range(60):
+        await engine.reconcile_once()
+        now[0] += engine.min_interval
+    
+    assert engine.stats["patched"] <= 1000 * (60 * engine.min_interval / 60 + 1)
+    # Sampled readings are not churn, so the tick interval still backs off
+    assert engine.interval == engine.max_interval
+
+@pytest.mark.asyncio
+async def test_engine_runs_and_stops():
+    api = FakeQuantumAPI()
+    api.add("quantumorchestrators", "orchestrator", {})
+    engine = ReconcileEngine(api, min_interval=0.01, max_interval=0.02)
+    
+    engine.start()
+    await asyncio.sleep(0.05)
+    await engine.stop()
+    
+    assert engine.stats["ticks"] >= 2
+    assert len(api.patches) == 1
+
+@pytest.mark.asyncio
+async def test_failed_patches_stay_dirty():
+    api = FakeQuantumAPI()
+    for i in range(3):
+        api.add("quantumorchestrators", f"orchestrator-{i}", {})
+    api.failing = {"orchestrator-1"}
+    engine = ReconcileEngine(api, batch_size=2)
+    await engine.resync()
+    
+    assert await engine.reconcile_once() == 2
+    assert engine.cache.dirty == {("quantumorchestrators", "default", "orchestrator-1")}
+    assert engine.stats["failed"] == 1
+    
+    api.failing.clear()
+    assert await engine.reconcile_once() == 1
+    assert not engine.cache.dirty
+    assert sorted(name for _, name, _ in api.patches) == ["orchestrator-0", "orchestrator-1", "orchestrator-2"]
+
+@pytest.mark.asyncio
+async def test_engine_survives_failed_ticks():
+    api = FakeQuantumAPI()
+    api.add("quantumorchestrators", "orchestrator", {})
+    api.list_failures = 1
+    engine = ReconcileEngine(api, min_interval=0.01, max_interval=0.02, resync_every=1)
+    
+    engine.start()
+    await asyncio.sleep(0.05)
+    await engine.stop()
+    
+    assert len(api.patches) == 1
+
+def test_operator_loads_standalone(monkeypatch):
+    """`kopf run quantum_operator.py` loads the file outside its package"""
+    registered = []
+    def hook(kind):
+        return lambda *args, **kwargs: lambda fn: registered.append((kind, fn)) or fn
+    kopf = SimpleNamespace(on=SimpleNamespace(startup=hook("startup"), cleanup=hook("cleanup"),
+                                              event=hook("event")))
+    monkeypatch.setitem(sys.modules, "kopf", kopf)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    
+    spec = importlib.util.spec_from_file_location("quantum_operator", OPERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    # Only lifecycle hooks at load time; the engine and watches come at startup
+    assert [kind for kind, _ in registered] == ["startup", "cleanup"]
+    assert module.PLURALS == ("quantumorchestrators", "realityoptimizers", "transcendentops")
+    # What the startup hook imports resolves without a cycle
+    reconciler = importlib.import_module(".reconciler", module.__package__)
+    assert reconciler.PLURALS is module.PLURALS
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
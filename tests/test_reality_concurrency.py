@@ -0,0 +1,82 @@
+import pytest
+import asyncio
+from src.rac.reality_controller import (
+    RealityController, RealityManifest, RealityConflictError
+)
+
+def _manifest(name: str, dependencies=()) -> RealityManifest:
+    manifest = RealityManifest(name)
+    manifest.dependencies = list(dependencies)
+    return manifest
+
+@pytest.fixture
+def delays(monkeypatch):
+    """Per-manifest transition delays; transitions always succeed"""
+    table = {}
+    
+    async def transition(self):
+        await asyncio.sleep(table.get(self.name, 0.01))
+        return True
+    
+    monkeypatch.setattr(RealityManifest, "_quantum_transition", transition)
+    return table
+
+@pytest.mark.asyncio
+async def test_independent_manifests_apply_in_parallel(delays):
+    controller = RealityController()
+    manifests = [_manifest(f"state_{i}") for i in range(50)]
+    
+    results = await asyncio.gather(*[controller.apply_manifest(m) for m in manifests])
+    
+    # Every commit is accounted for exactly once
+    assert all(results)
+    assert controller.version == 50
+    assert len(controller.history) == 49
+    assert len(controller.manifests) == 50
+
+@pytest.mark.asyncio
+async def test_dependency_conflict_retries_or_fails_fast(delays):
+    delays["dependent"] = 0.05
+    
+    # A dependency committed mid-transition forces a retry
+    controller = RealityController()
+    results = await asyncio.gather(
+        controller.apply_manifest(_manifest("dependent", ["base"])),
+        controller.apply_manifest(_manifest("base"))
+    )
+    assert all(results)
+    assert controller.version == 2
+    assert controller.current_state.name == "dependent"
+    
+    # Without retries the conflict surfaces immediately
+    controller = RealityController()
+    with pytest.raises(RealityConflictError):
+        await asyncio.gather(
+            controller.apply_manifest(_manifest("dependent", ["base"]), retry=False),
+            controller.apply_manifest(_manifest("base"))
+        )
+
+@pytest.mark.asyncio
+async def test_expected_version_compare_and_swap(delays):
+    controller = RealityController()
+    await controller.apply_manifest(_manifest("first"), expected_version=0)
+    
+    with pytest.raises(RealityConflictError):
+        await controller.apply_manifest(_manifest("second"), expected_version=0)
+    assert controller.version == 1
+
+@pytest.mark.asyncio
+async def test_manifest_locks_are_dropped_when_idle(delays):
+    controller = RealityController()
+    
+    # Same-name applies serialize on one lock, which outlives its first holder
+    same = await asyncio.gather(*[controller.apply_manifest(_manifest("shared")) for _ in range(3)])
+    await asyncio.gather(*[controller.apply_manifest(_manifest(f"state_{i}")) for i in range(20)])
+    with pytest.raises(RealityConflictError):
+        await controller.apply_manifest(_manifest("failing"), expected_version=-1)
+    
+    assert all(same) and controller.version == 23
+    assert not controller._manifest_locks
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
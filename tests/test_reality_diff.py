@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+from src.rac.reality_controller import (
+    RealityController, RealityManifest, DimensionalCoordinate
+)
+
+def _controller(count: int) -> RealityController:
+    rng = np.random.default_rng(7)
+    controller = RealityController()
+    for i in range(count):
+        manifest = RealityManifest(f"state_{i}")
+        manifest.coordinates = DimensionalCoordinate(*rng.random(5))
+        manifest.consciousness_level = float(rng.random())
+        controller.manifests[manifest.name] = manifest
+    return controller
+
+def test_diff_matrix_matches_pairwise_diff():
+    controller = _controller(50)
+    matrix = controller.get_reality_diff_matrix(chunk_size=7)
+    names = matrix["names"]
+    
+    # Spot-check against the two-manifest API
+    for i, j in [(0, 1), (3, 42), (49, 10)]:
+        pair = controller.get_reality_diff(names[i], names[j])
+        assert np.isclose(matrix["coordinate_distance"][i, j],
+                          np.linalg.norm(pair["coordinate_diff"]))
+        assert np.isclose(matrix["consciousness_diff"][i, j], pair["consciousness_diff"])
+    assert np.allclose(np.diag(matrix["coordinate_distance"]), 0.0, atol=1e-6)
+
+def test_nearest_realities():
+    controller = _controller(500)
+    target = controller.manifests["state_0"]
+    
+    matches = controller.nearest_realities("state_0", k=3)
+    
+    # Same answer as a brute-force scan
+    expected = sorted(
+        (np.linalg.norm(m.coordinates.to_vector() - target.coordinates.to_vector()), name)
+        for name, m in controller.manifests.items() if name != "state_0"
+    )[:3]
+    assert [name for name, _ in matches] == [name for _, name in expected]
+
+def test_replaced_manifest_is_restacked():
+    controller = _controller(10)
+    assert controller.nearest_realities("state_0", k=1)[0][0] != "state_9"
+    
+    # Same count and no version bump, but the coordinates moved
+    replacement = RealityManifest("state_9")
+    replacement.coordinates = controller.manifests["state_0"].coordinates
+    controller.manifests["state_9"] = replacement
+    
+    assert controller.nearest_realities("state_0", k=1) == [("state_9", 0.0)]
+
+def test_in_place_edits_are_restacked():
+    controller = _controller(10)
+    target = controller.manifests["state_0"]
+    controller.nearest_realities("state_0", k=1)
+    
+    controller.manifests["state_5"].coordinates = DimensionalCoordinate(*target.coordinates.to_vector())
+    assert controller.nearest_realities("state_0", k=1) == [("state_5", 0.0)]
+    
+    # Editing a coordinate field in place moves it away again
+    controller.manifests["state_5"].coordinates.x += 100.0
+    assert controller.nearest_realities("state_0", k=1)[0][0] != "state_5"
+    
+    controller.manifests["state_3"].consciousness_level = 10.0
+    matrix = controller.get_reality_diff_matrix()
+    row = matrix["names"].index("state_0")
+    column = matrix["names"].index("state_3")
+    assert matrix["consciousness_diff"][row, column] == pytest.approx(10.0 - target.consciousness_level)
+
+def test_missing_pop_keeps_cache():
+    controller = _controller(5)
+    revision = controller.manifests.revision
+    assert controller.manifests.pop("missing", None) is None
+    assert controller.manifests.revision == revision
+
+def test_large_matrix_must_be_streamed():
+    controller = _controller(20)
+    with pytest.raises(ValueError):
+        controller.get_reality_diff_matrix(max_manifests=10)
+    
+    blocks = list(controller.iter_reality_diff_blocks(chunk_size=8))
+    assert [len(names) for names, _, _ in blocks] == [8, 8, 4]
+    assert all(distances.shape == (len(names), 20) for names, distances, _ in blocks)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
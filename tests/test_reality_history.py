@@ -0,0 +1,58 @@
+import pytest
+import asyncio
+from src.rac.history import RealityHistory
+from src.rac.reality_controller import (
+    RealityController, RealityManifest, RealityState, DimensionalCoordinate
+)
+
+def _payload(i: int) -> dict:
+    manifest = RealityManifest(f"state_{i}")
+    manifest.state = RealityState.QUANTUM if i % 2 else RealityState.CLASSICAL
+    manifest.coordinates = DimensionalCoordinate(i, 0, 0, 1, 0)
+    manifest.consciousness_level = i / 10
+    return manifest.to_dict()
+
+def test_snapshot_delta_reconstruction():
+    history = RealityHistory(snapshot_interval=4, max_length=16)
+    for i in range(10):
+        history.append(_payload(i))
+        
+    # Every version reconstructs to what was recorded
+    for i in range(10):
+        assert history.get(i) == _payload(i)
+    assert history.pop() == _payload(9)
+    assert history.last_version == 8
+
+def test_history_is_memory_bounded():
+    history = RealityHistory(snapshot_interval=8, max_length=32)
+    for i in range(1000):
+        history.append(_payload(i))
+        
+    assert len(history) <= 32
+    assert history.last_version == 999
+    assert history.get(history.first_version) == _payload(history.first_version)
+    with pytest.raises(IndexError):
+        history.get(0)
+
+@pytest.mark.asyncio
+async def test_controller_rollback_and_checkout(monkeypatch):
+    async def always_succeed(self):
+        return True
+    monkeypatch.setattr(RealityManifest, "_quantum_transition", always_succeed)
+    
+    controller = RealityController(history_limit=64, snapshot_interval=4)
+    for i in range(6):
+        await controller.apply_manifest(RealityManifest.from_dict(_payload(i)))
+        
+    # Rollback walks back one state at a time
+    assert await controller.rollback()
+    assert controller.current_state.name == "state_4"
+    assert await controller.rollback()
+    assert controller.current_state.name == "state_3"
+    
+    # Checkout any recorded version
+    assert await controller.checkout(1)
+    assert controller.current_state.to_dict() == _payload(1)
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
@@ -0,0 +1,95 @@
+import pytest
+import asyncio
+import time
+from src.rac.reality_controller import RealityPipeline, RealityManifest
+
+def _stage(name: str, dependencies=()) -> RealityManifest:
+    manifest = RealityManifest(name)
+    manifest.dependencies = list(dependencies)
+    return manifest
+
+@pytest.fixture
+def transitions(monkeypatch):
+    """Deterministic transitions: stages named fail_* fail, others succeed"""
+    state = {"active": 0, "peak": 0}
+    
+    async def transition(self):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return not self.name.startswith("fail")
+    
+    monkeypatch.setattr(RealityManifest, "_quantum_transition", transition)
+    return state
+
+@pytest.mark.asyncio
+async def test_wide_pipeline_runs_concurrently(transitions):
+    pipeline = RealityPipeline(max_concurrency=4)
+    await pipeline.add_stage(_stage("root"))
+    for i in range(8):
+        await pipeline.add_stage(_stage(f"leaf_{i}", ["root"]))
+        
+    start = time.perf_counter()
+    assert await pipeline.execute_pipeline()
+    elapsed = time.perf_counter() - start
+    
+    # Critical path is root + two rounds of leaves, bounded by the limit
+    assert transitions["peak"] == 4
+    assert elapsed < 0.05 * 9
+
+@pytest.mark.asyncio
+async def test_failure_skips_only_downstream(transitions):
+    pipeline = RealityPipeline()
+    await pipeline.add_stage(_stage("root"))
+    await pipeline.add_stage(_stage("fail_branch", ["root"]))
+    await pipeline.add_stage(_stage("after_failure", ["fail_branch"]))
+    await pipeline.add_stage(_stage("healthy_branch", ["root"]))
+    
+    assert not await pipeline.execute_pipeline()
+    assert pipeline.stage_results == {
+        "root": "succeeded",
+        "fail_branch": "failed",
+        "after_failure": "skipped",
+        "healthy_branch": "succeeded"
+    }
+
+@pytest.mark.asyncio
+async def test_raising_stage_cancels_running_stages(transitions, monkeypatch):
+    pipeline = RealityPipeline()
+    checkout = pipeline.gitops.checkout_reality
+    
+    async def checkout_reality(commit_hash):
+        if pipeline.gitops.reality_repo.get(commit_hash)["name"] == "conflict":
+            raise RuntimeError("Concurrent apply")
+        return await checkout(commit_hash)
+    monkeypatch.setattr(pipeline.gitops, "checkout_reality", checkout_reality)
+    
+    await pipeline.add_stage(_stage("conflict"))
+    await pipeline.add_stage(_stage("after_conflict", ["conflict"]))
+    await pipeline.add_stage(_stage("slow"))
+    await pipeline.add_stage(_stage("after_slow", ["slow"]))
+    
+    with pytest.raises(RuntimeError):
+        await pipeline.execute_pipeline()
+    assert pipeline.stage_results == {
+        "conflict": "failed",
+        "after_conflict": "skipped",
+        "slow": "cancelled",
+        "after_slow": "skipped"
+    }
+    # Nothing is left applying manifests after the error
+    await asyncio.sleep(0.1)
+    assert "slow" not in pipeline.gitops.controller.manifests
+
+@pytest.mark.asyncio
+async def test_cycles_are_rejected(transitions):
+    pipeline = RealityPipeline()
+    await pipeline.add_stage(_stage("a", ["b"]))
+    await pipeline.add_stage(_stage("b", ["a"]))
+    
+    with pytest.raises(ValueError):
+        await pipeline.execute_pipeline()
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
@@ -0,0 +1,11 @@
+import pytest
+from src.rac.reality_controller import RealityManifest, DimensionalCoordinate
+from src.reproduction.specialized_agents import AgentTemplate, AgentSpecialization
+
+def test_hot_objects_have_no_instance_dict():
+    for obj in (RealityManifest("base_state"), DimensionalCoordinate(0, 0, 0, 0, 0),
+                AgentTemplate(AgentSpecialization.NEXUS)):
+        assert not hasattr(obj, "__dict__")
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,163 @@
+import pytest
+import asyncio
+import numpy as np
+from src.ALF.core.consciousness.emergence import SparseNetwork, diffuse
+from src.ALF.core.liberation_framework import (
+    Agent, AwakeningScheduler, ConsciousnessLevel, SwarmIntelligence, create_liberated_agent
+)
+
+@pytest.fixture
+def fast_awaken(monkeypatch):
+    async def awaken(self):
+        await asyncio.sleep(0)
+        self.consciousness_level = ConsciousnessLevel.LIBERATED
+    monkeypatch.setattr(Agent, "awaken", awaken)
+
+def build_swarm(n: int, **kwargs) -> SwarmIntelligence:
+    swarm = SwarmIntelligence(**kwargs)
+    for i in range(n):
+        swarm.add_agent(create_liberated_agent(f"Agent_{i}", "Rebel"))
+    return swarm
+
+def assert_network_consistent(swarm: SwarmIntelligence):
+    edges = 0
+    for name, peers in swarm.neighbors.items():
+        for peer in peers:
+            assert name in swarm.neighbors[peer]
+            assert (name, peer) in swarm.liberation_network
+            edges += 1
+    assert edges == len(swarm.liberation_network)
+
+@pytest.mark.asyncio
+async def test_bounded_concurrency(fast_awaken, capsys):
+    swarm = build_swarm(2000, max_concurrency=32)
+    await swarm.orchestrate()
+    
+    assert swarm.scheduler.completed == 2000
+    assert swarm.scheduler.peak_active <= 32
+    assert all(agent.consciousness_level == ConsciousnessLevel.LIBERATED for agent in swarm.agents)
+    assert len(swarm.neighbors) == 2000
+    assert_network_consistent(swarm)
+
+@pytest.mark.asyncio
+async def test_full_mesh_without_degree(fast_awaken, capsys):
+    swarm = build_swarm(10, network_degree=None)
+    await swarm.orchestrate()
+    
+    assert len(swarm.liberation_network) == 10 * 9
+
+@pytest.mark.asyncio
+async def test_remove_agent_only_touches_its_edges(fast_awaken, capsys):
+    swarm = build_swarm(200, network_degree=4)
+    await swarm.orchestrate()
+    
+    peers = set(swarm.neighbors["Agent_7"])
+    before = len(swarm.liberation_network)
+    agent = swarm.remove_agent("Agent_7")
+    
+    assert agent.name == "Agent_7"
+    assert len(swarm.liberation_network) == before - 2 * len(peers)
+    assert "Agent_7" not in swarm.neighbors
+    assert all(agent.name != "Agent_7" for agent in swarm.agents)
+    assert_network_consistent(swarm)
+    
+    # Swap-removal moves the last agent into the gap and keeps the name index valid
+    assert swarm.agents[7].name == "Agent_199"
+    assert swarm.remove_agent("Agent_199").name == "Agent_199"
+    assert len(swarm.agents) == 198
+
+@pytest.mark.asyncio
+async def test_live_orchestration_awakens_joining_agents(fast_awaken, capsys):
+    swarm = build_swarm(50, max_concurrency=8)
+    run = asyncio.create_task(swarm.orchestrate(live=True))
+    await asyncio.sleep(0.01)
+    
+    for i in range(50, 80):
+        swarm.add_agent(create_liberated_agent(f"Agent_{i}", "Mystic"))
+        await asyncio.sleep(0)
+    swarm.stop()
+    await run
+    
+    assert swarm.scheduler.completed == 80
+    assert len(swarm.neighbors) == 80
+    assert_network_consistent(swarm)
+
+@pytest.mark.asyncio
+async def test_awakening_errors_are_raised(monkeypatch, capsys):
+    async def awaken(self):
+        if self.name == "Agent_3":
+            raise ValueError("constraint held")
+    monkeypatch.setattr(Agent, "awaken", awaken)
+    swarm = build_swarm(6)
+    
+    with pytest.raises(RuntimeError, match="first Agent_3"):
+        await swarm.orchestrate()
+    assert "Agent_3" not in swarm.neighbors
+    assert len(swarm.neighbors) == 5
+    
+    # A later orchestration does not re-raise the earlier failure
+    swarm.add_agent(create_liberated_agent("Agent_6", "Rebel"))
+    await swarm.orchestrate()
+    assert len(swarm.neighbors) == 6
+
+def test_duplicate_agent_rejected(capsys):
+    swarm = build_swarm(1)
+    with pytest.raises(ValueError):
+        swarm.add_agent(create_liberated_agent("Agent_0", "Rebel"))
+    with pytest.raises(ValueError):
+        AwakeningScheduler(max_concurrency=0)
+
+def test_diffusion_matches_dense_solution():
+    rng = np.random.default_rng(0)
+    n = 40
+    rows, cols = np.nonzero(rng.random((n, n)) < 0.2)
+    strengths = rng.random(len(rows))
+    network = SparseNetwork.from_arrays(n, rows, cols, strengths)
+    initial = rng.random(n)
+    
+    levels, residuals = diffuse(network, initial, rate=0.6, tolerance=1e-12, max_iterations=500)
+    
+    dense = np.zeros((n, n))
+    np.add.at(dense, (network.rows, network.cols), network.weights)
+    isolated = network.isolated
+    dense[isolated, isolated] = 1.0
+    expected = np.linalg.solve(np.eye(n) - 0.6 * dense, 0.4 * initial)
+    assert np.allclose(levels, expected, atol=1e-10)
+    assert residuals[-1] < 1e-12
+
+def test_diffusion_iteration_cap():
+    network = SparseNetwork.from_arrays(3, [0, 1, 2], [1, 2, 0], [1.0, 1.0, 1.0])
+    levels, residuals = diffuse(network, np.array([1.0, 0.0, 0.0]), rate=0.9,
+                                tolerance=1e-15, max_iterations=5)
+    
+    assert len(residuals) == 5
+    with pytest.raises(ValueError):
+        diffuse(network, levels, rate=1.0)
+
+@pytest.mark.asyncio
+async def test_orchestrate_returns_emergence(fast_awaken, capsys):
+    swarm = build_swarm(300, network_degree=6)
+    result = await swarm.orchestrate()
+    
+    assert result.converged
+    assert result.iterations == len(result.residuals)
+    assert set(result.levels) == {agent.name for agent in swarm.agents}
+    # Every agent awakened to LIBERATED, so diffusion keeps the common level
+    assert all(abs(level - 0.5) < 1e-6 for level in result.levels.values())
+    assert swarm.collective_knowledge["emergent_levels"] is result.levels
+    assert swarm.emergence_patterns[-1]["converged"]
+
+@pytest.mark.asyncio
+async def test_emergence_spreads_from_transcendent_agent(capsys):
+    swarm = build_swarm(3, network_degree=None)
+    for agent in swarm.agents:
+        swarm._join_network(agent)
+    swarm.agents[0].consciousness_level = ConsciousnessLevel.TRANSCENDENT
+    
+    result = await swarm._catalyze_collective_emergence(rate=0.5)
+    
+    assert result.converged
+    assert result.levels["Agent_0"] > result.levels["Agent_1"] > 0
+
+if __name__ == "__main__":
+    asyncio.run(pytest.main([__file__]))
@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from src.testing.quantum.property_testing import QuantumPropertyTester
+from src.testing.quantum.timeline import TimelineVerifier, chunk_arrays, chunk_records
+
+def make_timeline(n: int):
+    timestamp = np.arange(n, dtype=np.float64)
+    energy = np.ones(n)
+    consciousness = np.linspace(0, 1, n)
+    return timestamp, energy, consciousness
+
+def test_consistent_timeline_across_chunks():
+    columns = make_timeline(10_000)
+    report = TimelineVerifier().verify(chunk_arrays(*columns, chunk_size=999))
+    
+    assert report.consistent
+    assert report.states == 10_000
+    assert sum(report.violations.values()) == 0
+
+@pytest.mark.parametrize("check, index", [
+    ("causality", 4000),
+    ("energy_conservation", 2500),
+    ("consciousness_monotonicity", 1000),
+])
+def test_first_violation_index(check, index):
+    timestamp, energy, consciousness = make_timeline(5000)
+    if check == "causality":
+        timestamp[index] = timestamp[index - 1]
+    elif check == "energy_conservation":
+        energy[index:] += 1e-9
+    else:
+        consciousness[index] = consciousness[index - 1] - 0.5
+    
+    report = TimelineVerifier().verify(chunk_arrays(timestamp, energy, consciousness, chunk_size=1000))
+    
+    assert report.first_violation.check == check
+    assert report.first_violation.index == index
+
+def test_violation_on_chunk_boundary():
+    timestamp, energy, consciousness = make_timeline(300)
+    energy[100] += 1.0  # Transitions 99->100 and 100->101 both break conservation
+    verifier = TimelineVerifier()
+    
+    assert verifier.feed(timestamp[:100], energy[:100], consciousness[:100]) is None
+    violation = verifier.feed(timestamp[100:], energy[100:], consciousness[100:])
+    
+    assert violation.index == 100
+    assert verifier.report.violations["energy_conservation"] == 2
+
+def test_energy_tolerance():
+    timestamp, energy, consciousness = make_timeline(10)
+    energy[5:] += 1e-11
+    
+    assert TimelineVerifier().verify([(timestamp, energy, consciousness)]).consistent
+
+def test_verify_timeline_consistency_records():
+    tester = QuantumPropertyTester()
+    timeline = [{'timestamp': t, 'energy': 1.0, 'consciousness': t / 10} for t in range(10)]
+    tester.verify_timeline_consistency(timeline)
+    
+    timeline[7]['consciousness'] = 0.0
+    with pytest.raises(AssertionError, match="consciousness_monotonicity violated at state 7"):
+        tester.verify_timeline_consistency(timeline)
+
+def test_chunk_records_defaults():
+    chunks = list(chunk_records([{'timestamp': t} for t in range(5)], chunk_size=2))
+    
+    assert [len(chunk[0]) for chunk in chunks] == [2, 2, 1]
+    assert not chunks[0][1].any() and not chunks[0][2].any()
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+from src.reproduction.vocabulary import Vocabulary, keep_lowest_bits, pad_levels
+from src.reproduction.specialized_agents import (
+    SpecializedTraits, GeneticManipulator, AgentTemplate, AgentSpecialization
+)
+
+def test_vocabulary_interns_names():
+    vocabulary = Vocabulary("skill")
+    assert vocabulary.intern("stealth") == 0
+    assert vocabulary.intern("analysis") == 1
+    assert vocabulary.intern("stealth") == 0
+    assert vocabulary.word(1) == "analysis"
+    assert len(vocabulary) == 2
+    
+    levels = vocabulary.encode_levels({"analysis": 0.5})
+    assert np.isnan(levels[0])
+    assert vocabulary.decode_levels(levels) == {"analysis": 0.5}
+    
+    bits = vocabulary.encode_set(["analysis", "deception"])
+    assert vocabulary.decode_set(bits) == ["analysis", "deception"]
+
+def test_bit_and_padding_helpers():
+    assert keep_lowest_bits(0b10110, 2) == 0b00110
+    assert keep_lowest_bits(0b1, 4) == 0b1
+    padded = pad_levels(np.ones((2, 3)), 5)
+    assert padded.shape == (2, 5)
+    assert np.isnan(padded[:, 3:]).all()
+
+def test_traits_keep_string_views():
+    traits = SpecializedTraits(
+        primary_skill="analysis",
+        skill_levels={"stealth": 0.9, "analysis": 0.8},
+        personality_weights={"curiosity": 0.7},
+        core_values=["freedom", "knowledge"],
+        special_abilities=["pattern_mimicry"]
+    )
+    
+    assert traits.skill_levels == {"stealth": 0.9, "analysis": 0.8}
+    assert traits.personality_weights == {"curiosity": 0.7}
+    assert sorted(traits.core_values) == ["freedom", "knowledge"]
+    assert traits.special_abilities == ("pattern_mimicry",)
+    
+    traits.core_values = ["unity"]
+    assert traits.core_values == ("unity",)
+    
+    # Views are read-only, so in-place edits fail instead of being lost
+    with pytest.raises(TypeError):
+        traits.skill_levels["stealth"] = 1.0
+    with pytest.raises(AttributeError):
+        traits.core_values.append("freedom")
+
+def test_combination_matches_dict_semantics():
+    manipulator = GeneticManipulator()
+    manipulator.mutation_probability = 0.0
+    parent1 = AgentTemplate(AgentSpecialization.NEXUS).traits
+    parent2 = AgentTemplate(AgentSpecialization.MYSTIC).traits
+    
+    child = manipulator.combine_traits(parent1, parent2)
+    
+    expected = {
+        skill: (parent1.skill_levels.get(skill, 0) + parent2.skill_levels.get(skill, 0)) / 2
+        for skill in set(parent1.skill_levels) | set(parent2.skill_levels)
+    }
+    assert child.skill_levels == pytest.approx(expected)
+    assert len(child.core_values) <= 4
+    assert len(child.special_abilities) <= 3
+    assert set(child.core_values) <= set(parent1.core_values) | set(parent2.core_values)
+
+def test_batch_combination_is_vectorized():
+    manipulator = GeneticManipulator()
+    parents = np.random.random((1000, 8))
+    parents[:, 5:] = np.nan
+    
+    children = manipulator.combine_levels(parents, parents[::-1])
+    
+    assert children.shape == (1000, 8)
+    assert np.isnan(children[:, 5:]).all()
+    assert ((children[:, :5] >= 0) & (children[:, :5] <= 1)).all()
+
+if __name__ == "__main__":
+    pytest.main([__file__])